@@ -0,0 +1,101 @@
+"""
+httpx transport backed by aiohttp.
+
+The OpenAI SDK talks to the API through an httpx.AsyncClient. Under many
+concurrent requests httpx's default connection pool degrades, so the async
+client used by extraction routes its traffic through aiohttp instead while
+keeping the SDK's request building and response parsing unchanged. The
+clients are built with max_retries=0; retries come from extraction's own
+backoff helpers.
+"""
+
+import asyncio
+from typing import AsyncIterator, Optional
+
+import aiohttp
+import httpx
+
+
+class _AioHttpStream(httpx.AsyncByteStream):
+    """Expose an aiohttp response body as an httpx byte stream."""
+
+    def __init__(self, response: aiohttp.ClientResponse):
+        self._response = response
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        try:
+            async for chunk in self._response.content.iter_any():
+                yield chunk
+        except asyncio.TimeoutError as e:
+            raise httpx.ReadTimeout(str(e)) from e
+        except aiohttp.ClientError as e:
+            raise httpx.ReadError(str(e)) from e
+
+    async def aclose(self) -> None:
+        self._response.release()
+
+
+class AioHttpTransport(httpx.AsyncBaseTransport):
+    """
+    Forward httpx requests through a shared aiohttp.ClientSession.
+
+    The session is created lazily on first use so it is bound to the event loop
+    that actually sends the requests. Response bodies are streamed back, so
+    stream=True completions keep working.
+    """
+
+    def __init__(self, limit: int = 100, limit_per_host: int = 0, keepalive_timeout: float = 15.0):
+        self._limit = limit
+        self._limit_per_host = limit_per_host
+        self._keepalive_timeout = keepalive_timeout
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        # Each asyncio.run() starts a new loop and aiohttp sessions cannot be
+        # shared across loops, so rebuild the session when the loop changes
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._loop is not loop:
+            self._loop = loop
+            connector = aiohttp.TCPConnector(
+                limit=self._limit,
+                limit_per_host=self._limit_per_host,
+                keepalive_timeout=self._keepalive_timeout,
+            )
+            # httpx decodes gzip/brotli itself, so hand it the raw body
+            self._session = aiohttp.ClientSession(connector=connector, auto_decompress=False)
+        return self._session
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        timeout = request.extensions.get("timeout", {})
+        client_timeout = aiohttp.ClientTimeout(
+            total=None,
+            sock_connect=timeout.get("connect"),
+            sock_read=timeout.get("read"),
+        )
+        try:
+            response = await self._get_session().request(
+                request.method,
+                str(request.url),
+                headers=list(request.headers.multi_items()),
+                data=await request.aread(),
+                timeout=client_timeout,
+                allow_redirects=False,
+            )
+        except asyncio.TimeoutError as e:
+            raise httpx.ConnectTimeout(str(e), request=request) from e
+        except aiohttp.ClientError as e:
+            raise httpx.ConnectError(str(e), request=request) from e
+
+        return httpx.Response(
+            status_code=response.status,
+            headers=list(response.raw_headers),
+            stream=_AioHttpStream(response),
+            request=request,
+        )
+
+    async def aclose(self) -> None:
+        if self._session is not None and not self._session.closed and self._loop is asyncio.get_running_loop():
+            await self._session.close()
+        self._session = None
+        self._loop = None
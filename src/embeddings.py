@@ -1,19 +1,30 @@
-import os, json
+import os
+import orjson
 import re
 from pathlib import Path
 from dotenv import load_dotenv
-from openai import OpenAI, APIError, RateLimitError
+from openai import APIError, RateLimitError
 import numpy as np
 import faiss
 from tqdm import tqdm
 import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
 import random
 import tiktoken
-from typing import List
+from typing import Dict, List, Tuple
+from functools import lru_cache
+import tempfile
+import mmap
+import shutil
+
+import llm_cache
+from log import get_logger
+from openai_client import client
 
 
 load_dotenv(override=True)
-client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+logger = get_logger("findr.embeddings")
 
 def retrieve_relevant_text(search_queries: List[str], top_k: int, md_file: str) -> str:
     """
@@ -29,9 +40,8 @@ def retrieve_relevant_text(search_queries: List[str], top_k: int, md_file: str)
         Combined text from all relevant sections
     """
     all_results = []
-    for query in search_queries:
-        # returns list of dict, where each item is section identifier  
-        results = search_sections(query, top_k=top_k, md_file=md_file)
+    # returns one list of section dicts per query
+    for results in search_sections_batch(search_queries, top_k=top_k, md_file=md_file):
         all_results.extend(results)
     
     # Sort by relevance (distance score) first
@@ -50,28 +60,109 @@ def retrieve_relevant_text(search_queries: List[str], top_k: int, md_file: str)
             seen_sections.add(composite_key)
             unique_results.append(result)
   
-    print(f"Final unique results: {len(unique_results)} sections")
-    
-    # Get the actual text for selected sections
-    with open(f"data/parsed_md_val_mistral/{md_file}.md", "r", encoding="utf-8") as f:
-        markdown_text = f.read()
+    logger.debug(f"Final unique results: {len(unique_results)} sections")
     
-    lines = markdown_text.split('\n')
-    context = ""
+    # Get the actual text for selected sections, decoding only those line ranges
+    md_lines = markdown_lines(f"data/parsed_md_val_mistral/{md_file}.md")
+    parts = []
 
-    for h in unique_results:
-        s, e = h["lines"]
-        section_text = '\n'.join(lines[s - 1:e + 1])
+    for h, section_text in zip(unique_results, md_lines.iter_texts(h["lines"] for h in unique_results)):
         # Include section number for clarity when there are duplicate titles
         section_identifier = f"{h.get('title')}"
-        context += f"\n--- {section_identifier} ---\n{section_text}\n\n"
+        parts.append(f"\n--- {section_identifier} ---\n{section_text}\n\n")
     
-    return context.strip()
+    return "".join(parts).strip()
 
 def get_text_from_lines(markdown_text: str, start_line: int, end_line: int) -> str:
     lines = markdown_text.splitlines()
     return "\n".join(lines[start_line-1:end_line + 1])
 
+class MarkdownLines:
+    """
+    Byte offsets of every line of a markdown file, numbered as the segmenter
+    numbers them (split on "\n"). Line ranges are then read through a read-only
+    mmap and only those bytes decoded, instead of loading and splitting the
+    whole document for every lookup.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            if size:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    buf = np.frombuffer(mm, dtype=np.uint8)
+                    newlines = np.flatnonzero(buf == 0x0A)
+                    del buf  # release the export so the map can close
+            else:
+                newlines = np.empty(0, dtype=np.int64)
+        self._starts = np.concatenate(([0], newlines + 1))
+        self._ends = np.concatenate((newlines, [size]))
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+    def iter_texts(self, ranges):
+        """
+        Yield the text of each (start_line, end_line) range, equal to
+        "\n".join(lines[start_line - 1:end_line + 1]). The file stays mapped only
+        while the generator is being consumed.
+        """
+        if self._ends[-1] == 0:
+            for _ in ranges:
+                yield ""
+            return
+        n = len(self)
+        with open(self.path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            for start_line, end_line in ranges:
+                a, b = max(start_line - 1, 0), min(end_line + 1, n)
+                yield mm[self._starts[a]:self._ends[b - 1]].decode("utf-8") if a < b else ""
+
+    def text(self, start_line: int, end_line: int) -> str:
+        return next(self.iter_texts([(start_line, end_line)]))
+
+@lru_cache(maxsize=16)
+def _markdown_lines(path: str, mtime_ns: int, size: int) -> MarkdownLines:
+    return MarkdownLines(path)
+
+def markdown_lines(path: str) -> MarkdownLines:
+    """Line index for `path`, built once per process and rebuilt if the file changes."""
+    st = os.stat(path)
+    return _markdown_lines(path, st.st_mtime_ns, st.st_size)
+
+# Bump when the section merging/chunking below changes so stale indexes are rebuilt
+CHUNKER_VERSION = 2
+
+def _read_json(path: str):
+    try:
+        with open(path, "rb") as f:
+            return orjson.loads(f.read())
+    except (FileNotFoundError, orjson.JSONDecodeError):
+        return None
+
+def _replace_atomic(path: str, write):
+    fd, tmp = tempfile.mkstemp(dir=Path(path).parent, suffix=".tmp")
+    os.close(fd)
+    try:
+        write(tmp)
+        os.replace(tmp, path)
+    except Exception:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+
+# Built indexes keyed by their build meta (see build_section_embeddings)
+_INDEX_STORE = llm_cache.CACHE_DIR / "faiss"
+
+def _link_or_copy(src, dst):
+    # A hard link costs no space; index files are only ever replaced, never
+    # written in place, so the two names can safely share one inode
+    os.remove(dst)
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copyfile(src, dst)
+
 def build_section_embeddings(jsonl_file: str, markdown_file: str, output_prefix: str = None):
     """
     Build embeddings for each section of a Markdown document based on JSONL metadata.
@@ -88,21 +179,42 @@ def build_section_embeddings(jsonl_file: str, markdown_file: str, output_prefix:
     else:
         output_prefix = embeddings_dir / Path(output_prefix).name
 
-    # Check if embeddings already exist
+    # Reuse existing embeddings only if they were built from these exact inputs
     faiss_file = f"{output_prefix}.faiss"
     npz_file = f"{output_prefix}.npz"
-    
-    if Path(faiss_file).exists() and Path(npz_file).exists():
-        print(f"      ✅ Embeddings already exist at {output_prefix}.faiss/.npz")
+    meta_file = f"{output_prefix}.meta.json"
+    build_meta = {
+        "markdown_sha256": llm_cache.file_digest(markdown_file),
+        "sections_sha256": llm_cache.file_digest(jsonl_file),
+        "model": EMBED_MODEL,
+        "chunker_version": CHUNKER_VERSION,
+        "metric": "inner_product",
+        "storage": "fp16",
+    }
+
+    if Path(faiss_file).exists() and Path(npz_file).exists() and _read_json(meta_file) == build_meta:
+        logger.info(f"      ✅ Embeddings already exist at {output_prefix}.faiss/.npz")
         return
 
-    with open(markdown_file, "r", encoding="utf-8") as f:
-        markdown_text = f.read()
+    # Content-addressed copy of every build, so a renamed, re-parsed-but-identical
+    # or reverted document gets its index back without re-embedding
+    store_key = llm_cache.make_key(build_meta)
+    store_faiss = _INDEX_STORE / f"{store_key}.faiss"
+    store_npz = _INDEX_STORE / f"{store_key}.npz"
+    if store_faiss.exists() and store_npz.exists():
+        _replace_atomic(faiss_file, lambda tmp: _link_or_copy(store_faiss, tmp))
+        _replace_atomic(npz_file, lambda tmp: _link_or_copy(store_npz, tmp))
+        _replace_atomic(meta_file, lambda tmp: Path(tmp).write_bytes(orjson.dumps(build_meta)))
+        logger.info(f"      ✅ Restored embeddings for identical inputs to {output_prefix}.faiss/.npz")
+        get_doc_index.cache_clear()
+        return
+
+    md_lines = markdown_lines(markdown_file)
 
     sections = []
     with open(jsonl_file, "r", encoding="utf-8") as f:
         for line in f:
-            sections.append(json.loads(line.strip()))
+            sections.append(orjson.loads(line))
 
     texts = []
     metadata = []
@@ -113,7 +225,7 @@ def build_section_embeddings(jsonl_file: str, markdown_file: str, output_prefix:
     while i < len(sections):
         sec = sections[i]
         start, end = sec["lines"]
-        section_text = get_text_from_lines(markdown_text, start, end).strip()
+        section_text = md_lines.text(start, end).strip()
 
         if end - start == 0:
             merged_text = section_text
@@ -124,14 +236,14 @@ def build_section_embeddings(jsonl_file: str, markdown_file: str, output_prefix:
             for j in range(1, merge_next + 1):
                 if i + j < len(sections):
                     next_start, next_end = sections[i + j]["lines"]
-                    next_text = get_text_from_lines(markdown_text, next_start, next_end)
+                    next_text = md_lines.text(next_start, next_end)
                     merged_text += "\n\n" + next_text
                     merged_end = next_end 
                     merged_count += 1
 
             section_text = merged_text
-            print(f" Merged one-line section '{sec['title']}' with next {merged_count} sections "
-                f"({merged_start}-{merged_end}).")
+            logger.debug(f" Merged one-line section '{sec['title']}' with next {merged_count} sections "
+                         f"({merged_start}-{merged_end}).")
 
             # Skip over the merged sections
             i += merged_count + 1
@@ -152,23 +264,12 @@ def build_section_embeddings(jsonl_file: str, markdown_file: str, output_prefix:
             "char_count": len(section_text)
         })
 
-    print(f"Building embeddings for {len(texts)} sections...")
+    logger.info(f"Building embeddings for {len(texts)} sections...")
 
     enc = tiktoken.encoding_for_model("text-embedding-3-large")
     MAX_TOKENS = 8000       
     CHUNK_OVERLAP = 128     
 
-    def _embed_chunk(text: str) -> np.ndarray:
-        for attempt in range(5):
-            try:
-                resp = client.embeddings.create(model="text-embedding-3-large", input=text)
-                return np.array(resp.data[0].embedding, dtype=np.float32)
-            except (RateLimitError, APIError) as e:
-                wait = 2 ** attempt + random.random()
-                print(f"[warn] Retry {attempt+1}: waiting {wait:.1f}s ({e})")
-                time.sleep(wait)
-        raise RuntimeError("Failed to embed after retries.")
-
     def _chunk_by_tokens(text: str, max_tokens: int = MAX_TOKENS, overlap: int = CHUNK_OVERLAP) -> list[str]:
         toks = enc.encode(text)
         if len(toks) <= max_tokens:
@@ -187,76 +288,254 @@ def build_section_embeddings(jsonl_file: str, markdown_file: str, output_prefix:
 
     oversized = sum(1 for m in metadata if m["char_count"] > 20000)
     if oversized:
-        print(f"[info] Detected {oversized} very large sections (>20k chars). Chunking will apply.")
+        logger.info(f"Detected {oversized} very large sections (>20k chars). Chunking will apply.")
+
+    # Flatten every section's chunks so they can share embeddings requests
+    chunks, owners = [], []
+    for s, text in enumerate(texts):
+        parts = _chunk_by_tokens(text)
+        if len(parts) > 1:
+            logger.warning(f"Chunked long section into {len(parts)} parts (avg pooled).")
+        chunks.extend(parts)
+        owners.extend([s] * len(parts))
+
+    # Pack chunks into requests bounded by both input count and total tokens. Each
+    # request is sent as soon as it is full, so tokenizing the rest overlaps the network
+    futures, batch, batch_tokens = [], [], 0
+    with ThreadPoolExecutor(max_workers=EMBED_CONCURRENCY) as ex:
+        for chunk in chunks:
+            n_tok = len(enc.encode(chunk))
+            if batch and (len(batch) == EMBED_BATCH or batch_tokens + n_tok > EMBED_BATCH_TOKENS):
+                futures.append(ex.submit(_embed_batch, batch))
+                batch, batch_tokens = [], 0
+            batch.append(chunk)
+            batch_tokens += n_tok
+        if batch:
+            futures.append(ex.submit(_embed_batch, batch))
+
+        chunk_vecs = np.vstack([f.result() for f in tqdm(futures)])
+    # Average-pool the chunks of each section back into one vector
+    owners = np.asarray(owners)
+    embeddings = np.zeros((len(texts), chunk_vecs.shape[1]), dtype=np.float32)
+    np.add.at(embeddings, owners, chunk_vecs)
+    embeddings /= np.bincount(owners, minlength=len(texts))[:, None]
+
+    # Unit vectors, normalized once here: inner product is then cosine similarity
+    embeddings = np.ascontiguousarray(embeddings)
+    faiss.normalize_L2(embeddings)
+    n, d = embeddings.shape
+    # Vectors are stored as fp16: half the bytes on disk and scanned per IVF search,
+    # at no measurable cost to recall for unit-norm embeddings
+    if n > IVF_MIN_SECTIONS:
+        # Inverted lists only pay off on very long filings; small ones stay exhaustive
+        nlist = int(np.sqrt(n))
+        quantizer = faiss.IndexFlatIP(d)
+        index = faiss.IndexIVFScalarQuantizer(quantizer, d, nlist, faiss.ScalarQuantizer.QT_fp16, faiss.METRIC_INNER_PRODUCT)
+    else:
+        index = faiss.IndexScalarQuantizer(d, faiss.ScalarQuantizer.QT_fp16, faiss.METRIC_INNER_PRODUCT)
+    index.train(embeddings)
+    index.add(embeddings)
 
-    embeddings = []
-    for text in tqdm(texts):
-        chunks = _chunk_by_tokens(text)
-        if len(chunks) == 1:
-            emb = _embed_chunk(chunks[0])
-        else:
-            sub = [_embed_chunk(c) for c in chunks]
-            emb = np.mean(np.vstack(sub), axis=0).astype(np.float32)
-            print(f"[warn] Chunked long section into {len(chunks)} parts (avg pooled).")
-        embeddings.append(emb)
+    # Write each file next to its target and swap it in, so an interrupted run never
+    # leaves a half-written index behind; the meta file goes last and marks completion
+    _replace_atomic(faiss_file, lambda tmp: faiss.write_index(index, tmp))
+    def _write_npz(tmp):
+        with open(tmp, "wb") as f:
+            np.savez(f, metadata=metadata)
+
+    _replace_atomic(npz_file, _write_npz)
+    _replace_atomic(meta_file, lambda tmp: Path(tmp).write_bytes(orjson.dumps(build_meta)))
+    logger.info(f"✅ Saved FAISS index and metadata to {output_prefix}.faiss / .npz")
+    _INDEX_STORE.mkdir(parents=True, exist_ok=True)
+    _replace_atomic(str(store_faiss), lambda tmp: _link_or_copy(faiss_file, tmp))
+    _replace_atomic(str(store_npz), lambda tmp: _link_or_copy(npz_file, tmp))
+    # A previously loaded index for this document is now stale
+    get_doc_index.cache_clear()
+    
+    
+# ===== Retrieval =====
+
+EMBED_MODEL = "text-embedding-3-large"
+# Documents with more sections than this get an IVF index searched over IVF_NPROBE lists
+IVF_MIN_SECTIONS = 1000
+IVF_NPROBE = 8
+# Inputs per embeddings request (API limit is 2048) and total tokens per request
+EMBED_BATCH = min(int(os.getenv("EMBED_BATCH", "512")), 2048)
+EMBED_BATCH_TOKENS = 250_000
+# Embeddings requests in flight at once while a document is being indexed
+EMBED_CONCURRENCY = max(1, int(os.getenv("EMBED_CONCURRENCY", "4")))
+
+# query text -> normalized embedding; the same queries are reused for every
+# document, year and run, so each one is embedded once and kept on disk
+_QUERY_CACHE_FILE = llm_cache.CACHE_DIR / "query_vectors" / f"{EMBED_MODEL}.npz"
+_query_lock = threading.Lock()
+
+def _load_query_vectors() -> Dict[str, np.ndarray]:
+    try:
+        with np.load(_QUERY_CACHE_FILE, allow_pickle=False) as data:
+            return dict(zip(data["queries"].tolist(), data["vectors"]))
+    except (FileNotFoundError, ValueError, KeyError, OSError):
+        return {}
+
+def _save_query_vectors():
+    with _query_lock:
+        items = list(_query_vectors.items())
+        _QUERY_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+
+        def _write(tmp):
+            with open(tmp, "wb") as f:
+                np.savez(f, queries=np.array([q for q, _ in items]),
+                         vectors=np.vstack([v for _, v in items]))
+
+        _replace_atomic(str(_QUERY_CACHE_FILE), _write)
+
+_query_vectors: Dict[str, np.ndarray] = _load_query_vectors()
+
+def _embed_batch(texts: List[str]) -> np.ndarray:
+    """Embed a list of texts in one API call, returning a (len(texts), D) float32 matrix."""
+    for attempt in range(5):
+        try:
+            resp = client.embeddings.create(model=EMBED_MODEL, input=texts, timeout=60.0)
+            break
+        except (RateLimitError, APIError) as e:
+            wait = 2 ** attempt + random.random()
+            logger.warning(f"Retry {attempt+1}: waiting {wait:.1f}s ({e})")
+            time.sleep(wait)
+    else:
+        raise RuntimeError("Failed to embed after retries.")
+    # Responses carry an index per input; keep the input order regardless
+    data = sorted(resp.data, key=lambda d: d.index)
+    return np.array([d.embedding for d in data], dtype=np.float32)
 
+def embed_queries(queries: List[str]) -> np.ndarray:
+    """
+    Return a (len(queries), D) float32 matrix of normalized query embeddings.
+    Queries not seen before are embedded with batched API calls
+    (one call unless there are more than EMBED_BATCH of them).
+    """
+    missing = list(dict.fromkeys(q for q in queries if q not in _query_vectors))
+    for b in range(0, len(missing), EMBED_BATCH):
+        batch = missing[b:b + EMBED_BATCH]
+        vecs = _embed_batch(batch)
+        vecs /= np.linalg.norm(vecs, axis=1, keepdims=True)
+        _query_vectors.update(zip(batch, vecs))
+    if missing:
+        _save_query_vectors()
+    if not queries:
+        return np.empty((0, 0), dtype=np.float32)
+    return np.vstack([_query_vectors[q] for q in queries])
+
+@lru_cache(maxsize=256)
+def query_matrix(queries: Tuple[str, ...]) -> np.ndarray:
+    """
+    Stacked embeddings for a fixed query list, built once per process.
+    Section query lists are module constants, so every year and report
+    searching with the same list reuses one (Q, D) matrix. Read-only.
+    """
+    q_vecs = embed_queries(list(queries))
+    q_vecs.flags.writeable = False
+    return q_vecs
 
-    def normalize(vectors):
-        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
-        return vectors / norms
+class DocIndex:
+    """
+    Section vectors and metadata for one parsed document, loaded once per process.
+    For flat indexes the vectors are pulled out of FAISS into a single contiguous
+    (N, D) float32 matrix so a batch of queries is scored with one matrix product;
+    IVF indexes (large documents) are searched through FAISS with IVF_NPROBE lists.
+    """
 
-    embeddings = np.array(embeddings).astype("float32")
-    embeddings = normalize(embeddings)
-    index = faiss.IndexFlatL2(embeddings.shape[1])
-    index.add(embeddings)
+    def __init__(self, md_file: str):
+        self.md_file = md_file
+        index = faiss.read_index(f"data/embeddings/{md_file}.faiss")
+        self.size = index.ntotal
+        if isinstance(index, faiss.IndexIVF):
+            index.nprobe = IVF_NPROBE
+            index.make_direct_map()   # lets vectors() reconstruct by section index
+            self.ivf, self.vecs = index, None
+        else:
+            # stored unit-normalized as fp16; decoded once to fp32 so scoring stays one sgemm
+            vecs = index.reconstruct_n(0, index.ntotal)
+            self.ivf, self.vecs = None, np.ascontiguousarray(vecs, dtype=np.float32)
+        self.meta = list(np.load(f"data/embeddings/{md_file}.npz", allow_pickle=True)["metadata"])
+
+    def search(self, q_vecs: np.ndarray, top_k: int) -> List[List[dict]]:
+        """Search all query vectors in one call; returns one result list per query."""
+        n = self.size
+        k = min(top_k, n)
+        if k <= 0:
+            return [[] for _ in range(len(q_vecs))]
+
+        # float32 on both sides keeps this a single sgemm with no upcast copy
+        q_vecs = np.asarray(q_vecs, dtype=np.float32)
+        if self.ivf is not None:
+            scores, indices = self.ivf.search(q_vecs, k)   # inner products, best first
+            return self._results(2.0 - 2.0 * scores, indices)
+
+        scores = q_vecs @ self.vecs.T                      # (Q, N) cosine similarities
+        if k < n:
+            # partition in place of a full sort; the k best end up in the last k columns
+            top = np.argpartition(scores, n - k, axis=1)[:, n - k:]
+        else:
+            top = np.broadcast_to(np.arange(n), scores.shape)
+        top_scores = np.take_along_axis(scores, top, axis=1)
+        order = np.argsort(-top_scores, axis=1)
+        indices = np.take_along_axis(top, order, axis=1)
+        # Reported as squared L2 between unit vectors, ||q - v||^2 = 2 - 2cos, so lower stays better
+        distances = 2.0 - 2.0 * np.take_along_axis(top_scores, order, axis=1)
+        return self._results(distances, indices)
+
+    def vectors(self, ids: List[int]) -> np.ndarray:
+        """Unit vectors for the given section indices, shape (len(ids), D)."""
+        if self.vecs is not None:
+            return self.vecs[np.asarray(ids, dtype=np.int64)]
+        return np.vstack([self.ivf.reconstruct(int(i)) for i in ids])
+
+    def _results(self, distances: np.ndarray, indices: np.ndarray) -> List[List[dict]]:
+        batch = []
+        for q_dist, q_idx in zip(distances, indices):
+            results = []
+            for rank, idx in enumerate(q_idx):
+                if idx < 0:
+                    # IVF search found fewer than k neighbours in the probed lists
+                    break
+                m = self.meta[idx]
+                results.append({
+                    "index": int(idx),
+                    "rank": rank + 1,
+                    "title": m["title"],
+                    "section_number": m["section_num"],
+                    "section_id": m["section_id"],
+                    "lines": m["lines"],
+                    "char_count": m["char_count"],
+                    "distance": float(q_dist[rank])
+                })
+            batch.append(results)
+        return batch
+
+@lru_cache(maxsize=None)
+def get_doc_index(md_file: str) -> DocIndex:
+    return DocIndex(md_file)
+
+def search_sections_batch(queries: List[str], top_k: int = 5, md_file: str = None) -> List[List[dict]]:
+    """
+    Batched form of search_sections: one embedding request for all (new)
+    queries and one index search, against the cached index for md_file.
+    """
+    if not queries:
+        return []
+    return get_doc_index(md_file).search(query_matrix(tuple(queries)), top_k)
 
-    faiss.write_index(index, f"{output_prefix}.faiss")
-    np.savez(f"{output_prefix}.npz", metadata=metadata)
-    print(f"✅ Saved FAISS index and metadata to {output_prefix}.faiss / .npz")
-    
-    
 def search_sections(query: str, top_k: int = 5, md_file: str = None):
     """
     Search for the most semantically relevant sections to a query using FAISS.
     Returns top-k sections and their metadata.
     """
-    
-    # Load FAISS + metadata
-    index = faiss.read_index(f"data/embeddings/{md_file}.faiss")
-    meta = np.load(f"data/embeddings/{md_file}.npz", allow_pickle = True)["metadata"]
-
-    # Embed the query
-    query_embedding = client.embeddings.create(
-        model="text-embedding-3-large",
-        input=query
-    ).data[0].embedding
-
-    def normalize(vectors):
-        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
-        return vectors / norms
-    
-    q_vec = normalize(np.array([query_embedding]).astype("float32"))
-    distances, indices = index.search(q_vec, top_k)
-
-    results = []
-    for rank, idx in enumerate(indices[0]):
-        results.append({
-            "rank": rank + 1,
-            "title": meta[idx]["title"],
-            "section_number": meta[idx]["section_num"],
-            "section_id": meta[idx]["section_id"],
-            "lines": meta[idx]["lines"],
-            "char_count": meta[idx]["char_count"],
-            "distance": float(distances[0][rank])
-        })
-    return results
+    return search_sections_batch([query], top_k=top_k, md_file=md_file)[0]
     
     
 def append_next_sections(md_file: str, current_section_id: str, num_next: int = 5) -> str:
     
     meta = np.load(f"data/embeddings/{md_file}.npz", allow_pickle=True)["metadata"]
-    with open(f"data/parsed_md_val_mistral/{md_file}.md", "r", encoding="utf-8") as f:
-        markdown_text = f.read()
 
     # Find current section index in metadata
     current_idx = next(
@@ -266,18 +545,10 @@ def append_next_sections(md_file: str, current_section_id: str, num_next: int =
     if current_idx is None:
         return ""
 
-    # Start with current section’s text
-    start_line, end_line = meta[current_idx]["lines"]
-    combined_text = get_text_from_lines(markdown_text, start_line, end_line)
-
-    for offset in range(1, num_next + 1):
-        next_idx = current_idx + offset
-        if next_idx < len(meta):
-            next_start, next_end = meta[next_idx]["lines"]
-            next_text = get_text_from_lines(markdown_text, next_start, next_end)
-            combined_text += "\n\n" + next_text
-
-    return combined_text
+    # Current section’s text followed by the next num_next sections
+    md_lines = markdown_lines(f"data/parsed_md_val_mistral/{md_file}.md")
+    ranges = [m["lines"] for m in meta[current_idx:current_idx + num_next + 1]]
+    return "\n\n".join(md_lines.iter_texts(ranges))
     
 if __name__ == "__main__":
     import sys
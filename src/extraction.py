@@ -1,27 +1,52 @@
-import os, json
+import os
+import orjson
 import re
+import asyncio
+import dataclasses
+from concurrent.futures import Future, ThreadPoolExecutor, wait as wait_futures
+import threading
 from pathlib import Path
-import shutil
 import tempfile
-from typing import List, Dict, Tuple
+import random
+import hashlib
+from typing import List, Dict, Tuple, Union
 from dotenv import load_dotenv
-from openai import OpenAI
+from openai import RateLimitError, APIConnectionError, InternalServerError
+import httpx
 import numpy as np
 from tqdm import tqdm
 import time
 from functools import lru_cache
 from pathlib import Path
 import yaml
+import tiktoken
 import sys
 
-from embeddings import build_section_embeddings, search_sections, append_next_sections
-from report_generator import BalanceSheet, CashFlowStatement, CompanyReport, DDRGenerator, FinancialData, IncomeStatement, KeyFinancialMetrics, OperatingPerformance
+from embeddings import EMBED_MODEL, build_section_embeddings, embed_queries, get_doc_index, markdown_lines, search_sections, search_sections_batch, append_next_sections
+from openai_client import aclient, async_http, client, transport as _transport
+import llm_cache
+from log import get_logger
+from report_generator import BalanceSheet, CashFlowStatement, CompanyReport, CoreCompetencies, DDRGenerator, FinancialData, IncomeStatement, KeyFinancialMetrics, OperatingPerformance
 sys.path.insert(0, str(Path(__file__).parent.parent))
 from prompts.prompts import build_s1_1_prompt, build_s1_2_prompt, build_s1_3_prompt, build_s2_1_prompt, build_s2_2_prompt, build_s2_3_prompt, build_s2_5_prompt, build_s3_1_prompt
-from prompts.prompts import build_s3_2_prompt, build_s3_3_prompt, build_s4_1_prompt, build_s5_1_prompt, build_s5_2_prompt, build_s6_1_prompt, build_s6_2_prompt, build_s6_3_prompt
+from prompts.prompts import build_s3_2_multi_prompt, build_s3_3_prompt, build_s4_1_prompt, build_s5_1_prompt, build_s5_2_prompt, build_s6_1_prompt, build_s6_2_prompt, build_s6_3_prompt
+from prompts.prompts import build_multi_year_messages, build_multi_task_prompt
+from utils.pdf_hash import original_stem
 
 load_dotenv(override=True)
-client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+logger = get_logger("findr.extract")
+
+def _run_async(coro):
+    """
+    asyncio.run() for the extraction coroutines. The async client's connections
+    belong to the loop that opened them, so release them before the loop closes.
+    """
+    async def _main():
+        try:
+            return await coro
+        finally:
+            await _transport.aclose()
+    return asyncio.run(_main())
 
 from enum import Enum
 
@@ -63,43 +88,65 @@ def _load() -> dict:
     with open(_YAML_PATH, "r", encoding="utf-8") as f:
         return yaml.safe_load(f) or {}
 
-def get_queries(section: str, lang: str):
-    data = _load()
-    return data.get(section, {}).get("search_queries", {}).get(lang.upper(), [])
+def _dedupe_queries(queries) -> Tuple[str, ...]:
+    # Drop repeats (ignoring case, whitespace and word order); each query costs an embedding + search
+    seen = set()
+    unique = []
+    for q in queries or []:
+        norm = tuple(sorted(str(q).casefold().split()))
+        if norm and norm not in seen:
+            seen.add(norm)
+            unique.append(str(q).strip())
+    return tuple(unique)
+
+def _compile_queries() -> Dict[Tuple[str, str], Tuple[str, ...]]:
+    return {
+        (section, lang.upper()): _dedupe_queries(queries)
+        for section, cfg in _load().items()
+        for lang, queries in (cfg or {}).get("search_queries", {}).items()
+    }
+
+# (section, LANG) -> deduplicated query tuple, built once at import
+_QUERIES = _compile_queries()
+
+def get_queries(section: str, lang: str) -> Tuple[str, ...]:
+    return _QUERIES.get((section, lang.upper()), ())
+
+_TRAILING_COMMA = re.compile(r",\s*([}\]])")
 
 def _safe_json_from_llm(s: str) -> dict:
     if s is None:
         return {}
-    # strip code fences
-    s = re.sub(r"^```(?:json)?\s*|\s*```$", "", s.strip(), flags=re.IGNORECASE)
 
-    # try plain JSON first
+    # JSON mode output is almost always clean, so parse it as-is first
     try:
-        return json.loads(s)
-    except Exception:
+        return orjson.loads(s)
+    except orjson.JSONDecodeError:
         pass
 
-    # extract first {...} block if there’s extra text
-    m = re.search(r"\{.*\}", s, flags=re.DOTALL)
-    if not m:
+    # otherwise take the outermost {...}, which also drops code fences and chatter
+    start, end = s.find("{"), s.rfind("}")
+    if start == -1 or end < start:
         return {}
+    js = s[start:end + 1]
+    try:
+        return orjson.loads(js)
+    except orjson.JSONDecodeError:
+        pass
 
-    js = m.group(0)
-
-    # fix common issues: trailing commas before } or ]
-    js = re.sub(r",\s*([}\]])", r"\1", js)
-
-    # normalize smart quotes
+    # last resort: trailing commas before } or ] and smart quotes
+    js = _TRAILING_COMMA.sub(r"\1", js)
     js = js.replace("“", '"').replace("”", '"').replace("’", "'")
-
     try:
-        return json.loads(js)
-    except Exception:
+        return orjson.loads(js)
+    except orjson.JSONDecodeError:
         return {}
 
+# Deletion tables for str.translate: currency symbols and thousands separators
+_STRIP_CURRENCY = str.maketrans("", "", "£$€¥,")
+_STRIP_CURRENCY_PARENS = str.maketrans("", "", "£$€¥,()")
+
 def _normalize_na(v) -> str:
-    import re
-    
     if v is None:
         return "N/A"
     s = str(v).strip()
@@ -109,14 +156,14 @@ def _normalize_na(v) -> str:
     try:
         # Handle parentheses-style negatives like (10.6)
         if s.startswith("(") and s.endswith(")"):
-            cleaned = re.sub(r"[£$€¥,]", "", s)
+            cleaned = s.translate(_STRIP_CURRENCY)
             inner = cleaned.strip("()")
             # validate it’s numeric but preserve original decimal precision
             float(inner)
             return f"({inner})"
 
         # Otherwise, clean currency symbols but do NOT reformat decimals
-        cleaned = re.sub(r"[£$€¥,()]", "", s)
+        cleaned = s.translate(_STRIP_CURRENCY_PARENS)
 
         # Validate numeric — if valid, return as-is (don’t format)
         float(cleaned)
@@ -126,10 +173,23 @@ def _normalize_na(v) -> str:
         # Return as-is for text, "N/A", or other non-numeric strings
         return s
 
+# retrieval cache key -> combined context; backed by .cache/retrieval/ across runs
+_context_cache: Dict[str, str] = {}
+
+# Reciprocal rank fusion constant; larger values flatten the weight of top ranks
+_RRF_K = 60
+# Retrieved sections this similar to one already kept are near-duplicates and dropped
+_DEDUP_COSINE = 0.92
+# Hard cap on the assembled context, well under the size where prompts get truncated
+_MAX_RETRIEVED_CHARS = 200_000
+# Part of the retrieval and section cache keys; bump when ranking or assembly changes
+RETRIEVAL_VERSION = 4
+
 def retrieve_relevant_text(search_queries: List[str], top_k: int, md_file: str) -> str:
     """
     Search for sections using multiple queries and return the complete combined text.
     Handles duplicate section names by using composite keys (section_id + line_range).
+    Results are cached by (markdown content, queries, top_k), in memory and on disk.
     
     Args:
         search_queries: List of search query strings
@@ -139,45 +199,669 @@ def retrieve_relevant_text(search_queries: List[str], top_k: int, md_file: str)
     Returns:
         Combined text from all relevant sections
     """
-    all_results = []
-    for query in search_queries:
-        # returns list of dict, where each item is section identifier  
-        results = search_sections(query, top_k=top_k, md_file=md_file)
-        all_results.extend(results)
-    
-    # Sort by relevance (distance score) first
-    all_results.sort(key=lambda x: x.get('distance', float('inf')))
-    
-    # De-duplicate using composite key: section_id + line_range + section_number
-    seen_sections = set()
-    unique_results = []
-    
-    for result in all_results:
-        # Create composite key to handle duplicate section names
-        start_line, end_line = result["lines"]
-        composite_key = f"{result['section_id']}_{start_line}_{end_line}_{result.get('section_number', 0)}"
-        
-        if composite_key not in seen_sections:
-            seen_sections.add(composite_key)
-            unique_results.append(result)
-  
-    # print(f"Final unique results: {len(unique_results)} sections")
-    
-    # Get the actual text for selected sections
-    with open(f"data/parsed/{md_file}.md", "r", encoding="utf-8") as f:
-        markdown_text = f.read()
+    key = llm_cache.make_key(
+        llm_cache.file_digest(f"data/parsed/{md_file}.md"), list(search_queries), top_k, EMBED_MODEL, RETRIEVAL_VERSION,
+    )
+    return _cached_context(key, md_file, lambda: _assemble_context(_fused_sections(search_queries, top_k, md_file), md_file))
+
+def retrieve_union_text(query_sets: List[Tuple[List[str], int]], md_file: str) -> str:
+    """
+    Like retrieve_relevant_text, but for several (queries, top_k) sets at once: each
+    set is ranked at its own top_k and the de-duplicated union of their sections is
+    returned as one context, so one set's queries cannot crowd out another's sections.
+    """
+    key = llm_cache.make_key(
+        llm_cache.file_digest(f"data/parsed/{md_file}.md"), [[list(q), k] for q, k in query_sets], EMBED_MODEL, RETRIEVAL_VERSION,
+    )
+
+    def _build():
+        union = {}
+        for queries, top_k in query_sets:
+            for composite_key, (score, result) in _fused_sections(queries, top_k, md_file).items():
+                entry = union.setdefault(composite_key, [0.0, result])
+                entry[0] += score
+        return _assemble_context(union, md_file)
+
+    return _cached_context(key, md_file, _build)
+
+def _cached_context(key: str, md_file: str, build) -> str:
+    context = _context_cache.get(key)
+    if context is None:
+        cached = llm_cache.load("retrieval", key)
+        if cached is not None:
+            context = cached["context"]
+        else:
+            context = build()
+            llm_cache.save("retrieval", key, {"md_file": md_file, "context": context})
+        _context_cache[key] = context
+    return context
+
+def _fused_sections(search_queries: List[str], top_k: int, md_file: str) -> Dict[tuple, list]:
+    # Fuse the per-query rankings with reciprocal rank fusion: a section found by
+    # several queries outranks one that a single query put slightly closer.
+    # Sections are de-duplicated on section_id + line_range + section_number.
+    fused = {}
+    # returns one list of section dicts per query, best first
+    for results in search_sections_batch(search_queries, top_k=top_k, md_file=md_file):
+        for result in results:
+            start_line, end_line = result["lines"]
+            composite_key = (result["section_id"], start_line, end_line, result.get("section_number", 0))
+            score = 1.0 / (_RRF_K + result["rank"])
+            entry = fused.get(composite_key)
+            if entry is None:
+                fused[composite_key] = [score, result]
+            else:
+                entry[0] += score
+    return fused
+
+def _assemble_context(fused: Dict[tuple, list], md_file: str) -> str:
+    unique_results = _drop_near_duplicates(
+        [result for _, result in sorted(fused.values(), key=lambda e: -e[0])], md_file,
+    )
     
-    lines = markdown_text.split('\n')
-    context = ""
+    # Get the actual text for selected sections, decoding only those line ranges
+    md_lines = markdown_lines(f"data/parsed/{md_file}.md")
+    parts = []
+    total = 0
 
-    for h in unique_results:
-        s, e = h["lines"]
-        section_text = '\n'.join(lines[s - 1:e + 1])
+    for h, section_text in zip(unique_results, md_lines.iter_texts(h["lines"] for h in unique_results)):
         # Include section number for clarity when there are duplicate titles
         section_identifier = f"{h.get('title')}"
-        context += f"\n--- {section_identifier} ---\n{section_text}\n\n"
+        part = f"\n--- {section_identifier} ---\n{section_text}\n\n"
+        # Sections are in fused-score order, so the cap always drops the weakest ones
+        if parts and total + len(part) > _MAX_RETRIEVED_CHARS:
+            break
+        parts.append(part)
+        total += len(part)
     
-    return context.strip()
+    return "".join(parts).strip()
+
+def _drop_near_duplicates(results: List[dict], md_file: str) -> List[dict]:
+    """
+    Greedily keep results in order, dropping any whose section embedding has cosine
+    similarity >= _DEDUP_COSINE with an already kept one (repeated boilerplate,
+    restated tables). One Gram matrix over the candidates covers all the pairs.
+    """
+    if len(results) < 2:
+        return results
+    vecs = get_doc_index(md_file).vectors([r["index"] for r in results])
+    sims = vecs @ vecs.T
+    kept = []
+    for i in range(len(results)):
+        if not kept or sims[i, kept].max() < _DEDUP_COSINE:
+            kept.append(i)
+    return [results[i] for i in kept]
+
+# Upper bound on in-flight chat completions; keep within the account's rate tier
+LLM_CONCURRENCY = 50
+
+# Model for the structured numeric statements (S2.1-S2.3, S2.5); overridable
+# so a different model can be A/B-checked against the same reports
+MODEL_NUMERIC = os.getenv("FINDDR_MODEL_NUMERIC", "gpt-4.1-mini")
+
+# Output budget per (section, language). Chinese needs roughly 1.5x the tokens of
+# English for the same text; S3.2 is per target year.
+_MAX_TOKENS = {
+    ("s3_1", Lang.EN): 800,   ("s3_1", Lang.IN): 900,   ("s3_1", Lang.ZH_SIM): 1200, ("s3_1", Lang.ZH_TR): 1200,
+    ("s3_2", Lang.EN): 1600,  ("s3_2", Lang.IN): 1750,  ("s3_2", Lang.ZH_SIM): 2000, ("s3_2", Lang.ZH_TR): 2000,
+    ("s3_3", Lang.EN): 700,   ("s3_3", Lang.IN): 800,   ("s3_3", Lang.ZH_SIM): 1000, ("s3_3", Lang.ZH_TR): 1000,
+    ("s4_1", Lang.EN): 1200,  ("s4_1", Lang.IN): 1300,  ("s4_1", Lang.ZH_SIM): 1500, ("s4_1", Lang.ZH_TR): 1500,
+    ("s6_1", Lang.EN): 1000,  ("s6_1", Lang.IN): 1100,  ("s6_1", Lang.ZH_SIM): 1500, ("s6_1", Lang.ZH_TR): 1500,
+    ("s6_2", Lang.EN): 700,   ("s6_2", Lang.IN): 800,   ("s6_2", Lang.ZH_SIM): 1000, ("s6_2", Lang.ZH_TR): 1000,
+    ("s6_3", Lang.EN): 700,   ("s6_3", Lang.IN): 800,   ("s6_3", Lang.ZH_SIM): 1000, ("s6_3", Lang.ZH_TR): 1000,
+}
+
+def _max_tokens(section: str, lang: Lang, default: int = 2000) -> int:
+    return _MAX_TOKENS.get((section, lang), default)
+
+# The static budgets above are caps. Each call asks for min(cap, 1.3 * p95) of the
+# completion sizes seen for that section/language, starting at 1000; a response cut
+# off at the limit is retried once at the cap. History persists in .cache/ so later
+# runs start from realized sizes.
+_BUDGET_START = 1000
+_BUDGET_HEADROOM = 1.3
+_BUDGET_WINDOW = 50
+_completion_tokens: Dict[str, List[int]] = llm_cache.load("token_budget", "completion_tokens") or {}
+
+_LABEL_YEAR = re.compile(r" \d{4}$")
+
+def _budget_key(label: str, lang: Lang) -> str:
+    # "S3.3 2024" and "S3.3 2023" share one history; fused "S5.2 2024+2023" keeps its own
+    return f"{_LABEL_YEAR.sub('', label)}:{lang.value}"
+
+def _token_budget(key: str, cap: int) -> int:
+    samples = _completion_tokens.get(key)
+    if not samples:
+        return min(cap, _BUDGET_START)
+    p95 = sorted(samples)[int(0.95 * (len(samples) - 1))]
+    return min(cap, int(_BUDGET_HEADROOM * p95) + 1)
+
+def _record_completion(key: str, tokens: int):
+    samples = _completion_tokens.setdefault(key, [])
+    samples.append(tokens)
+    del samples[:-_BUDGET_WINDOW]
+
+# Prompt tokens sent vs. served from OpenAI's prompt cache, for the run summary
+_prompt_usage = {"prompt": 0, "cached": 0}
+
+def _record_prompt_usage(usage):
+    if isinstance(usage, dict):  # raw streamed chunk (see _acall_llm)
+        _prompt_usage["prompt"] += usage.get("prompt_tokens") or 0
+        _prompt_usage["cached"] += (usage.get("prompt_tokens_details") or {}).get("cached_tokens") or 0
+        return
+    _prompt_usage["prompt"] += usage.prompt_tokens or 0
+    details = getattr(usage, "prompt_tokens_details", None)
+    _prompt_usage["cached"] += (getattr(details, "cached_tokens", 0) or 0) if details else 0
+
+def save_token_budgets():
+    try:
+        llm_cache.save("token_budget", "completion_tokens", _completion_tokens)
+    except OSError as e:
+        logger.warning(f"Could not persist token budgets: {e}")
+
+# Input window per model; contexts are cut to fit what is left after the prompt
+# instructions and the output budget
+_CONTEXT_WINDOW = {"gpt-4.1": 1_047_576, "gpt-4.1-mini": 1_047_576, "gpt-4.1-nano": 1_047_576, "gpt-4o": 128_000, "gpt-4o-mini": 128_000}
+_DEFAULT_CONTEXT_WINDOW = 128_000
+_PROMPT_OVERHEAD = 4000
+
+@lru_cache(maxsize=None)
+def _encoder(model: str):
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        return tiktoken.get_encoding("o200k_base")
+
+def _local_completion_tokens(text: str, model: str) -> int:
+    """Completion size for a reply whose usage chunk never arrived; 0 (so nothing is recorded) if it can't be counted."""
+    try:
+        return len(_encoder(model).encode(text, disallowed_special=()))
+    except Exception:
+        return 0
+
+def _context_limit(model: str, max_tokens: int) -> int:
+    return _CONTEXT_WINDOW.get(model, _DEFAULT_CONTEXT_WINDOW) - _PROMPT_OVERHEAD - max_tokens
+
+def _fits_window(text: Union[str, List[str]], model: str, max_tokens: int) -> bool:
+    # `text` is one prompt or the list of user messages making up a request
+    parts = [text] if isinstance(text, str) else text
+    limit = _context_limit(model, max_tokens)
+    if sum(len(p.encode("utf-8")) for p in parts) <= limit:
+        return True
+    enc = _encoder(model)
+    return sum(len(enc.encode(p, disallowed_special=())) for p in parts) <= limit
+
+def _fit_context(context: str, model: str, max_tokens: int) -> str:
+    """Truncate `context` at a token boundary so the request fits the model window."""
+    limit = _context_limit(model, max_tokens)
+    # every token covers at least one UTF-8 byte, so short contexts skip encoding
+    if len(context.encode("utf-8")) <= limit:
+        return context
+    tokens = _encoder(model).encode(context, disallowed_special=())
+    if len(tokens) <= limit:
+        return context
+    logger.warning(f"Context of {len(tokens)} tokens truncated to {limit} for {model}")
+    return _encoder(model).decode(tokens[:limit])
+
+# Page numbers, bare numbers and table-of-contents headings left over from parsing
+_BOILERPLATE_LINE = re.compile(r"^\s*(?:page\s+\d+|\d+|目录|目錄|contents)\s*$", re.IGNORECASE)
+
+def _compact_context(context: str) -> str:
+    """
+    Drop parsing boilerplate from narrative RAG context: page-number and TOC
+    lines, lines repeated verbatim across the retrieved sections, and runs of
+    blank lines.
+    """
+    out = []
+    seen = set()
+    blank = False
+    for line in context.split("\n"):
+        stripped = line.strip()
+        if not stripped:
+            if not blank:
+                out.append("")
+            blank = True
+            continue
+        if _BOILERPLATE_LINE.match(stripped):
+            continue
+        # section separators stay even when two retrieved sections share a title
+        if not stripped.startswith("--- "):
+            if stripped in seen:
+                continue
+            seen.add(stripped)
+        out.append(line)
+        blank = False
+    return "\n".join(out).strip()
+
+def _prepare_context(context: str, model: str, max_tokens: int) -> str:
+    return _fit_context(_compact_context(context), model, max_tokens)
+
+# Below this the retrieval missed and the model could only answer N/A
+_MIN_CONTEXT_CHARS = 200
+
+def _has_context(context: str) -> bool:
+    return len(context.strip()) >= _MIN_CONTEXT_CHARS
+
+# Transient failures (429, dropped connections/timeouts, 5xx) are retried with backoff
+LLM_MAX_ATTEMPTS = 5
+class _RetryableStatus(Exception):
+    """429 / 5xx (and 408/409) from a raw request; the SDK retries the same set."""
+
+LLM_RETRYABLE = (RateLimitError, APIConnectionError, InternalServerError, _RetryableStatus, httpx.TransportError)
+
+def _backoff(attempt: int) -> float:
+    return min(2 ** attempt + random.random(), 30.0)
+
+def _string_object(keys) -> dict:
+    """JSON schema for an object with exactly `keys`, all strings."""
+    return {
+        "type": "object",
+        "properties": {k: {"type": "string"} for k in keys},
+        "required": list(keys),
+        "additionalProperties": False,
+    }
+
+def _strict_format(name: str, schema: dict) -> dict:
+    """
+    Strict structured-output response_format for `schema`.
+    The model is constrained to the schema, so the reply parses
+    with a plain orjson.loads.
+    """
+    return {
+        "type": "json_schema",
+        "json_schema": {"name": name, "strict": True, "schema": schema},
+    }
+
+def _json_schema_format(name: str, keys) -> dict:
+    """Strict structured-output format for a flat object of string fields."""
+    return _strict_format(name, _string_object(keys))
+
+# Output keys of the analysis sections (S3.2 keys get a _<year> suffix)
+_S3_1_KEYS = ("revenue_direct_cost_dynamics", "operating_efficiency", "external_oneoff_impact")
+_S3_2_KEYS = ("comprehensive_financial_health", "profitability_earnings_quality", "operational_efficiency",
+              "financial_risk_identification", "future_financial_performance_projection")
+_S3_3_KEYS = ("business_model", "market_position")
+_S4_1_KEYS = ("market_risks", "operational_risks", "financial_risks", "compliance_risks")
+_S5_1_MEMBER_KEYS = ("name", "position", "total_income")
+_S5_2_KEYS = ("risk_assessment_procedures", "control_activities", "monitoring_mechanisms",
+              "identified_material_weaknesses", "effectiveness")
+_S6_1_KEYS = ("mergers_acquisition", "new_technologies", "organisational_restructuring")
+_S6_2_KEYS = ("economic_challenges", "competitive_pressures")
+_S6_3_KEYS = ("rd_investments", "new_product_launches")
+
+_S3_1_FORMAT = _json_schema_format("s3_1_profitability", _S3_1_KEYS)
+_S3_3_FORMAT = _json_schema_format("s3_3_competitiveness", _S3_3_KEYS)
+_S4_1_FORMAT = _json_schema_format("s4_1_risk_factors", _S4_1_KEYS)
+_S5_1_FORMAT = _strict_format("s5_1_board_composition", {
+    "type": "object",
+    "properties": {"board_members": {"type": "array", "items": _string_object(_S5_1_MEMBER_KEYS)}},
+    "required": ["board_members"],
+    "additionalProperties": False,
+})
+_S5_2_FORMAT = _json_schema_format("s5_2_internal_controls", _S5_2_KEYS)
+_S6_1_FORMAT = _json_schema_format("s6_1_strategic_direction", _S6_1_KEYS)
+_S6_2_FORMAT = _json_schema_format("s6_2_challenges", _S6_2_KEYS)
+_S6_3_FORMAT = _json_schema_format("s6_3_innovation", _S6_3_KEYS)
+
+# (output key, year, source key) for the two-year sections
+_S3_3_OUT = tuple((f"{k}_{y}", y, k) for k in _S3_3_KEYS for y in (2024, 2023))
+_S4_1_OUT = tuple((f"{k}_{y}", y, k) for k in _S4_1_KEYS for y in (2024, 2023))
+_S5_2_OUT = tuple((f"{k}_{y}", y, k) for k in _S5_2_KEYS for y in (2024, 2023))
+_S6_1_OUT = tuple((f"{k}_{y}", y, k) for k in _S6_1_KEYS for y in (2024, 2023))
+_S6_2_OUT = tuple((f"{k}_{y}", y, k) for k in _S6_2_KEYS for y in (2024, 2023))
+_S6_3_OUT = tuple((f"{k}_{y}", y, k) for k in _S6_3_KEYS for y in (2024, 2023))
+
+def _normalize_years(mapping, by_year: Dict[int, dict]) -> Dict[str, str]:
+    """Flatten per-year LLM results into the report's <key>_<year> fields, normalizing N/A."""
+    n = _normalize_na
+    return {out: n(by_year[y].get(k, "N/A")) for out, y, k in mapping}
+
+@lru_cache(maxsize=None)
+def _s3_2_format(years: Tuple[int, ...]) -> dict:
+    name = "s3_2_performance_" + "_".join(map(str, years))
+    return _json_schema_format(name, tuple(f"{k}_{y}" for y in years for k in _S3_2_KEYS))
+
+class _JsonObjectEnd:
+    """
+    Tracks bracket depth over a streamed JSON reply, skipping string contents,
+    and reports when the outermost object closes. The parser ignores anything
+    after that point, so the stream can be closed there instead of waiting for
+    the server to finish.
+    """
+
+    def __init__(self):
+        self._depth = 0
+        self._started = False
+        self._in_str = False
+        self._escape = False
+
+    def feed(self, text: str) -> bool:
+        """Consume the next chunk; True once the top-level object is complete."""
+        for ch in text:
+            if self._in_str:
+                if self._escape:
+                    self._escape = False
+                elif ch == "\\":
+                    self._escape = True
+                elif ch == '"':
+                    self._in_str = False
+            elif ch == '"':
+                self._in_str = True
+            elif ch in "{[":
+                self._depth += 1
+                self._started = True
+            elif ch in "}]":
+                self._depth -= 1
+                if self._started and self._depth == 0:
+                    return True
+        return False
+
+class _StreamedArrayItems:
+    """
+    Incremental scanner for a streamed JSON reply shaped like {"key": [{...}, {...}]}.
+    Each array element is parsed and handed to `on_item` as soon as its closing
+    brace arrives, so post-processing overlaps with generation.
+    """
+
+    def __init__(self, on_item):
+        self.on_item = on_item
+        self.reset()
+
+    def reset(self):
+        # called at the start of every (re)tried request
+        self.items = []
+        self._buf = []
+        self._depth = 0
+        self._in_str = False
+        self._escape = False
+
+    def feed(self, text: str):
+        for ch in text:
+            if self._depth >= 3:
+                self._buf.append(ch)
+            if self._in_str:
+                if self._escape:
+                    self._escape = False
+                elif ch == "\\":
+                    self._escape = True
+                elif ch == '"':
+                    self._in_str = False
+            elif ch == '"':
+                self._in_str = True
+            elif ch in "{[":
+                self._depth += 1
+                if self._depth == 3 and ch == "{":
+                    self._buf = ["{"]
+            elif ch in "}]":
+                if self._depth == 3 and ch == "}":
+                    self._emit("".join(self._buf))
+                    self._buf = []
+                self._depth -= 1
+
+    def _emit(self, text: str):
+        try:
+            item = orjson.loads(text)
+        except orjson.JSONDecodeError:
+            return
+        if isinstance(item, dict):
+            self.items.append(self.on_item(item))
+
+def _request_headers() -> Dict[str, str]:
+    """
+    Headers for a request posted straight through async_http: the client's
+    default_headers (Accept, Content-Type, platform headers, auth_headers and any
+    custom headers) minus the openai.Omit placeholders for unset optional ones.
+    """
+    return {k: v for k, v in aclient.default_headers.items() if isinstance(v, str)}
+
+@llm_cache.cached_llm("completions", ("prompt", "system", "model", "temperature", "max_tokens", "response_format"))
+async def _acall_llm(prompt: Union[str, List[str]], *, system: str, model: str, temperature: float = 0, max_tokens: int = 1500,
+                     sem: asyncio.Semaphore = None, label: str = "LLM", stream: bool = True,
+                     response_format: dict = None, lang: Lang = None, items: _StreamedArrayItems = None) -> dict:
+    """
+    Send one JSON-mode chat completion through the async client.
+    Pass a `response_format` from _json_schema_format to get schema-constrained
+    output; otherwise plain json_object mode is used.
+    When `sem` is given the request waits for a slot first, so callers
+    can fan out freely and still respect the concurrency bound.
+    With `stream` the body is read as it is generated instead of after the
+    last token, which also surfaces a dropped connection as soon as it happens,
+    and the stream is closed as soon as the top-level JSON object is complete.
+    `max_tokens` is the cap; the request itself uses the adaptive budget for
+    this label (see _token_budget).
+    `items`, if given, is fed the streamed text as it arrives.
+    `prompt` may be a list, sent as consecutive user messages; callers use this
+    to put the retrieved context in its own message after the instructions.
+    Returns {} on failure so callers fall back to "N/A".
+    Non-empty replies are cached on disk, so reruns on unchanged inputs skip the request.
+    """
+    fmt = response_format or {"type": "json_object"}
+    budget_key = _budget_key(label, lang or TARGET_LANGUAGE)
+    messages = [{"role": "system", "content": system}]
+    messages += [{"role": "user", "content": part} for part in ([prompt] if isinstance(prompt, str) else prompt)]
+
+    def _parse(text: str) -> dict:
+        if fmt["type"] == "json_schema":
+            try:
+                return orjson.loads(text)
+            except (TypeError, orjson.JSONDecodeError):
+                pass
+        return _safe_json_from_llm(text)
+
+    async def _request(limit: int) -> Tuple[str, str, int]:
+        """Returns (text, finish_reason, completion_tokens)."""
+        if not stream:
+            resp = await aclient.chat.completions.create(
+                model=model,
+                response_format=fmt,
+                messages=messages,
+                temperature=temperature,
+                max_tokens=limit,
+            )
+            choice = resp.choices[0]
+            used = 0
+            if resp.usage:
+                used = resp.usage.completion_tokens
+                _record_prompt_usage(resp.usage)
+            return choice.message.content, choice.finish_reason, used
+
+        # Streamed replies are read as raw server-sent events: the SDK would build
+        # a response model for every chunk, and only the text deltas are needed
+        body = {
+            "model": model,
+            "response_format": fmt,
+            "messages": messages,
+            "temperature": temperature,
+            "max_tokens": limit,
+            "stream": True,
+            "stream_options": {"include_usage": True},
+        }
+        parts = []
+        finish_reason, used = None, 0
+        end = _JsonObjectEnd()
+        if items is not None:
+            items.reset()
+        async with async_http.stream("POST", f"{aclient.base_url}chat/completions",
+                                     headers=_request_headers(), content=orjson.dumps(body)) as resp:
+            if resp.status_code != 200:
+                await resp.aread()
+                error = f"HTTP {resp.status_code}: {resp.text[:500]}"
+                if resp.status_code in (408, 409, 429) or resp.status_code >= 500:
+                    raise _RetryableStatus(error)
+                raise RuntimeError(error)
+            async for line in resp.aiter_lines():
+                if not line.startswith("data:"):
+                    continue
+                data = line[5:].strip()
+                if data == "[DONE]":
+                    break
+                chunk = orjson.loads(data)
+                if "error" in chunk:
+                    raise RuntimeError(chunk["error"].get("message", chunk["error"]))
+                if chunk.get("choices"):
+                    choice = chunk["choices"][0]
+                    content = (choice.get("delta") or {}).get("content")
+                    if content:
+                        parts.append(content)
+                        if items is not None:
+                            items.feed(content)
+                        if end.feed(content):
+                            # leaving the block hangs up, so the usage chunk never arrives; count locally
+                            text = "".join(parts)
+                            return text, "stop", _local_completion_tokens(text, model)
+                    if choice.get("finish_reason"):
+                        finish_reason = choice["finish_reason"]
+                # with include_usage the final chunk carries usage and no choices
+                if chunk.get("usage"):
+                    used = chunk["usage"].get("completion_tokens") or 0
+                    _record_prompt_usage(chunk["usage"])
+        return "".join(parts), finish_reason, used
+
+    async def _call() -> dict:
+        limit = _token_budget(budget_key, max_tokens)
+        text, finish_reason, used = await _request(limit)
+        if finish_reason == "length" and limit < max_tokens:
+            logger.info(f"[{label}] Output hit {limit} tokens, retrying at {max_tokens}")
+            text, finish_reason, used = await _request(max_tokens)
+        if finish_reason != "length" and used:
+            _record_completion(budget_key, used)
+        return _parse(text)
+
+    try:
+        for attempt in range(LLM_MAX_ATTEMPTS):
+            try:
+                if sem is None:
+                    return await _call()
+                async with sem:
+                    return await _call()
+            except LLM_RETRYABLE as e:
+                if attempt == LLM_MAX_ATTEMPTS - 1:
+                    raise
+                # back off outside the semaphore so other calls can use the slot
+                wait = _backoff(attempt)
+                logger.warning(f"[{label}] Retry {attempt+1}: waiting {wait:.1f}s ({e})")
+                await asyncio.sleep(wait)
+    except Exception as e:
+        logger.error(f"[{label}] LLM error: {e}")
+        return {}
+
+def _by_year_format(fmt: dict, years) -> dict:
+    """Nest a per-year json_schema format under one key per year ("2024", "2023")."""
+    inner = fmt["json_schema"]
+    return _strict_format(f"{inner['name']}_by_year", {
+        "type": "object",
+        "properties": {str(y): inner["schema"] for y in years},
+        "required": [str(y) for y in years],
+        "additionalProperties": False,
+    })
+
+async def _acall_llm_by_year(prompts: Dict[int, str], *, contexts: Dict[int, str], system: str, model: str, max_tokens: int,
+                             response_format: dict, sem: asyncio.Semaphore = None, label: str = "LLM", lang: Lang = None) -> Dict[int, dict]:
+    """
+    Answer the per-year `prompts` in a single request when the combined prompt
+    fits the model window, halving the round-trips for two-year sections.
+    Falls back to one request per year when it does not fit or the fused call fails.
+    Each year's context is sent as its own message right after that year's prompt.
+    `max_tokens` and `response_format` are per year; a None prompt skips that year ({}).
+    """
+    lang = lang or TARGET_LANGUAGE
+    skipped = {y: {} for y, p in prompts.items() if p is None}
+    prompts = {y: p for y, p in prompts.items() if p is not None}
+    years = tuple(prompts)
+    if not years:
+        return skipped
+    fused = build_multi_year_messages(prompts, contexts, lang)
+    if len(years) > 1 and _fits_window(fused, model, max_tokens * len(years)):
+        result = await _acall_llm(fused, system=system, model=model, max_tokens=max_tokens * len(years), sem=sem,
+                                  label=f"{label} {'+'.join(map(str, years))}", response_format=_by_year_format(response_format, years), lang=lang)
+        by_year = {y: result.get(str(y)) for y in years}
+        if all(isinstance(r, dict) for r in by_year.values()):
+            return {**by_year, **skipped}
+
+    results = await asyncio.gather(*(
+        _acall_llm([prompts[y], contexts[y]], system=system, model=model, max_tokens=max_tokens, sem=sem, label=f"{label} {y}", response_format=response_format, lang=lang)
+        for y in years
+    ))
+    return {**dict(zip(years, results)), **skipped}
+
+@llm_cache.cached_llm("completions", ("prompt", "system", "model", "max_tokens"))
+def _call_llm(prompt: str, *, system: str, model: str, max_tokens: int = 2000, label: str = "LLM") -> dict:
+    """
+    Sync JSON-mode completion with the same retry policy and disk cache as _acall_llm.
+    The reply is streamed and the stream closed once the JSON object is complete.
+    Returns {} on failure so callers fall back to "N/A" instead of crashing.
+    """
+    try:
+        for attempt in range(LLM_MAX_ATTEMPTS):
+            try:
+                stream = client.chat.completions.create(
+                    model=model,
+                    response_format={"type": "json_object"},
+                    messages=[
+                        {"role": "system", "content": system},
+                        {"role": "user", "content": prompt}
+                    ],
+                    temperature=0,
+                    max_tokens=max_tokens,
+                    stream=True
+                )
+                parts = []
+                end = _JsonObjectEnd()
+                with stream:
+                    for chunk in stream:
+                        if chunk.choices and chunk.choices[0].delta.content:
+                            parts.append(chunk.choices[0].delta.content)
+                            if end.feed(chunk.choices[0].delta.content):
+                                break
+                return _safe_json_from_llm("".join(parts))
+            except LLM_RETRYABLE as e:
+                if attempt == LLM_MAX_ATTEMPTS - 1:
+                    raise
+                wait = _backoff(attempt)
+                logger.warning(f"[{label}] Retry {attempt+1}: waiting {wait:.1f}s ({e})")
+                time.sleep(wait)
+    except Exception as e:
+        logger.error(f"[{label}] LLM error: {e}")
+        return {}
+
+def _call_llm_fused(prompts: Dict[str, str], *, system: str, model: str, max_tokens: int, label: str = "LLM", lang: Lang = None,
+                    shared_context: str = "", shared_tasks: Tuple[str, ...] = ()) -> Dict[str, dict]:
+    """
+    Answer several independent task prompts in one request, as {"<task>": {...}, ...}.
+    Falls back to one _call_llm per task when the combined prompt does not fit the
+    model window or the fused reply is missing a task. `max_tokens` is per task.
+    `shared_context` is report text read by every task in `shared_tasks`; it is sent
+    once after the tasks rather than inside each of their prompts.
+    """
+    fused = build_multi_task_prompt(prompts, lang or TARGET_LANGUAGE, shared_context, shared_tasks)
+    if _fits_window(fused, model, max_tokens * len(prompts)):
+        result = _call_llm(fused, system=system, model=model, max_tokens=max_tokens * len(prompts), label=label)
+        by_task = {task: result.get(task) for task in prompts}
+        if all(isinstance(r, dict) for r in by_task.values()):
+            return by_task
+    return {
+        task: _call_llm(f"{prompt}\n\n{shared_context}" if task in shared_tasks else prompt,
+                        system=system, model=model, max_tokens=max_tokens, label=f"{label} {task}")
+        for task, prompt in prompts.items()
+    }
+
+def _call_llm_years(prompts: Dict[int, str], *, system: str, model: str, max_tokens: int = 2000) -> Dict[int, dict]:
+    """
+    Run one JSON-mode completion per year on a small thread pool.
+    The sync client releases the GIL while waiting on the network, so the
+    per-year requests overlap. Failed years come back as {}.
+    """
+    def _run_one(item):
+        year, prompt = item
+        result = _call_llm(prompt, system=system, model=model, max_tokens=max_tokens, label=str(year))
+        if result:
+            logger.info(f"✓ Successfully extracted from {year} report")
+        else:
+            logger.error(f"✗ Error extracting from {year} report")
+        return year, result
+
+    with ThreadPoolExecutor(max_workers=len(prompts) or 1) as ex:
+        return dict(ex.map(_run_one, prompts.items()))
 
 def to_zh_currency(code: str, trad: bool = False) -> str:
     """
@@ -433,6 +1117,10 @@ def fill_missing_balance_sheet_values(balance_data):
     years = [y for y in ("2024", "2023", "2022") if y in balance_data]
 
     for year in years:
+        # Nothing to derive when every field in the identities is already filled
+        if not any(is_missing(balance_data[year].get(f)) for f in F.values()):
+            continue
+
         # We’ll iterate until a full pass makes no changes
         changed = True
         while changed:
@@ -490,66 +1178,62 @@ def fill_missing_balance_sheet_values(balance_data):
 
 # ===================== S1.1: Basic Information with FAISS Search =====================
 
-def extract_s1_1(md_file_2024: str, top_k: int = 10, model: str = "gpt-4.1-mini"):
+def extract_s1_1(md_file_2024: str, top_k: int = 10, model: str = "gpt-4.1-mini", lang: Lang = None):
 
-    lang_key = TARGET_LANGUAGE.value
+    lang = lang or TARGET_LANGUAGE
+    lang_key = lang.value
     search_queries = get_queries("s1_1", lang_key)
-    print(search_queries)
+    logger.debug(search_queries)
     context = retrieve_relevant_text(search_queries, top_k, md_file_2024)
-    prompt = build_s1_1_prompt(context, TARGET_LANGUAGE)
+    prompt = build_s1_1_prompt(context, lang)
     
-    try:
-        response = client.chat.completions.create(
-            model=model,
-            response_format={"type": "json_object"},
-            messages=[
-                {"role": "system", "content": "You are a precise information extractor. Extract only what's explicitly stated in the text."},
-                {"role": "user", "content": prompt}
-            ],
-            temperature=0,
-            max_tokens=600
-        )
-        result = _safe_json_from_llm(response.choices[0].message.content)
-        return (
-            _normalize_na(result.get("company_name", "N/A")),
-            _normalize_na(result.get("establishment_date", "N/A")),
-            _normalize_na(result.get("headquarters", "N/A"))
-        )
-    except:
-        return ("N/A", "N/A", "N/A")
+    result = _call_llm(
+        prompt,
+        system="You are a precise information extractor. Extract only what's explicitly stated in the text.",
+        model=model,
+        max_tokens=600,
+        label="S1.1",
+    )
+    return (
+        _normalize_na(result.get("company_name", "N/A")),
+        _normalize_na(result.get("establishment_date", "N/A")),
+        _normalize_na(result.get("headquarters", "N/A"))
+    )
 
 
 # ===================== S1.2: Core Competencies with FAISS Search =====================
 
-def extract_s1_2(md_file: str, top_k: int, year: int, model: str = "gpt-4.1-mini"):
+def extract_s1_2(md_file: str, top_k: int, year: int, model: str = "gpt-4.1-mini", lang: Lang = None):
 
-    lang_key = TARGET_LANGUAGE.value
+    lang = lang or TARGET_LANGUAGE
+    lang_key = lang.value
     search_queries = get_queries("s1_2", lang_key)
     context = retrieve_relevant_text(search_queries, top_k, md_file)
-    prompt = build_s1_2_prompt(context, year, TARGET_LANGUAGE)    
+    prompt = build_s1_2_prompt(context, year, lang)    
     
-    try:
-        response = client.chat.completions.create(
-            model=model,
-            response_format={"type": "json_object"},
-            messages=[
-                {"role": "system", "content": f"Extract core competencies for {year}. Be specific and factual."},
-                {"role": "user", "content": prompt}
-            ],
-            temperature=0,
-            max_tokens=1500
-        )
-        content = response.choices[0].message.content
-        
-        return _safe_json_from_llm(content)
-    
-    except Exception as e:
-        return {
-            "Innovation Advantages": "N/A",
-            "Product Advantages": "N/A",
-            "Brand Recognition": "N/A",
-            "Reputation Ratings": "N/A"
-        }
+    result = _call_llm(
+        prompt,
+        system=f"Extract core competencies for {year}. Be specific and factual.",
+        model=model,
+        max_tokens=1500,
+        label=f"S1.2 {year}",
+    )
+    return result or {
+        "Innovation Advantages": "N/A",
+        "Product Advantages": "N/A",
+        "Brand Recognition": "N/A",
+        "Reputation Ratings": "N/A"
+    }
+
+def extract_s1_2_years(md_file_2024: str, md_file_2023: str, top_k: int, model: str = "gpt-4.1-mini", lang: Lang = None) -> dict:
+    """
+    Run S1.2 for both years at once (retrieval and LLM call each) and merge.
+    Both are network-bound, so two threads roughly halve the section's wall-clock.
+    """
+    with ThreadPoolExecutor(max_workers=2) as ex:
+        f_2024 = ex.submit(extract_s1_2, md_file_2024, top_k, 2024, model, lang)
+        f_2023 = ex.submit(extract_s1_2, md_file_2023, top_k, 2023, model, lang)
+        return merge_core_competencies(f_2024.result(), f_2023.result())
 
 def merge_core_competencies(comp_2024: dict, comp_2023: dict) -> dict:
     """
@@ -563,90 +1247,44 @@ def merge_core_competencies(comp_2024: dict, comp_2023: dict) -> dict:
         }
     return merged
 
-def extract_s1_3(md_file_2024: str, top_k: int, model: str = "gpt-4.1-mini"):
+def extract_s1_3(md_file_2024: str, top_k: int, model: str = "gpt-4.1-mini", lang: Lang = None):
         
-    lang_key = TARGET_LANGUAGE.value
+    lang = lang or TARGET_LANGUAGE
+    lang_key = lang.value
     search_queries = get_queries("s1_3", lang_key)
     context = retrieve_relevant_text(search_queries, top_k, md_file_2024)
-    prompt = build_s1_3_prompt(context, TARGET_LANGUAGE)
+    prompt = build_s1_3_prompt(context, lang)
 
-    try:
-        response = client.chat.completions.create(
-            model=model,
-            response_format={"type": "json_object"},
-            messages=[
-                {"role": "system", "content": "Extract exactly what is requested. Return valid JSON only."},
-                {"role": "user", "content": prompt}
-            ],
-            temperature=0,
-            max_tokens=800
-        )
-        
-        result = _safe_json_from_llm(response.choices[0].message.content)
-        
-        return {
-            "mission": _normalize_na(result.get("mission", "N/A")),
-            "vision": _normalize_na(result.get("vision", "N/A")),
-            "core_values": _normalize_na(result.get("core_values", "N/A"))
-        }
-        
-    except Exception as e:
-        print(f"Error in extract_mission_vision_with_rag: {e}")
-        return {
-            "mission": "N/A",
-            "vision": "N/A", 
-            "core_values": "N/A"
-        }
+    result = _call_llm(
+        prompt,
+        system="Extract exactly what is requested. Return valid JSON only.",
+        model=model,
+        max_tokens=800,
+        label="S1.3",
+    )
+    return {
+        "mission": _normalize_na(result.get("mission", "N/A")),
+        "vision": _normalize_na(result.get("vision", "N/A")),
+        "core_values": _normalize_na(result.get("core_values", "N/A"))
+    }
 
 # ===================== Section 2: Financial Statements with FAISS Search =====================
         
-def extract_s2_1(md_file_2024: str, md_file_2023: str, top_k: int, model: str = "gpt-4.1-mini"):
+def extract_s2_1(md_file_2024: str, md_file_2023: str, top_k: int, model: str = "gpt-4.1-mini", lang: Lang = None):
         
-    lang_key = TARGET_LANGUAGE.value
+    lang = lang or TARGET_LANGUAGE
+    lang_key = lang.value
     search_queries = get_queries("s2_1", lang_key)
     
     context_2024 = retrieve_relevant_text(search_queries, top_k, md_file_2024)
-    prompt_2024 = build_s2_1_prompt(context_2024, 2024, TARGET_LANGUAGE)
+    prompt_2024 = build_s2_1_prompt(context_2024, 2024, lang)
     
     context_2023 = retrieve_relevant_text(search_queries, top_k, md_file_2023)
-    prompt_2023 = build_s2_1_prompt(context_2023, 2023, TARGET_LANGUAGE)
-
-    result_2024 = None
-    result_2023 = None
+    prompt_2023 = build_s2_1_prompt(context_2023, 2023, lang)
 
-    try:
-        response_2024 = client.chat.completions.create(
-            model=model,
-            response_format={"type": "json_object"},
-            messages=[
-                {"role": "system", "content": "You are a financial data extraction expert. Extract exact values from financial statements. Return valid JSON only."},
-                {"role": "user", "content": prompt_2024}
-            ],
-            temperature=0,
-            max_tokens=2000
-        )
-        result_2024 = _safe_json_from_llm(response_2024.choices[0].message.content)
-        print(f"✓ Successfully extracted from 2024 report")
-    except Exception as e:
-        print(f"✗ Error extracting from 2024 report: {e}")
-        result_2024 = {}
-
-    try:
-        response_2023 = client.chat.completions.create(
-            model=model,
-            response_format={"type": "json_object"},
-            messages=[
-                {"role": "system", "content": "You are a financial data extraction expert. Extract exact values from financial statements. Return valid JSON only."},
-                {"role": "user", "content": prompt_2023}
-            ],
-            temperature=0,
-            max_tokens=2000
-        )
-        result_2023 = _safe_json_from_llm(response_2023.choices[0].message.content)
-        print(f"✓ Successfully extracted from 2023 report")
-    except Exception as e:
-        print(f"✗ Error extracting from 2023 report: {e}")
-        result_2023 = {}
+    system = "You are a financial data extraction expert. Extract exact values from financial statements. Return valid JSON only."
+    results = _call_llm_years({2024: prompt_2024, 2023: prompt_2023}, system=system, model=model, max_tokens=2000)
+    result_2024, result_2023 = results[2024], results[2023]
 
         
     def _merge_year_data(primary_data, fallback_data):
@@ -728,53 +1366,26 @@ def extract_s2_1(md_file_2024: str, md_file_2023: str, top_k: int, model: str =
     }
     
     
-def extract_s2_2(md_file_2024: str, md_file_2023: str, top_k: int, model: str):
+_S2_2_SYSTEM = "You are a financial data extraction expert. Extract exact values from balance sheet statements. Return valid JSON only."
 
-    lang_key = TARGET_LANGUAGE.value
-    search_queries = get_queries("s2_2", lang_key)
-    context_2024 = retrieve_relevant_text(search_queries, top_k, md_file_2024)
-    context_2023 = retrieve_relevant_text(search_queries, top_k, md_file_2023)
-    
-    prompt_2024 = build_s2_2_prompt(context_2024, 2024, CURRENCY_CODE, MULTIPLIER, TARGET_LANGUAGE)
-    prompt_2023 = build_s2_2_prompt(context_2023, 2023, CURRENCY_CODE, MULTIPLIER, TARGET_LANGUAGE)
-    
-    result_2024 = None
-    result_2023 = None
-    
-    try:
-        response = client.chat.completions.create(
-            model=model,
-            response_format={"type": "json_object"},
-            messages=[
-                {"role": "system", "content": "You are a financial data extraction expert. Extract exact values from balance sheet statements. Return valid JSON only."},
-                {"role": "user", "content": prompt_2024}
-            ],
-            temperature=0,
-            max_tokens=2000
-        )
-        result_2024 = _safe_json_from_llm(response.choices[0].message.content)
-        print(f"✓ Successfully extracted from 2024 report")
-    except Exception as e:
-        print(f"✗ Error extracting from 2024 report: {e}")
-        result_2024 = {}
+def _year_contexts(search_queries, top_k: int, md_file_2024: str, md_file_2023: str) -> Dict[int, str]:
+    return {
+        2024: retrieve_relevant_text(search_queries, top_k, md_file_2024),
+        2023: retrieve_relevant_text(search_queries, top_k, md_file_2023),
+    }
 
-    try:
-        response = client.chat.completions.create(
-            model=model,
-            response_format={"type": "json_object"},
-            messages=[
-                {"role": "system", "content": "You are a financial data extraction expert. Extract exact values from balance sheet statements. Return valid JSON only."},
-                {"role": "user", "content": prompt_2023}
-            ],
-            temperature=0,
-            max_tokens=2000
-        )
-        result_2023 = _safe_json_from_llm(response.choices[0].message.content)
-        print(f"✓ Successfully extracted from 2023 report")
-    except Exception as e:
-        print(f"✗ Error extracting from 2023 report: {e}")
-        result_2023 = {}
+def _s2_2_prompts(contexts: Dict[int, str], lang: Lang) -> Dict[int, str]:
+    return {year: build_s2_2_prompt(context, year, CURRENCY_CODE, MULTIPLIER, lang) for year, context in contexts.items()}
 
+def extract_s2_2(md_file_2024: str, md_file_2023: str, top_k: int, model: str, lang: Lang = None):
+    lang = lang or TARGET_LANGUAGE
+    contexts = _year_contexts(get_queries("s2_2", lang.value), top_k, md_file_2024, md_file_2023)
+    prompts = _s2_2_prompts(contexts, lang)
+    results = _call_llm_years(prompts, system=_S2_2_SYSTEM, model=model, max_tokens=2000)
+    return _s2_2_result(results[2024], results[2023])
+
+def _s2_2_result(result_2024: dict, result_2023: dict) -> dict:
+    """Merge the per-report S2.2 answers into one balance sheet for 2024-2022."""
     def _merge_year_data(primary_data, fallback_data):
         if not primary_data:
             return fallback_data or {}
@@ -853,54 +1464,21 @@ def extract_s2_2(md_file_2024: str, md_file_2023: str, top_k: int, model: str):
     }
     
 
-def extract_s2_3(md_file_2024: str, md_file_2023: str, top_k: int, model: str = "gpt-4.1-mini"):
+_S2_3_SYSTEM = "You are a financial data extraction expert. Extract exact values from financial statements. Return valid JSON only."
 
-    lang_key = TARGET_LANGUAGE.value
-    search_queries = get_queries("s2_3", lang_key)
-    
-    context_2024 = retrieve_relevant_text(search_queries, top_k, md_file_2024)
-    context_2023 = retrieve_relevant_text(search_queries, top_k, md_file_2023)
-    
-    prompt_2024 = build_s2_3_prompt(context_2024, 2024, CURRENCY_CODE, MULTIPLIER, TARGET_LANGUAGE=lang_key)
-    prompt_2023 = build_s2_3_prompt(context_2023, 2023, CURRENCY_CODE, MULTIPLIER, TARGET_LANGUAGE=lang_key)
+def _s2_3_prompts(contexts: Dict[int, str], lang: Lang) -> Dict[int, str]:
+    lang_key = lang.value
+    return {year: build_s2_3_prompt(context, year, CURRENCY_CODE, MULTIPLIER, TARGET_LANGUAGE=lang_key) for year, context in contexts.items()}
 
-    result_2024 = None
-    result_2023 = None
-    
-    try:
-        response_2024 = client.chat.completions.create(
-            model=model,
-            response_format={"type": "json_object"},
-            messages=[
-                {"role": "system", "content": "You are a financial data extraction expert. Extract exact values from financial statements. Return valid JSON only."},
-                {"role": "user", "content": prompt_2024}
-            ],
-            temperature=0,
-            max_tokens=2000
-        )
-        result_2024 = _safe_json_from_llm(response_2024.choices[0].message.content)
-        print(f"✓ Successfully extracted from 2024 report")
-    except Exception as e:
-        print(f"✗ Error extracting from 2024 report: {e}")
-        result_2024 = {}
+def extract_s2_3(md_file_2024: str, md_file_2023: str, top_k: int, model: str = "gpt-4.1-mini", lang: Lang = None):
+    lang = lang or TARGET_LANGUAGE
+    contexts = _year_contexts(get_queries("s2_3", lang.value), top_k, md_file_2024, md_file_2023)
+    prompts = _s2_3_prompts(contexts, lang)
+    results = _call_llm_years(prompts, system=_S2_3_SYSTEM, model=model, max_tokens=2000)
+    return _s2_3_result(results[2024], results[2023])
 
-    try:
-        response_2023 = client.chat.completions.create(
-            model=model,
-            response_format={"type": "json_object"},
-            messages=[
-                {"role": "system", "content": "You are a financial data extraction expert. Extract exact values from financial statements. Return valid JSON only."},
-                {"role": "user", "content": prompt_2023}
-            ],
-            temperature=0,
-            max_tokens=2000
-        )
-        result_2023 = _safe_json_from_llm(response_2023.choices[0].message.content)
-        print(f"✓ Successfully extracted from 2023 report")
-    except Exception as e:
-        print(f"✗ Error extracting from 2023 report: {e}")
-        result_2023 = {}
-        
+def _s2_3_result(result_2024: dict, result_2023: dict) -> dict:
+    """Merge the per-report S2.3 answers into one cash flow statement for 2024-2022."""
     def _merge_year_data(primary_data, fallback_data):
         """
         Merge year data field-by-field.
@@ -1058,52 +1636,52 @@ def extract_s2_4(report):
             return None
         return (a + b) / 2
 
-    for year in ["2024", "2023", "2022"]:
+    for year, attr in _YEAR_ATTRS:
         # Income
-        rev  = to_float(getattr(inc.revenue, f"year_{year}", None))
-        cogs = to_float(getattr(inc.cost_of_goods_sold, f"year_{year}", None))
+        rev  = to_float(getattr(inc.revenue, attr, None))
+        cogs = to_float(getattr(inc.cost_of_goods_sold, attr, None))
         if cogs is not None:
             cogs = abs(cogs)
 
-        op_inc = to_float(getattr(inc.operating_income, f"year_{year}", None))
-        net_inc = to_float(getattr(inc.net_profit, f"year_{year}", None))
-        interest = to_float(getattr(inc.interest_expense, f"year_{year}", None))
+        op_inc = to_float(getattr(inc.operating_income, attr, None))
+        net_inc = to_float(getattr(inc.net_profit, attr, None))
+        interest = to_float(getattr(inc.interest_expense, attr, None))
         if interest is not None:
             interest = abs(interest)
 
-        tax_exp = to_float(getattr(inc.income_tax_expense, f"year_{year}", None))  # keep sign
-        inc_before_tax = to_float(getattr(inc.income_before_income_taxes, f"year_{year}", None))
+        tax_exp = to_float(getattr(inc.income_tax_expense, attr, None))  # keep sign
+        inc_before_tax = to_float(getattr(inc.income_before_income_taxes, attr, None))
 
         # Balance
-        curr_assets = to_float(getattr(bal.current_assets, f"year_{year}", None))
-        curr_liab   = to_float(getattr(bal.current_liabilities, f"year_{year}", None))
+        curr_assets = to_float(getattr(bal.current_assets, attr, None))
+        curr_liab   = to_float(getattr(bal.current_liabilities, attr, None))
         if curr_liab is not None:
             curr_liab = abs(curr_liab)
 
-        invent  = to_float(getattr(bal.inventories, f"year_{year}", None))
-        prepaid = to_float(getattr(bal.prepaid_expenses, f"year_{year}", None))
+        invent  = to_float(getattr(bal.inventories, attr, None))
+        prepaid = to_float(getattr(bal.prepaid_expenses, attr, None))
 
         if invent is None or prepaid is None or curr_assets is None:
             quick_ratio = None
         else:
             quick_ratio = safe_div(curr_assets - invent - prepaid, curr_liab)
 
-        total_assets = to_float(getattr(bal.total_assets, f"year_{year}", None))
-        total_liab   = to_float(getattr(bal.total_liabilities, f"year_{year}", None))
+        total_assets = to_float(getattr(bal.total_assets, attr, None))
+        total_liab   = to_float(getattr(bal.total_liabilities, attr, None))
         if total_liab is not None:
             total_liab = abs(total_liab)
 
-        equity = to_float(getattr(bal.shareholders_equity, f"year_{year}", None))
+        equity = to_float(getattr(bal.shareholders_equity, attr, None))
 
         # Cash flow
-        divs = to_float(getattr(cf.dividends, f"year_{year}", None))
+        divs = to_float(getattr(cf.dividends, attr, None))
         if divs is not None:
             divs = abs(divs)
 
         # Averages (use previous year)
-        prev_year = str(int(year) - 1)
-        total_assets_prev = getattr(bal.total_assets, f"year_{prev_year}", None)
-        equity_prev       = getattr(bal.shareholders_equity, f"year_{prev_year}", None)
+        prev_attr = _PREV_YEAR_ATTRS[year]
+        total_assets_prev = getattr(bal.total_assets, prev_attr, None)
+        equity_prev       = getattr(bal.shareholders_equity, prev_attr, None)
 
         total_assets_prev = to_float(total_assets_prev) if total_assets_prev is not None else None
         equity_prev       = to_float(equity_prev)       if equity_prev is not None       else None
@@ -1126,18 +1704,18 @@ def extract_s2_4(report):
         payout_ratio     = safe_div(divs, net_inc)
 
         # --- Assign as PERCENT STRINGS (parentheses for negatives) ---
-        setattr(km.gross_margin,          f"year_{year}", pct(gross_margin))
-        setattr(km.operating_margin,      f"year_{year}", pct(op_margin))
-        setattr(km.net_profit_margin,     f"year_{year}", pct(net_margin))
-        setattr(km.current_ratio,         f"year_{year}", pct(curr_ratio))
-        setattr(km.quick_ratio,           f"year_{year}", pct(quick_ratio))
-        setattr(km.interest_coverage,     f"year_{year}", pct(interest_coverage))
-        setattr(km.asset_turnover,        f"year_{year}", pct(asset_turnover))
-        setattr(km.debt_to_equity,        f"year_{year}", pct(debt_to_equity))
-        setattr(km.return_on_equity,      f"year_{year}", pct(roe))
-        setattr(km.return_on_assets,      f"year_{year}", pct(roa))
-        setattr(km.effective_tax_rate,    f"year_{year}", pct(eff_tax_rate))
-        setattr(km.dividend_payout_ratio, f"year_{year}", pct(payout_ratio))
+        setattr(km.gross_margin,          attr, pct(gross_margin))
+        setattr(km.operating_margin,      attr, pct(op_margin))
+        setattr(km.net_profit_margin,     attr, pct(net_margin))
+        setattr(km.current_ratio,         attr, pct(curr_ratio))
+        setattr(km.quick_ratio,           attr, pct(quick_ratio))
+        setattr(km.interest_coverage,     attr, pct(interest_coverage))
+        setattr(km.asset_turnover,        attr, pct(asset_turnover))
+        setattr(km.debt_to_equity,        attr, pct(debt_to_equity))
+        setattr(km.return_on_equity,      attr, pct(roe))
+        setattr(km.return_on_assets,      attr, pct(roa))
+        setattr(km.effective_tax_rate,    attr, pct(eff_tax_rate))
+        setattr(km.dividend_payout_ratio, attr, pct(payout_ratio))
 
 
 
@@ -1148,7 +1726,7 @@ def merge_revenue_dicts(data_2024: dict, data_2023: dict) -> dict:
     - If a 2024 field is "N/A", use 2023's corresponding field
     """
     merged = {}
-    for year in ["2024", "2023", "2022"]:
+    for year in _REPORT_YEARS:
         merged.setdefault(year, {})
         for field in ["revenue_by_product_service", "revenue_by_region"]:
             v2024 = data_2024.get(year, {}).get(field, "N/A")
@@ -1159,45 +1737,58 @@ def merge_revenue_dicts(data_2024: dict, data_2023: dict) -> dict:
                 merged[year][field] = v2024
     return merged
 
-def extract_s2_5(md_file_2024: str, md_file_2023: str, top_k: int = 15, model: str = "gpt-4.1-mini"):
+_S2_5_SYSTEM = "You are a precise financial data extractor. Return only JSON."
 
-    lang_key = TARGET_LANGUAGE.value
-    search_queries = get_queries("s2_5", lang_key)
-    context_2024 = retrieve_relevant_text(search_queries, top_k, md_file_2024)
-    context_2023 = retrieve_relevant_text(search_queries, top_k, md_file_2023)
-    
-    prompt_2024 = build_s2_5_prompt(context_2024, COMPANY_NAME, TARGET_LANGUAGE)
-    prompt_2023 = build_s2_5_prompt(context_2023, COMPANY_NAME, TARGET_LANGUAGE)
-    
-    response_2024 = client.chat.completions.create(
-        model=model,
-        response_format={"type": "json_object"},
-        messages=[
-            {"role": "system", "content": "You are a precise financial data extractor. Return only JSON."},
-            {"role": "user", "content": prompt_2024}
-        ],
-        temperature=0
-    )
+def _s2_5_prompts(contexts: Dict[int, str], lang: Lang) -> Dict[int, str]:
+    return {year: build_s2_5_prompt(context, COMPANY_NAME, lang) for year, context in contexts.items()}
 
-    response_2023 = client.chat.completions.create(
-        model=model,
-        response_format={"type": "json_object"},
-        messages=[
-            {"role": "system", "content": "You are a precise financial data extractor. Return only JSON."},
-            {"role": "user", "content": prompt_2023}
-        ],
-        temperature=0
-    )
+def extract_s2_5(md_file_2024: str, md_file_2023: str, top_k: int = 15, model: str = "gpt-4.1-mini", lang: Lang = None):
+    lang = lang or TARGET_LANGUAGE
+    contexts = _year_contexts(get_queries("s2_5", lang.value), top_k, md_file_2024, md_file_2023)
+    prompts = _s2_5_prompts(contexts, lang)
+    results = _call_llm_years(prompts, system=_S2_5_SYSTEM, model=model, max_tokens=2000)
+    return merge_revenue_dicts(results[2024], results[2023])
 
-    data_2024 = _safe_json_from_llm(response_2024.choices[0].message.content)
-    data_2023 = _safe_json_from_llm(response_2023.choices[0].message.content)
-    # print(f"DEBUG - S2.5 2024 extraction result: {data_2024}")
-    merged = merge_revenue_dicts(data_2024, data_2023)
-    return merged
+def extract_s2_combined(md_file_2024: str, md_file_2023: str, model: str = "gpt-4.1-mini", lang: Lang = None,
+                        top_k_s2_2: int = 20, top_k_s2_3: int = 12, top_k_s2_5: int = 20):
+    """
+    S2.2, S2.3 and S2.5 with one LLM request per report year instead of three
+    (see _call_llm_fused). The balance sheet and cash flow statement come from the
+    same financial statement pages, so each query set is retrieved at its own top_k
+    and the de-duplicated union is sent once per request for both tasks.
+    Returns (balance_data, cashflow_data, operating_perf), each shaped exactly as
+    extract_s2_2 / extract_s2_3 / extract_s2_5 return it.
+    """
+    lang = lang or TARGET_LANGUAGE
+    statement_queries = [(get_queries("s2_2", lang.value), top_k_s2_2), (get_queries("s2_3", lang.value), top_k_s2_3)]
+    operating_queries = get_queries("s2_5", lang.value)
+
+    # Each year retrieves and sends its own request on its own thread, so the
+    # two reports' retrievals overlap and neither request waits for the other
+    def _run_year(year, md_file):
+        statements = retrieve_union_text(statement_queries, md_file)
+        operating = retrieve_relevant_text(operating_queries, top_k_s2_5, md_file)
+        tasks = {
+            "balance_sheet": _s2_2_prompts({year: ""}, lang)[year],
+            "cash_flow": _s2_3_prompts({year: ""}, lang)[year],
+            "operating_performance": _s2_5_prompts({year: operating}, lang)[year],
+        }
+        return year, _call_llm_fused(tasks, system=_S2_3_SYSTEM, model=model, max_tokens=2000, label=f"S2.2-S2.5 {year}", lang=lang,
+                                     shared_context=statements, shared_tasks=("balance_sheet", "cash_flow"))
+
+    with ThreadPoolExecutor(max_workers=2) as ex:
+        results = dict(ex.map(_run_year, (2024, 2023), (md_file_2024, md_file_2023)))
+    r24, r23 = results[2024], results[2023]
+    return (
+        _s2_2_result(r24["balance_sheet"], r23["balance_sheet"]),
+        _s2_3_result(r24["cash_flow"], r23["cash_flow"]),
+        merge_revenue_dicts(r24["operating_performance"], r23["operating_performance"]),
+    )
 
 # ===================== Section 3: Business Analysis =====================  
           
-def extract_s3_1(report, model: str = "gpt-4.1-mini"):
+async def extract_s3_1_async(report, model: str = "gpt-4.1-mini", sem: asyncio.Semaphore = None, lang: Lang = None):
+    lang = lang or TARGET_LANGUAGE
     
     inc = report.income_statement
     bal = report.balance_sheet
@@ -1241,37 +1832,93 @@ def extract_s3_1(report, model: str = "gpt-4.1-mini"):
         
         """
     
-    prompt = build_s3_1_prompt(financial_context, COMPANY_NAME, multiplier, currency, TARGET_LANGUAGE)
+    prompt = build_s3_1_prompt(financial_context, COMPANY_NAME, multiplier, currency, lang)
     
-    try:
-        response = client.chat.completions.create(
-            model=model,
-            response_format={"type": "json_object"},
-            messages=[
-                {"role": "system", "content": "You are an expert financial analyst. Analyze only the provided data and provide insightful business interpretations. Return valid JSON only."},
-                {"role": "user", "content": prompt}
-            ],
-            temperature=0,
-            max_tokens=2000
-        )
-        
-        result = _safe_json_from_llm(response.choices[0].message.content)
-        
-        return {
-            "revenue_direct_cost_dynamics": _normalize_na(result.get("revenue_direct_cost_dynamics", "N/A")),
-            "operating_efficiency": _normalize_na(result.get("operating_efficiency", "N/A")),
-            "external_oneoff_impact": _normalize_na(result.get("external_oneoff_impact", "N/A"))
-        }
+    result = await _acall_llm(
+        prompt,
+        system="You are an expert financial analyst. Analyze only the provided data and provide insightful business interpretations. Return valid JSON only.",
+        model=model,
+        max_tokens=_max_tokens("s3_1", lang),
+        sem=sem,
+        lang=lang,
+        label="S3.1",
+        response_format=_S3_1_FORMAT,
+    )
         
-    except Exception as e:
-        print(f"Error in extract_s3_1: {e}")
+    n = _normalize_na
+    return {k: n(result.get(k, "N/A")) for k in _S3_1_KEYS}
+
+def extract_s3_1(report, model: str = "gpt-4.1-mini"):
+    return _run_async(extract_s3_1_async(report, model=model))
         
 
-def build_financial_context_s3_2(report, year: int):
+def _has_year_data(report, year: int) -> bool:
+    """True if any headline figure for `year` was extracted in Section 2."""
+    attr = f"year_{year}"
+    probes = (
+        report.income_statement.revenue,
+        report.income_statement.net_profit,
+        report.balance_sheet.total_assets,
+    )
+    return any(getattr(p, attr, "N/A") not in ("N/A", None, "") for p in probes)
+
+def _has_markdown(md_file: str) -> bool:
+    path = Path(f"data/parsed/{md_file}.md")
+    return path.is_file() and path.stat().st_size > 0
+
+async def _no_llm_call():
+    """Stand-in for a skipped year inside asyncio.gather; returns an empty result."""
+    return {}
+
+# (label, attribute) pairs rendered into the S3.2 context, per statement
+_S3_2_INC_FIELDS = (
+    ("Revenue", "revenue"),
+    ("Cost of Goods Sold", "cost_of_goods_sold"),
+    ("Gross Profit", "gross_profit"),
+    ("Operating Expense", "operating_expense"),
+    ("Operating Income", "operating_income"),
+    ("Net Profit", "net_profit"),
+    ("Income Before Taxes", "income_before_income_taxes"),
+    ("Income Tax Expense", "income_tax_expense"),
+    ("Interest Expense", "interest_expense"),
+)
+_S3_2_BAL_FIELDS = (
+    ("Total Assets", "total_assets"),
+    ("Current Assets", "current_assets"),
+    ("Non-Current Assets", "non_current_assets"),
+    ("Total Liabilities", "total_liabilities"),
+    ("Current Liabilities", "current_liabilities"),
+    ("Non-Current Liabilities", "non_current_liabilities"),
+    ("Shareholders' Equity", "shareholders_equity"),
+    ("Retained Earnings", "retained_earnings"),
+    ("Inventories", "inventories"),
+)
+_S3_2_CF_FIELDS = (
+    ("Net Cash from Operations", "net_cash_from_operations"),
+    ("Net Cash from Investing", "net_cash_from_investing"),
+    ("Net Cash from Financing", "net_cash_from_financing"),
+    ("Net Increase/Decrease in Cash", "net_increase_decrease_cash"),
+    ("Dividends", "dividends"),
+)
+_S3_2_METRIC_FIELDS = (
+    ("Gross Margin", "gross_margin"),
+    ("Operating Margin", "operating_margin"),
+    ("Net Profit Margin", "net_profit_margin"),
+    ("Current Ratio", "current_ratio"),
+    ("Debt to Equity", "debt_to_equity"),
+    ("Return on Equity", "return_on_equity"),
+    ("Return on Assets", "return_on_assets"),
+    ("Effective Tax Rate", "effective_tax_rate"),
+    ("Interest Coverage", "interest_coverage"),
+    ("Asset Turnover", "asset_turnover"),
+)
+
+def build_financial_context_s3_2(report, *target_years: int):
     """
     Build financial context for Section 3.2 Financial Performance Summary.
     For each target year, include its own data and the immediately previous year's data
-    to enable direct year-over-year comparisons.
+    to enable direct year-over-year comparisons. Several target years can share one
+    context, in which case every year they need is rendered once.
     """
 
     inc = report.income_statement
@@ -1280,478 +1927,488 @@ def build_financial_context_s3_2(report, year: int):
     perf = report.operating_performance
     metrics = report.key_financial_metrics
 
-    previous_year = year - 1 if hasattr(inc.revenue, f"year_{year - 1}") else None
-    years_to_include = [y for y in [previous_year, year] if y is not None]
-
-    context = f"""
-    COMPANY: {COMPANY_NAME}
-    CURRENCY: {getattr(inc, 'primary_currency', 'N/A')}
-    MULTIPLIER: {getattr(inc, 'primary_multiplier', 'N/A')}
-    TARGET REPORTING PERIOD: {year}
-    COMPARISON YEARS: {', '.join(map(str, years_to_include))}
-    """
-
-    def line(label, obj):
-        # Include both target and previous year values
-        values = []
-        for y in years_to_include:
-            v = getattr(obj, f"year_{y}", "N/A")
-            values.append(f"{y}: {v}")
-        return f"{label}: {' | '.join(values)}"
-
-    context += f"""
-    INCOME STATEMENT DATA:
-    {line("Revenue", inc.revenue)}
-    {line("Cost of Goods Sold", inc.cost_of_goods_sold)}
-    {line("Gross Profit", inc.gross_profit)}
-    {line("Operating Expense", inc.operating_expense)}
-    {line("Operating Income", inc.operating_income)}
-    {line("Net Profit", inc.net_profit)}
-    {line("Income Before Taxes", inc.income_before_income_taxes)}
-    {line("Income Tax Expense", inc.income_tax_expense)}
-    {line("Interest Expense", inc.interest_expense)}
-
-    BALANCE SHEET DATA:
-    {line("Total Assets", bal.total_assets)}
-    {line("Current Assets", bal.current_assets)}
-    {line("Non-Current Assets", bal.non_current_assets)}
-    {line("Total Liabilities", bal.total_liabilities)}
-    {line("Current Liabilities", bal.current_liabilities)}
-    {line("Non-Current Liabilities", bal.non_current_liabilities)}
-    {line("Shareholders' Equity", bal.shareholders_equity)}
-    {line("Retained Earnings", bal.retained_earnings)}
-    {line("Inventories", bal.inventories)}
-
-    CASH FLOW DATA:
-    {line("Net Cash from Operations", cf.net_cash_from_operations)}
-    {line("Net Cash from Investing", cf.net_cash_from_investing)}
-    {line("Net Cash from Financing", cf.net_cash_from_financing)}
-    {line("Net Increase/Decrease in Cash", cf.net_increase_decrease_cash)}
-    {line("Dividends", cf.dividends)}
-
-    KEY FINANCIAL METRICS:
-    {line("Gross Margin", metrics.gross_margin)}
-    {line("Operating Margin", metrics.operating_margin)}
-    {line("Net Profit Margin", metrics.net_profit_margin)}
-    {line("Current Ratio", metrics.current_ratio)}
-    {line("Debt to Equity", metrics.debt_to_equity)}
-    {line("Return on Equity", metrics.return_on_equity)}
-    {line("Return on Assets", metrics.return_on_assets)}
-    {line("Effective Tax Rate", metrics.effective_tax_rate)}
-    {line("Interest Coverage", metrics.interest_coverage)}
-    {line("Asset Turnover", metrics.asset_turnover)}
-
-    OPERATING PERFORMANCE:
-    Revenue by Product/Service:
-    """ + " | ".join([f"{y}: {getattr(perf.revenue_by_product_service, f'year_{y}', 'N/A')}" for y in years_to_include]) + """
-
-    Revenue by Geographic Region:
-    """ + " | ".join([f"{y}: {getattr(perf.revenue_by_geographic_region, f'year_{y}', 'N/A')}" for y in years_to_include]) + "\n"
+    years_to_include = sorted({
+        y for year in target_years
+        for y in (year - 1, year)
+        if y == year or hasattr(inc.revenue, f"year_{y}")
+    })
+    year_attrs = [(y, f"year_{y}") for y in years_to_include]
+
+    def values(obj) -> str:
+        return " | ".join(f"{y}: {getattr(obj, attr, 'N/A')}" for y, attr in year_attrs)
+
+    def block(title, stmt, fields):
+        return [f"    {title}:"] + [f"    {label}: {values(getattr(stmt, attr))}" for label, attr in fields] + [""]
+
+    parts = [
+        "",
+        f"    COMPANY: {COMPANY_NAME}",
+        f"    CURRENCY: {getattr(inc, 'primary_currency', 'N/A')}",
+        f"    MULTIPLIER: {getattr(inc, 'primary_multiplier', 'N/A')}",
+        f"    TARGET REPORTING PERIOD: {', '.join(map(str, target_years))}",
+        f"    COMPARISON YEARS: {', '.join(map(str, years_to_include))}",
+        "",
+    ]
+    parts += block("INCOME STATEMENT DATA", inc, _S3_2_INC_FIELDS)
+    parts += block("BALANCE SHEET DATA", bal, _S3_2_BAL_FIELDS)
+    parts += block("CASH FLOW DATA", cf, _S3_2_CF_FIELDS)
+    parts += block("KEY FINANCIAL METRICS", metrics, _S3_2_METRIC_FIELDS)
+    parts += [
+        "    OPERATING PERFORMANCE:",
+        "    Revenue by Product/Service:",
+        f"    {values(perf.revenue_by_product_service)}",
+        "",
+        "    Revenue by Geographic Region:",
+        f"    {values(perf.revenue_by_geographic_region)}",
+        "",
+    ]
 
-    return context
+    return "\n".join(parts)
     
-def extract_s3_2(report, model = "gpt-4.1-mini"):
+async def extract_s3_2_async(report, model = "gpt-4.1-mini", sem: asyncio.Semaphore = None, lang: Lang = None):
+    lang = lang or TARGET_LANGUAGE
 
-    financial_context_2024 = build_financial_context_s3_2(report, 2024)
-    financial_context_2023 = build_financial_context_s3_2(report, 2023)
+    # Both years in one request: the shared company data is sent (and billed) once.
+    # A report without any 2023 figures only gets the 2024 analysis; 2023 keys stay N/A.
+    out_years = (2024, 2023)
+    years = out_years if _has_year_data(report, 2023) else (2024,)
+    financial_context = build_financial_context_s3_2(report, *years)
     
     company_name = getattr(report, 'company_name', 'N/A')
     
-    prompt_2024 = build_s3_2_prompt(financial_context_2024, 2024, company_name, TARGET_LANGUAGE.value)
-    prompt_2023 = build_s3_2_prompt(financial_context_2023, 2023, company_name, TARGET_LANGUAGE.value)
-    
-    result = {}
+    prompt = build_s3_2_multi_prompt(financial_context, years, company_name, lang.value)
     
-    try:
-        response_2024 = client.chat.completions.create(
-            model=model,
-            response_format={"type": "json_object"},
-            messages=[
-                {"role": "system", "content": "You are a financial analyst providing comprehensive performance analysis."},
-                {"role": "user", "content": prompt_2024}
-            ],
-            temperature=0.3,
-            max_tokens=2000
-        )
-        data_2024 = _safe_json_from_llm(response_2024.choices[0].message.content)
-        result.update(data_2024)
-    except Exception as e:
-        print(f"Error extracting S3.2 for 2024: {e}")
-    
-    try:
-        response_2023 = client.chat.completions.create(
-            model=model,
-            response_format={"type": "json_object"},
-            messages=[
-                {"role": "system", "content": "You are a financial analyst providing comprehensive performance analysis."},
-                {"role": "user", "content": prompt_2023}
-            ],
-            temperature=0.3,
-            max_tokens=2000
-        )
-        data_2023 = _safe_json_from_llm(response_2023.choices[0].message.content)
-        result.update(data_2023)
-    except Exception as e:
-        print(f"Error extracting S3.2 for 2023: {e}")
-    return result
+    system = "You are a financial analyst providing comprehensive performance analysis."
+    result = await _acall_llm(prompt, system=system, model=model, temperature=0.3, max_tokens=_max_tokens("s3_2", lang) * len(years), sem=sem, lang=lang,
+                              label="S3.2", response_format=_s3_2_format(years))
+    n = _normalize_na
+    return {k: n(result.get(k, "N/A")) for k in (f"{key}_{y}" for y in out_years for key in _S3_2_KEYS)}
+
+def extract_s3_2(report, model = "gpt-4.1-mini"):
+    return _run_async(extract_s3_2_async(report, model=model))
               
-def extract_s3_3(md_file_2024: str, md_file_2023: str, top_k: int = 15, model: str = "gpt-4.1-mini"):
+async def extract_s3_3_async(md_file_2024: str, md_file_2023: str, top_k: int = 15, model: str = "gpt-4.1-mini", sem: asyncio.Semaphore = None, lang: Lang = None):
+    lang = lang or TARGET_LANGUAGE
         
-    lang_key = TARGET_LANGUAGE.value
+    lang_key = lang.value
     search_queries = get_queries("s3_3", lang_key)
-    context_2024 = retrieve_relevant_text(search_queries, top_k, md_file_2024)
-    context_2023 = retrieve_relevant_text(search_queries, top_k, md_file_2023)
-    prompt_2024 = build_s3_3_prompt(context_2024, 2024, TARGET_LANGUAGE)
-    prompt_2023 = build_s3_3_prompt(context_2023, 2023, TARGET_LANGUAGE)
-
-    def _call_llm(prompt: str) -> dict:
-        try:
-            resp = client.chat.completions.create(
-                model=model,
-                response_format={"type": "json_object"},
-                messages=[
-                    {"role": "system", "content": "You are an expert business analyst. Use only the provided context. Return valid JSON only."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0,
-                max_tokens=1200
-            )
-            return _safe_json_from_llm(resp.choices[0].message.content)
-        except Exception as e:
-            print(f"[S3.3] LLM error: {e}")
-            return {}
+    has_2023 = _has_markdown(md_file_2023)
+    context_2024, context_2023 = await asyncio.gather(
+        asyncio.to_thread(retrieve_relevant_text, search_queries, top_k, md_file_2024),
+        asyncio.to_thread(retrieve_relevant_text, search_queries, top_k, md_file_2023) if has_2023 else asyncio.sleep(0, result=""),
+    )
+    # Each context goes in its own message after the instructions
+    messages_2024 = [build_s3_3_prompt("", 2024, lang), _prepare_context(context_2024, model, _max_tokens("s3_3", lang))]
+    messages_2023 = [build_s3_3_prompt("", 2023, lang), _prepare_context(context_2023, model, _max_tokens("s3_3", lang))]
+
+    # 2024 and 2023 are independent requests, so run them concurrently
+    system = "You are an expert business analyst. Use only the provided context. Return valid JSON only."
+    result_2024, result_2023 = await asyncio.gather(
+        _acall_llm(messages_2024, system=system, model=model, max_tokens=_max_tokens("s3_3", lang), sem=sem, lang=lang, label="S3.3 2024", response_format=_S3_3_FORMAT)
+        if _has_context(context_2024) else _no_llm_call(),
+        _acall_llm(messages_2023, system=system, model=model, max_tokens=_max_tokens("s3_3", lang), sem=sem, lang=lang, label="S3.3 2023", response_format=_S3_3_FORMAT)
+        if _has_context(context_2023) else _no_llm_call(),
+    )
 
-    result_2024 = _call_llm(prompt_2024)
-    result_2023 = _call_llm(prompt_2023)
+    return _normalize_years(_S3_3_OUT, {2024: result_2024, 2023: result_2023})
 
-    return {
-        "business_model_2024": _normalize_na(result_2024.get("business_model", "N/A")),
-        "business_model_2023": _normalize_na(result_2023.get("business_model", "N/A")),
-        "market_position_2024": _normalize_na(result_2024.get("market_position", "N/A")),
-        "market_position_2023": _normalize_na(result_2023.get("market_position", "N/A"))
-    }
+def extract_s3_3(md_file_2024: str, md_file_2023: str, top_k: int = 15, model: str = "gpt-4.1-mini"):
+    return _run_async(extract_s3_3_async(md_file_2024, md_file_2023, top_k=top_k, model=model))
 
 # ===================== Section 4: Risk Factors =====================  
         
-def extract_s4_1(md_file_2024: str, md_file_2023: str, top_k: int = 15, model: str = "gpt-4.1-mini"):
+async def extract_s4_1_async(md_file_2024: str, md_file_2023: str, top_k: int = 15, model: str = "gpt-4.1-mini", sem: asyncio.Semaphore = None, lang: Lang = None):
+    lang = lang or TARGET_LANGUAGE
 
-    lang_key = TARGET_LANGUAGE.value
+    lang_key = lang.value
     search_queries = get_queries("s4_1", lang_key)
-    context_2024 = retrieve_relevant_text(search_queries, top_k, md_file_2024)
-    context_2023 = retrieve_relevant_text(search_queries, top_k, md_file_2023)
-    
-    prompt_2024 = build_s4_1_prompt(context_2024, 2024, COMPANY_NAME, TARGET_LANGUAGE)
-    prompt_2023 = build_s4_1_prompt(context_2023, 2023, COMPANY_NAME, TARGET_LANGUAGE)
-    
-    try:
-        response = client.chat.completions.create(
-            model=model,
-            response_format={"type": "json_object"},
-            messages=[
-                {"role": "system", "content": "You are an expert risk analyst. Extract risk factor information from annual reports. Return valid JSON only."},
-                {"role": "user", "content": prompt_2024}
-            ],
-            temperature=0,
-            max_tokens=1500
+    context_2024, context_2023 = await asyncio.gather(
+        asyncio.to_thread(retrieve_relevant_text, search_queries, top_k, md_file_2024),
+        asyncio.to_thread(retrieve_relevant_text, search_queries, top_k, md_file_2023),
     )
-    except Exception as e:
-        print(f"Error in _extract_risk_factors_single_year for {2024}: {e}")
-    result_2024 = _safe_json_from_llm(response.choices[0].message.content)
     
-    try:
-        response = client.chat.completions.create(
-            model=model,
-            response_format={"type": "json_object"},
-            messages=[
-                {"role": "system", "content": "You are an expert risk analyst. Extract risk factor information from annual reports. Return valid JSON only."},
-                {"role": "user", "content": prompt_2023}
-            ],
-            temperature=0,
-            max_tokens=1500
+    # Each context goes in its own message after the instructions
+    messages_2024 = [build_s4_1_prompt("", 2024, COMPANY_NAME, lang), _prepare_context(context_2024, model, _max_tokens("s4_1", lang))]
+    messages_2023 = [build_s4_1_prompt("", 2023, COMPANY_NAME, lang), _prepare_context(context_2023, model, _max_tokens("s4_1", lang))]
+    
+    system = "You are an expert risk analyst. Extract risk factor information from annual reports. Return valid JSON only."
+    result_2024, result_2023 = await asyncio.gather(
+        _acall_llm(messages_2024, system=system, model=model, max_tokens=_max_tokens("s4_1", lang), sem=sem, lang=lang, label="S4.1 2024", response_format=_S4_1_FORMAT)
+        if _has_context(context_2024) else _no_llm_call(),
+        _acall_llm(messages_2023, system=system, model=model, max_tokens=_max_tokens("s4_1", lang), sem=sem, lang=lang, label="S4.1 2023", response_format=_S4_1_FORMAT)
+        if _has_context(context_2023) else _no_llm_call(),
     )
-    except Exception as e:
-        print(f"Error in _extract_risk_factors_single_year for {2023}: {e}")
-    result_2023 = _safe_json_from_llm(response.choices[0].message.content)
     
-    return {
-        "market_risks_2024": _normalize_na(result_2024.get("market_risks", "N/A")),
-        "market_risks_2023": _normalize_na(result_2023.get("market_risks", "N/A")),
-        "operational_risks_2024": _normalize_na(result_2024.get("operational_risks", "N/A")),
-        "operational_risks_2023": _normalize_na(result_2023.get("operational_risks", "N/A")),
-        "financial_risks_2024": _normalize_na(result_2024.get("financial_risks", "N/A")),
-        "financial_risks_2023": _normalize_na(result_2023.get("financial_risks", "N/A")),
-        "compliance_risks_2024": _normalize_na(result_2024.get("compliance_risks", "N/A")),
-        "compliance_risks_2023": _normalize_na(result_2023.get("compliance_risks", "N/A"))
-    }
-            
+    return _normalize_years(_S4_1_OUT, {2024: result_2024, 2023: result_2023})
+
+def extract_s4_1(md_file_2024: str, md_file_2023: str, top_k: int = 15, model: str = "gpt-4.1-mini"):
+    return _run_async(extract_s4_1_async(md_file_2024, md_file_2023, top_k=top_k, model=model))
 
 # ===================== Section 5: Corporate Governance =====================
         
-def extract_s5_1(md_file_2024: str, top_k: int = 15, model: str = "gpt-4.1-mini"):
+async def extract_s5_1_async(md_file_2024: str, top_k: int = 15, model: str = "gpt-4.1-mini", sem: asyncio.Semaphore = None, lang: Lang = None):
+    lang = lang or TARGET_LANGUAGE
     
-    lang_key = TARGET_LANGUAGE.value
+    lang_key = lang.value
     search_queries = get_queries("s5_1", lang_key)
     
-    context_2024 = retrieve_relevant_text(search_queries, top_k, md_file_2024)
+    context_2024 = await asyncio.to_thread(retrieve_relevant_text, search_queries, top_k, md_file_2024)
+    if not _has_context(context_2024):
+        return {"board_members": []}
     
-    prompt_2024 = build_s5_1_prompt(context_2024, TARGET_LANGUAGE)
+    prompt_2024 = build_s5_1_prompt(_prepare_context(context_2024, model, 2000), lang)
 
-    try:
-        response = client.chat.completions.create(
-            model=model,
-            response_format={"type": "json_object"},
-            messages=[
-                {"role": "system", "content": "You are an expert corporate governance analyst. Extract board composition and executive compensation information from annual reports. Return valid JSON only."},
-                {"role": "user", "content": prompt_2024}
-            ],
-            temperature=0,
-            max_tokens=2000
-        )
-        
-        result = _safe_json_from_llm(response.choices[0].message.content)
-    
+    norm = _normalize_na
+
+    def _member(member: dict) -> dict:
+        return {k: norm(member.get(k, "N/A")) for k in _S5_1_MEMBER_KEYS}
+
+    # members are normalized while the rest of the list is still streaming in
+    streamed = _StreamedArrayItems(_member)
+    result = await _acall_llm(
+        prompt_2024,
+        system="You are an expert corporate governance analyst. Extract board composition and executive compensation information from annual reports. Return valid JSON only.",
+        model=model,
+        max_tokens=2000,
+        sem=sem,
+        lang=lang,
+        label="S5.1",
+        response_format=_S5_1_FORMAT,
+        items=streamed,
+    )
+
+    members = result.get("board_members")
+    if not isinstance(members, list):
         board_members = []
-        if "board_members" in result and isinstance(result["board_members"], list):
-            for member in result["board_members"]:
-                if isinstance(member, dict):
-                    board_members.append({
-                        "name": _normalize_na(member.get("name", "N/A")),
-                        "position": _normalize_na(member.get("position", "N/A")),
-                        "total_income": _normalize_na(member.get("total_income", "N/A"))
-                    })
-        
-        return {"board_members": board_members}
-        
-    except Exception as e:
-        print(f"Error in _extract_board_composition: {e}")
+    elif len(streamed.items) == len(members):
+        board_members = streamed.items
+    else:
+        board_members = [_member(m) for m in members if isinstance(m, dict)]
+    
+    return {"board_members": board_members}
 
-def extract_s5_2(md_file_2024: str, md_file_2023: str, top_k: int = 15, model: str = "gpt-4.1-mini"):
+def extract_s5_1(md_file_2024: str, top_k: int = 15, model: str = "gpt-4.1-mini"):
+    return _run_async(extract_s5_1_async(md_file_2024, top_k=top_k, model=model))
 
-    lang_key = TARGET_LANGUAGE.value
+async def extract_s5_2_async(md_file_2024: str, md_file_2023: str, top_k: int = 15, model: str = "gpt-4.1-mini", sem: asyncio.Semaphore = None, lang: Lang = None):
+    lang = lang or TARGET_LANGUAGE
+
+    lang_key = lang.value
     search_queries = get_queries("s5_2", lang_key)
     
-    context_2024 = retrieve_relevant_text(search_queries, top_k, md_file_2024)
-    context_2023 = retrieve_relevant_text(search_queries, top_k, md_file_2023)
-    
-    prompt_2024 = build_s5_2_prompt(context_2024, 2024, COMPANY_NAME, TARGET_LANGUAGE)
-    prompt_2023 = build_s5_2_prompt(context_2023, 2023, COMPANY_NAME, TARGET_LANGUAGE)
+    context_2024, context_2023 = await asyncio.gather(
+        asyncio.to_thread(retrieve_relevant_text, search_queries, top_k, md_file_2024),
+        asyncio.to_thread(retrieve_relevant_text, search_queries, top_k, md_file_2023),
+    )
     
-    try:
-        response = client.chat.completions.create(
-            model=model,
-            response_format={"type": "json_object"},
-            messages=[
-                {"role": "system", "content": "You are an expert corporate governance analyst. Extract internal control information from annual reports. Return valid JSON only."},
-                {"role": "user", "content": prompt_2024}
-            ],
-            temperature=0,
-            max_tokens=2000
-        )
-        result_2024 = _safe_json_from_llm(response.choices[0].message.content)
-    except Exception as e:
-        print(f"Error in _extract_internal_controls_single_year for {2024}: {e}")
-         
-    try:
-        response = client.chat.completions.create(
-            model=model,
-            response_format={"type": "json_object"},
-            messages=[
-                {"role": "system", "content": "You are an expert corporate governance analyst. Extract internal control information from annual reports. Return valid JSON only."},
-                {"role": "user", "content": prompt_2023}
-            ],
-            temperature=0,
-            max_tokens=2000
-        )
-        result_2023 = _safe_json_from_llm(response.choices[0].message.content)
-    except Exception as e:
-        print(f"Error in _extract_internal_controls_single_year for {2023}: {e}")
-         
-    return {
-        "risk_assessment_procedures_2024": _normalize_na(result_2024.get("risk_assessment_procedures", "N/A")),
-        "risk_assessment_procedures_2023": _normalize_na(result_2023.get("risk_assessment_procedures", "N/A")),
-        "control_activities_2024": _normalize_na(result_2024.get("control_activities", "N/A")),
-        "control_activities_2023": _normalize_na(result_2023.get("control_activities", "N/A")),
-        "monitoring_mechanisms_2024": _normalize_na(result_2024.get("monitoring_mechanisms", "N/A")),
-        "monitoring_mechanisms_2023": _normalize_na(result_2023.get("monitoring_mechanisms", "N/A")),
-        "identified_material_weaknesses_2024": _normalize_na(result_2024.get("identified_material_weaknesses", "N/A")),
-        "identified_material_weaknesses_2023": _normalize_na(result_2023.get("identified_material_weaknesses", "N/A")),
-        "effectiveness_2024": _normalize_na(result_2024.get("effectiveness", "N/A")),
-        "effectiveness_2023": _normalize_na(result_2023.get("effectiveness", "N/A"))
+    # Context goes in its own message after the instructions (see _acall_llm_by_year)
+    contexts = {2024: _prepare_context(context_2024, model, 2000), 2023: _prepare_context(context_2023, model, 2000)}
+    prompts = {
+        year: build_s5_2_prompt("", year, COMPANY_NAME, lang) if _has_context(context) else None
+        for year, context in ((2024, context_2024), (2023, context_2023))
     }
     
-# ===================== Section 6: Future Outlook =====================
+    system = "You are an expert corporate governance analyst. Extract internal control information from annual reports. Return valid JSON only."
+    by_year = await _acall_llm_by_year(prompts, contexts=contexts, system=system, model=model, max_tokens=2000,
+                                       response_format=_S5_2_FORMAT, sem=sem, lang=lang, label="S5.2")
 
-def extract_s6_1(md_file_2024: str, md_file_2023: str, top_k: int = 15, model: str = "gpt-4.1-mini"):
-        
-    lang_key = TARGET_LANGUAGE.value
-    search_queries = get_queries("s6_1", lang_key)
-    context_2024 = retrieve_relevant_text(search_queries, top_k, md_file_2024)
-    context_2023 = retrieve_relevant_text(search_queries, top_k, md_file_2023)
+    return _normalize_years(_S5_2_OUT, by_year)
 
-    prompt_2024 = build_s6_1_prompt(context_2024, 2024, COMPANY_NAME, TARGET_LANGUAGE)
-    prompt_2023 = build_s6_1_prompt(context_2023, 2023, COMPANY_NAME, TARGET_LANGUAGE)
+def extract_s5_2(md_file_2024: str, md_file_2023: str, top_k: int = 15, model: str = "gpt-4.1-mini"):
+    return _run_async(extract_s5_2_async(md_file_2024, md_file_2023, top_k=top_k, model=model))
     
-    try:
-        response = client.chat.completions.create(
-            model=model,
-            response_format={"type": "json_object"},
-            messages=[
-                {"role": "system", "content": "You are an expert strategic analyst. Extract strategic direction information from annual reports. Return valid JSON only."},
-                {"role": "user", "content": prompt_2024}
-            ],
-            temperature=0,
-            max_tokens=2000
-        )
-        result_2024 = _safe_json_from_llm(response.choices[0].message.content)
-    except Exception as e:
-        print(f"Error in _extract_strategic_direction_single_year for 2024: {e}")
+# ===================== Section 6: Future Outlook =====================
+
+async def extract_s6_1_async(md_file_2024: str, md_file_2023: str, top_k: int = 15, model: str = "gpt-4.1-mini", sem: asyncio.Semaphore = None, lang: Lang = None):
+    lang = lang or TARGET_LANGUAGE
         
-    try:
-        response = client.chat.completions.create(
-            model=model,
-            response_format={"type": "json_object"},
-            messages=[
-                {"role": "system", "content": "You are an expert strategic analyst. Extract strategic direction information from annual reports. Return valid JSON only."},
-                {"role": "user", "content": prompt_2023}
-            ],
-            temperature=0,
-            max_tokens=2000
+    lang_key = lang.value
+    search_queries = get_queries("s6_1", lang_key)
+    max_tokens = _max_tokens("s6_1", lang)
+    context_2024, context_2023 = await asyncio.gather(
+        asyncio.to_thread(retrieve_relevant_text, search_queries, top_k, md_file_2024),
+        asyncio.to_thread(retrieve_relevant_text, search_queries, top_k, md_file_2023),
     )
-        result_2023 = _safe_json_from_llm(response.choices[0].message.content)
-    except Exception as e:
-        print(f"Error in _extract_strategic_direction_single_year for 2023: {e}")
-        
-    return {
-        "mergers_acquisition_2024": _normalize_na(result_2024.get("mergers_acquisition", "N/A")),
-        "mergers_acquisition_2023": _normalize_na(result_2023.get("mergers_acquisition", "N/A")),
-        "new_technologies_2024": _normalize_na(result_2024.get("new_technologies", "N/A")),
-        "new_technologies_2023": _normalize_na(result_2023.get("new_technologies", "N/A")),
-        "organisational_restructuring_2024": _normalize_na(result_2024.get("organisational_restructuring", "N/A")),
-        "organisational_restructuring_2023": _normalize_na(result_2023.get("organisational_restructuring", "N/A"))
+
+    # Context goes in its own message after the instructions (see _acall_llm_by_year)
+    contexts = {2024: _prepare_context(context_2024, model, max_tokens), 2023: _prepare_context(context_2023, model, max_tokens)}
+    prompts = {
+        year: build_s6_1_prompt("", year, COMPANY_NAME, lang) if _has_context(context) else None
+        for year, context in ((2024, context_2024), (2023, context_2023))
     }
+    
+    system = "You are an expert strategic analyst. Extract strategic direction information from annual reports. Return valid JSON only."
+    by_year = await _acall_llm_by_year(prompts, contexts=contexts, system=system, model=model, max_tokens=max_tokens,
+                                       response_format=_S6_1_FORMAT, sem=sem, lang=lang, label="S6.1")
 
-def extract_s6_2(md_file_2024: str, md_file_2023: str, top_k: int = 15, model: str = "gpt-4.1-mini"):
+    return _normalize_years(_S6_1_OUT, by_year)
+
+def extract_s6_1(md_file_2024: str, md_file_2023: str, top_k: int = 15, model: str = "gpt-4.1-mini"):
+    return _run_async(extract_s6_1_async(md_file_2024, md_file_2023, top_k=top_k, model=model))
+
+async def extract_s6_2_async(md_file_2024: str, md_file_2023: str, top_k: int = 15, model: str = "gpt-4.1-mini", sem: asyncio.Semaphore = None, lang: Lang = None):
+    lang = lang or TARGET_LANGUAGE
 
-    lang_key = TARGET_LANGUAGE.value
+    lang_key = lang.value
     search_queries = get_queries("s6_2", lang_key)
-    context_2024 = retrieve_relevant_text(search_queries, top_k, md_file_2024)
-    context_2023 = retrieve_relevant_text(search_queries, top_k, md_file_2023)
+    max_tokens = _max_tokens("s6_2", lang)
+    context_2024, context_2023 = await asyncio.gather(
+        asyncio.to_thread(retrieve_relevant_text, search_queries, top_k, md_file_2024),
+        asyncio.to_thread(retrieve_relevant_text, search_queries, top_k, md_file_2023),
+    )
 
-    prompt_2024 = build_s6_2_prompt(context_2024, 2024, COMPANY_NAME, TARGET_LANGUAGE)
-    prompt_2023 = build_s6_2_prompt(context_2023, 2023, COMPANY_NAME, TARGET_LANGUAGE)
+    # Context goes in its own message after the instructions (see _acall_llm_by_year)
+    contexts = {2024: _prepare_context(context_2024, model, max_tokens), 2023: _prepare_context(context_2023, model, max_tokens)}
+    prompts = {
+        year: build_s6_2_prompt("", year, COMPANY_NAME, lang) if _has_context(context) else None
+        for year, context in ((2024, context_2024), (2023, context_2023))
+    }
         
-    try:
-        response = client.chat.completions.create(
-            model=model,
-            response_format={"type": "json_object"},
-            messages=[
-                {"role": "system", "content": "You are an expert business analyst. Extract challenges and uncertainties information from annual reports. Return valid JSON only."},
-                {"role": "user", "content": prompt_2024}
-            ],
-            temperature=0,
-            max_tokens=1600
-        )
-        result_2024 = _safe_json_from_llm(response.choices[0].message.content)
-    except Exception as e:
-        print(f"Error in _extract_challenges_uncertainties_single_year for {2024}: {e}")
-
-    try:
-        response = client.chat.completions.create(
-            model=model,
-            response_format={"type": "json_object"},
-            messages=[
-                {"role": "system", "content": "You are an expert business analyst. Extract challenges and uncertainties information from annual reports. Return valid JSON only."},
-                {"role": "user", "content": prompt_2023}
-            ],
-            temperature=0,
-            max_tokens=1600
-        )
-        result_2023 = _safe_json_from_llm(response.choices[0].message.content)
-    except Exception as e:
-        print(f"Error in _extract_challenges_uncertainties_single_year for {2023}: {e}")
+    system = "You are an expert business analyst. Extract challenges and uncertainties information from annual reports. Return valid JSON only."
+    by_year = await _acall_llm_by_year(prompts, contexts=contexts, system=system, model=model, max_tokens=max_tokens,
+                                       response_format=_S6_2_FORMAT, sem=sem, lang=lang, label="S6.2")
     
-    return {
-        "economic_challenges_2024": _normalize_na(result_2024.get("economic_challenges", "N/A")),
-        "economic_challenges_2023": _normalize_na(result_2023.get("economic_challenges", "N/A")),
-        "competitive_pressures_2024": _normalize_na(result_2024.get("competitive_pressures", "N/A")),
-        "competitive_pressures_2023": _normalize_na(result_2023.get("competitive_pressures", "N/A"))
-    }
+    return _normalize_years(_S6_2_OUT, by_year)
 
-def extract_s6_3(md_file_2024: str, md_file_2023: str, top_k: int = 15, model: str = "gpt-4.1-mini"):
+def extract_s6_2(md_file_2024: str, md_file_2023: str, top_k: int = 15, model: str = "gpt-4.1-mini"):
+    return _run_async(extract_s6_2_async(md_file_2024, md_file_2023, top_k=top_k, model=model))
+
+async def extract_s6_3_async(md_file_2024: str, md_file_2023: str, top_k: int = 15, model: str = "gpt-4.1-mini", sem: asyncio.Semaphore = None, lang: Lang = None):
+    lang = lang or TARGET_LANGUAGE
 
-    lang_key = TARGET_LANGUAGE.value
+    lang_key = lang.value
     search_queries = get_queries("s6_3", lang_key)
-    context_2024 = retrieve_relevant_text(search_queries, top_k, md_file_2024)
-    context_2023 = retrieve_relevant_text(search_queries, top_k, md_file_2023)
+    max_tokens = _max_tokens("s6_3", lang)
+    context_2024, context_2023 = await asyncio.gather(
+        asyncio.to_thread(retrieve_relevant_text, search_queries, top_k, md_file_2024),
+        asyncio.to_thread(retrieve_relevant_text, search_queries, top_k, md_file_2023),
+    )
     
-    prompt_2024 = build_s6_3_prompt(context_2024, 2024, COMPANY_NAME, TARGET_LANGUAGE)
-    prompt_2023 = build_s6_3_prompt(context_2023, 2023, COMPANY_NAME, TARGET_LANGUAGE)
+    # Context goes in its own message after the instructions (see _acall_llm_by_year)
+    contexts = {2024: _prepare_context(context_2024, model, max_tokens), 2023: _prepare_context(context_2023, model, max_tokens)}
+    prompts = {
+        year: build_s6_3_prompt("", year, COMPANY_NAME, lang) if _has_context(context) else None
+        for year, context in ((2024, context_2024), (2023, context_2023))
+    }
     
-    try:
-        response = client.chat.completions.create(
-            model=model,
-            response_format={"type": "json_object"},
-            messages=[
-                {"role": "system", "content": "You are an expert innovation analyst. Extract innovation and development information from annual reports. Return valid JSON only."},
-                {"role": "user", "content": prompt_2024}
-            ],
-            temperature=0,
-            max_tokens=1200
-        )
-        result_2024 = _safe_json_from_llm(response.choices[0].message.content)    
-    except Exception as e:
-        print(f"Error in _extract_innovation_development_single_year for {2024}: {e}")
+    system = "You are an expert innovation analyst. Extract innovation and development information from annual reports. Return valid JSON only."
+    by_year = await _acall_llm_by_year(prompts, contexts=contexts, system=system, model=model, max_tokens=max_tokens,
+                                       response_format=_S6_3_FORMAT, sem=sem, lang=lang, label="S6.3")
 
+    return _normalize_years(_S6_3_OUT, by_year)
+
+def extract_s6_3(md_file_2024: str, md_file_2023: str, top_k: int = 15, model: str = "gpt-4.1-mini"):
+    return _run_async(extract_s6_3_async(md_file_2024, md_file_2023, top_k=top_k, model=model))
+
+# ===================== Concurrent driver =====================
+
+# Sections whose context comes from retrieve_relevant_text
+_RAG_SECTIONS = ("s3_3", "s4_1", "s5_1", "s5_2", "s6_1", "s6_2", "s6_3")
+
+async def extract_all_sections(report, md_file_2024: str, md_file_2023: str, top_k: int = 15, model: str = "gpt-4.1-mini", concurrency: int = LLM_CONCURRENCY, lang: Lang = None,
+                               section2_ready: Future = None):
+    """
+    Run every section from S3.1 to S6.3 concurrently.
+    They only depend on the Section 2 data in `report` and on the markdown
+    files, so all retrieval and LLM calls are dispatched at once and bounded by
+    a single semaphore; wall-clock is set by the slowest section.
+    If `section2_ready` is given, S3.1 and S3.2 (the only sections reading
+    Section 2 figures) wait for it to resolve, so the rest can start while
+    Section 2 runs. If it resolves with an exception, every section still
+    running is cancelled so no further LLM calls are made for a failed report.
+    """
+    lang = lang or TARGET_LANGUAGE
+    sem = asyncio.Semaphore(concurrency)
+
+    async def after_section2(make_coro):
+        if section2_ready is not None:
+            # awaited on the loop itself: a blocking wait would park a default-executor
+            # thread that the other sections' retrievals need
+            await asyncio.wrap_future(section2_ready)
+        return await make_coro()
+    names = ("s3_1", "s3_2", "s3_3", "s4_1", "s5_1", "s5_2", "s6_1", "s6_2", "s6_3")
+
+    # Embed every section's queries in one request up front; the per-year
+    # retrievals below then only hit the in-process query-vector cache
+    lang_key = lang.value
+    all_queries = [q for section in _RAG_SECTIONS for q in get_queries(section, lang_key)]
     try:
-        response = client.chat.completions.create(
-            model=model,
-            response_format={"type": "json_object"},
-            messages=[
-                {"role": "system", "content": "You are an expert innovation analyst. Extract innovation and development information from annual reports. Return valid JSON only."},
-                {"role": "user", "content": prompt_2023}
-            ],
-            temperature=0,
-            max_tokens=1200
-        )
-        result_2023 = _safe_json_from_llm(response.choices[0].message.content)    
+        await asyncio.to_thread(embed_queries, all_queries)
     except Exception as e:
-        print(f"Error in _extract_innovation_development_single_year for {2023}: {e}")
+        logger.warning(f"Query embedding prefetch failed, sections will embed on demand: {e}")
+
+    tasks = [asyncio.ensure_future(coro) for coro in (
+        after_section2(lambda: extract_s3_1_async(report, model=model, sem=sem, lang=lang)),
+        after_section2(lambda: extract_s3_2_async(report, model=model, sem=sem, lang=lang)),
+        extract_s3_3_async(md_file_2024, md_file_2023, top_k=top_k, model=model, sem=sem, lang=lang),
+        extract_s4_1_async(md_file_2024, md_file_2023, top_k=top_k, model=model, sem=sem, lang=lang),
+        extract_s5_1_async(md_file_2024, top_k=top_k, model=model, sem=sem, lang=lang),
+        extract_s5_2_async(md_file_2024, md_file_2023, top_k=top_k, model=model, sem=sem, lang=lang),
+        extract_s6_1_async(md_file_2024, md_file_2023, top_k=top_k, model=model, sem=sem, lang=lang),
+        extract_s6_2_async(md_file_2024, md_file_2023, top_k=top_k, model=model, sem=sem, lang=lang),
+        extract_s6_3_async(md_file_2024, md_file_2023, top_k=top_k, model=model, sem=sem, lang=lang),
+    )]
+
+    if section2_ready is not None:
+        loop = asyncio.get_running_loop()
+
+        def _cancel_all():
+            for task in tasks:
+                task.cancel()
+
+        # Sections 1-2 failed: nobody will read these results, so stop paying for them
+        def _on_section2(fut):
+            if fut.exception() is not None and not loop.is_closed():
+                loop.call_soon_threadsafe(_cancel_all)
+
+        section2_ready.add_done_callback(_on_section2)
 
-    return {
-        "rd_investments_2024": _normalize_na(result_2024.get("rd_investments", "N/A")),
-        "rd_investments_2023": _normalize_na(result_2023.get("rd_investments", "N/A")),
-        "new_product_launches_2024": _normalize_na(result_2024.get("new_product_launches", "N/A")),
-        "new_product_launches_2023": _normalize_na(result_2023.get("new_product_launches", "N/A"))
-    }
+    try:
+        results = await asyncio.gather(*tasks)
+    except asyncio.CancelledError:
+        if section2_ready is not None and section2_ready.done() and section2_ready.exception() is not None:
+            raise RuntimeError("S3.1-S6.3 cancelled after Sections 1-2 failed") from section2_ready.exception()
+        raise
+    save_token_budgets()
+    logger.info(f"[LLM] Prompt tokens: {_prompt_usage['prompt']} ({_prompt_usage['cached']} served from prompt cache)")
+    return dict(zip(names, results))
     
 # ===================== TEST EXTRACT =====================
 
+_SLUG_RE = re.compile(r"[^a-z0-9]+")
+
+def _start_in_background(fn, *args, **kwargs) -> Future:
+    """
+    Run fn on a daemon thread and return a Future for its result.
+    Daemon, so a failure on the caller's side never leaves the process
+    waiting on work nobody will collect.
+    """
+    fut = Future()
+
+    def _run():
+        try:
+            fut.set_result(fn(*args, **kwargs))
+        except BaseException as e:
+            fut.set_exception(e)
+
+    threading.Thread(target=_run, daemon=True).start()
+    return fut
+
 def _slugify(name: str) -> str:
-    name = (name or "").strip() or "report"
-    s = re.sub(r"[^a-z0-9]+", "-", name.lower()).strip("-")
-    return s or "report"
+    return _SLUG_RE.sub("-", (name or "report").lower()).strip("-") or "report"
 
 def _atomic_write(text: str, out_path: str):
+    # Temp file in the target directory, so os.replace is a single same-filesystem rename
     out_path = Path(out_path)
     out_path.parent.mkdir(parents=True, exist_ok=True)
-    with tempfile.NamedTemporaryFile("w", delete=False, encoding="utf-8") as tmp:
-        tmp.write(text)
-        tmp_path = tmp.name
-    shutil.move(tmp_path, out_path) 
+    fd, tmp = tempfile.mkstemp(dir=out_path.parent, prefix=".partial_", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, out_path)
+    except Exception:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+
+# output path -> digest of the last snapshot written there
+_snapshot_digests: Dict[str, bytes] = {}
 
 def save_partial_report(report, output_path: str, currency_code: str = "USD"):
     """
     Safely render and save the current report state to disk.
     Uses the DDRGenerator so formatting is identical to the final output.
+    The write is skipped when the rendered report matches the last snapshot
+    at `output_path`, ignoring whitespace.
     """
     try:
         gen = DDRGenerator(report, currency_code=currency_code)
         markdown = gen.generate_full_report()
+        digest = hashlib.blake2b(" ".join(markdown.split()).encode("utf-8"), digest_size=16).digest()
+        if _snapshot_digests.get(output_path) == digest:
+            logger.info("[partial-save] unchanged, skipping")
+            return
         _atomic_write(markdown, output_path)
-        print(f"[partial-save] Wrote snapshot to: {output_path}")
+        _snapshot_digests[output_path] = digest
+        logger.info(f"[partial-save] Wrote snapshot to: {output_path}")
     except Exception as e:
-        print(f"[partial-save][WARN] Failed to write snapshot: {e}")
+        logger.warning(f"[partial-save] Failed to write snapshot: {e}")
+
+
+# Income statement attribute on the report -> key in the S2.1 extraction result
+_IS_FIELDS = (
+    ("revenue", "revenue"),
+    ("cost_of_goods_sold", "cost_of_goods_sold"),
+    ("gross_profit", "gross_profit"),
+    ("operating_expense", "operating_expense"),
+    ("operating_income", "operating_income"),
+    ("net_profit", "net_profit"),
+    ("income_before_income_taxes", "income_before_taxes"),
+    ("income_tax_expense", "tax_expense"),
+    ("interest_expense", "interest_expense"),
+)
+_REPORT_YEARS = ("2024", "2023", "2022")
+# (year key, attribute name) pairs, so the fill loops don't format names per field
+_YEAR_ATTRS = tuple((year, f"year_{year}") for year in _REPORT_YEARS)
+# Report year -> attribute holding the year before it (used for averaged ratios)
+_PREV_YEAR_ATTRS = {year: f"year_{int(year) - 1}" for year in _REPORT_YEARS}
+# Values treated as "not extracted" when merging into the report
+_MISSING = frozenset({None, "", "N/A", "-", "--"})
+
+_BS_FIELDS = (
+    "total_assets",
+    "current_assets",
+    "non_current_assets",
+    "total_liabilities",
+    "current_liabilities",
+    "non_current_liabilities",
+    "shareholders_equity",
+    "retained_earnings",
+    "total_equity_and_liabilities",
+    "inventories",
+    "prepaid_expenses",
+)
+
+# Cash flow attribute on the report -> key in the S2.3 extraction result
+_CF_FIELDS = (
+    ("net_cash_from_operations", "net_cash_from_operations"),
+    ("net_cash_from_investing", "net_cash_from_investing"),
+    ("net_cash_from_financing", "net_cash_from_financing"),
+    ("net_increase_decrease_cash", "net_increase_decrease_in_cash"),
+    ("dividends", "dividends"),
+)
+
+# Operating performance attribute on the report -> key in the S2.5 extraction result
+_OP_FIELDS = (
+    ("revenue_by_product_service", "revenue_by_product_service"),
+    ("revenue_by_geographic_region", "revenue_by_region"),
+)
+
+# Core competencies attribute on the report -> key in the S1.2 extraction result
+_CORE_COMP_FIELDS = (
+    ("innovation_advantages", "Innovation Advantages"),
+    ("product_advantages", "Product Advantages"),
+    ("brand_recognition", "Brand Recognition"),
+    ("reputation_ratings", "Reputation Ratings"),
+)
+
+def _check_field_tables():
+    """Fail at import, not mid-run, if a field table names an attribute the report lacks."""
+    tables = (
+        (IncomeStatement, [attr for attr, _ in _IS_FIELDS]),
+        (BalanceSheet, _BS_FIELDS),
+        (CashFlowStatement, [attr for attr, _ in _CF_FIELDS]),
+        (OperatingPerformance, [attr for attr, _ in _OP_FIELDS]),
+        (CoreCompetencies, [attr for attr, _ in _CORE_COMP_FIELDS]),
+    )
+    for cls, names in tables:
+        missing = set(names) - {f.name for f in dataclasses.fields(cls)}
+        if missing:
+            raise AttributeError(f"{cls.__name__} has no field(s): {', '.join(sorted(missing))}")
 
+_check_field_tables()
 
 def extract(md_file1: str, md_file2: str, *, currency_code: str = "USD", target_lang: Lang = Lang.EN):
     """
@@ -1759,12 +2416,12 @@ def extract(md_file1: str, md_file2: str, *, currency_code: str = "USD", target_
     """
 
     start_time = time.time()
-    print(f"Starting RAG extraction pipeline at {time.strftime('%Y-%m-%d %H:%M:%S')}")
+    logger.info(f"Starting RAG extraction pipeline at {time.strftime('%Y-%m-%d %H:%M:%S')}")
     
     report = CompanyReport()
 
     set_target_language(target_lang)
-    print(f"Target language set to: {target_lang.name}")
+    logger.info(f"Target language set to: {target_lang.name}")
     report.meta_output_lang = str(target_lang)
     
     md_path_2024 = Path(md_file1)
@@ -1772,235 +2429,186 @@ def extract(md_file1: str, md_file2: str, *, currency_code: str = "USD", target_
     md_file_2024 = md_path_2024.stem
     md_file_2023 = md_path_2023.stem
     
-    company_from_filename = md_file_2024.split('_')[0] if '_' in md_file_2024 else md_file_2024
+    # Parsed files are named by content hash; the sidecar keeps the original PDF name
+    name_2024 = original_stem(md_path_2024)
+    company_from_filename = name_2024.split('_')[0] if '_' in name_2024 else name_2024
     slug = _slugify(company_from_filename)
     timestamp = time.strftime("%Y%m%d_%H%M%S")
     company_folder = f"artifacts/{slug}"
     partial_path = f"{company_folder}/partial/{timestamp}_report.md"
-    print(f"Report will be saved to company folder: {company_folder}/")
+    logger.info(f"Report will be saved to company folder: {company_folder}/")
     
     def checkpoint(section_label: str):
-        print(f"Saving partial after: {section_label}")
+        logger.info(f"Saving partial after: {section_label}")
         save_partial_report(report, partial_path, currency_code=currency_code)
         
     
-    print("\n" + "="*60)
-    print("PROCESSING: Building FAISS Embeddings")
-    print("="*60)
+    logger.info("PROCESSING: Building FAISS Embeddings")
     
-    # Build embeddings if not exists
+    # Build embeddings if not exists; the two reports are independent and the work
+    # is mostly embedding requests, so build them on two threads
     jsonl_file_2024_path = f"data/sections_report/{md_file_2024}.jsonl"
     jsonl_file_2023_path = f"data/sections_report/{md_file_2023}.jsonl"
     
-    build_section_embeddings(jsonl_file_2024_path, f"data/parsed/{md_file_2024}.md")
-    build_section_embeddings(jsonl_file_2023_path, f"data/parsed/{md_file_2023}.md")
-    
-    print("\n" + "="*60)
-    print("📋 PROCESSING: S1.1 - Basic Information (2024 with RAG)")
-    print("="*60)
-    
-    company_name, establishment_date, headquarters = extract_s1_1(md_file_2024, top_k=25, model="gpt-4.1-mini")
-
-    report.basic_info.company_name = company_name
-    report.basic_info.establishment_date = establishment_date
-    report.basic_info.headquarters_location = headquarters
-    set_company_name(company_name)
+    with ThreadPoolExecutor(max_workers=2) as ex:
+        builds = [
+            ex.submit(build_section_embeddings, jsonl_file_2024_path, f"data/parsed/{md_file_2024}.md"),
+            ex.submit(build_section_embeddings, jsonl_file_2023_path, f"data/parsed/{md_file_2023}.md"),
+        ]
+        for f in builds:
+            f.result()
+    
+    # Sections 1-2 are network-bound and mostly independent, so each is started as
+    # soon as its inputs exist: S1.1-S1.3 and S2.1 need only the markdown files;
+    # S2.2, S2.3 and S2.5 (one fused LLM call per year, see extract_s2_combined)
+    # need S1.1's company name and S2.1's currency and multiplier.
+    # Results are still consumed, and written into the report, in section order.
+    # Resolved once Section 2 is in the report; gates S3.1 and S3.2 (see below)
+    section2_done = Future()
+    stage_pool = ThreadPoolExecutor(max_workers=4)
+    f_analysis = None
+    try:
+        f_s1_1 = stage_pool.submit(extract_s1_1, md_file_2024, top_k=25, model="gpt-4.1-mini", lang=target_lang)
+        f_s1_2 = stage_pool.submit(extract_s1_2_years, md_file_2024, md_file_2023, top_k=12, model="gpt-4.1-mini", lang=target_lang)
+        f_s1_3 = stage_pool.submit(extract_s1_3, md_file_2024, top_k=25, model="gpt-4.1-mini", lang=target_lang)
+        f_s2_1 = stage_pool.submit(extract_s2_1, md_file_2024, md_file_2023, top_k=12, model=MODEL_NUMERIC, lang=target_lang)
+
+        logger.info("📋 PROCESSING: S1.1 - Basic Information (2024 with RAG)")
+    
+        company_name, establishment_date, headquarters = f_s1_1.result()
+
+        report.basic_info.company_name = company_name
+        report.basic_info.establishment_date = establishment_date
+        report.basic_info.headquarters_location = headquarters
+        set_company_name(company_name)
+
+        # S3.3-S6.3 need only the markdown files and the company name, so they start
+        # now and overlap with the rest of Sections 1-2; S3.1 and S3.2 wait for
+        # section2_done before reading the Section 2 figures from the report
+        f_analysis = _start_in_background(
+            _run_async,
+            extract_all_sections(report, md_file_2024, md_file_2023, top_k=15, model="gpt-4.1-mini", lang=target_lang,
+                                 section2_ready=section2_done),
+        )
 
-    print("✅ COMPLETED: S1.1 - Basic Information")
+        logger.info("✅ COMPLETED: S1.1 - Basic Information")
     
-    print("\n" + "="*60)
-    print("PROCESSING: S1.2 - Core Competencies (2024 + 2023 with RAG)")
-    print("="*60)
+        logger.info("PROCESSING: S1.2 - Core Competencies (2024 + 2023 with RAG)")
     
-    core_comp_2024 = extract_s1_2(md_file=md_file_2024, top_k=12, year=2024, model="gpt-4.1-mini")
-    core_comp_2023 = extract_s1_2(md_file=md_file_2023, top_k=12, year=2023, model="gpt-4.1-mini")
-    core_comp = merge_core_competencies(core_comp_2024, core_comp_2023)
+        core_comp = f_s1_2.result()
     
-    # Save to report
-    report.core_competencies.innovation_advantages.report_2024 = str(core_comp.get("Innovation Advantages", {}).get("2024", "N/A"))
-    report.core_competencies.innovation_advantages.report_2023 = str(core_comp.get("Innovation Advantages", {}).get("2023", "N/A"))
-    report.core_competencies.product_advantages.report_2024 = str(core_comp.get("Product Advantages", {}).get("2024", "N/A"))
-    report.core_competencies.product_advantages.report_2023 = str(core_comp.get("Product Advantages", {}).get("2023", "N/A"))
-    report.core_competencies.brand_recognition.report_2024 = str(core_comp.get("Brand Recognition", {}).get("2024", "N/A"))
-    report.core_competencies.brand_recognition.report_2023 = str(core_comp.get("Brand Recognition", {}).get("2023", "N/A"))
-    report.core_competencies.reputation_ratings.report_2024 = str(core_comp.get("Reputation Ratings", {}).get("2024", "N/A"))
-    report.core_competencies.reputation_ratings.report_2023 = str(core_comp.get("Reputation Ratings", {}).get("2023", "N/A"))
+        # Save to report
+        for attr, key in _CORE_COMP_FIELDS:
+            item = getattr(report.core_competencies, attr)
+            values = core_comp.get(key, {})
+            item.report_2024 = str(values.get("2024", "N/A"))
+            item.report_2023 = str(values.get("2023", "N/A"))
     
-    print("✅ COMPLETED: S1.2 - Core Competencies")
+        logger.info("✅ COMPLETED: S1.2 - Core Competencies")
     
-    print("\n" + "="*60)
-    print("PROCESSING: S1.3 - Mission & Vision (2024 with RAG)")
-    print("="*60)
+        logger.info("PROCESSING: S1.3 - Mission & Vision (2024 with RAG)")
     
-    # only use 2024's report for mission & vision
-    mv = extract_s1_3(md_file_2024, top_k=25, model="gpt-4.1-mini")
+        # only use 2024's report for mission & vision
+        mv = f_s1_3.result()
     
-     # Save to report
+         # Save to report
     
-    report.mission_vision.mission_statement = mv['mission']
-    report.mission_vision.vision_statement = mv['vision']
-    report.mission_vision.core_values = mv['core_values']
+        report.mission_vision.mission_statement = mv['mission']
+        report.mission_vision.vision_statement = mv['vision']
+        report.mission_vision.core_values = mv['core_values']
     
-    print("✅ COMPLETED: S1.3 - Mission & Vision")
-    # checkpoint("Section 1 - Company Overview (S1.1-S1.3)")
+        logger.info("✅ COMPLETED: S1.3 - Mission & Vision")
+        # checkpoint("Section 1 - Company Overview (S1.1-S1.3)")
     
-    print("\n" + "="*60)
-    print("PROCESSING: S2.1 - Income Statement (with RAG)")
-    print("="*60)
+        logger.info("PROCESSING: S2.1 - Income Statement (with RAG)")
     
-    # Use FAISS search for income statement
-    income_data = extract_s2_1(md_file_2024, md_file_2023, top_k=12, model="gpt-4.1-mini")
-
-    income_data = fill_income_data(income_data)
-
-    def getv(y, k, default="N/A"):
-        return income_data.get(y, {}).get(k, default)
-
-    # Assign to report (no KeyErrors if a year/key is missing)
-    report.income_statement.revenue.year_2024 = getv("2024", "revenue")
-    report.income_statement.revenue.year_2023 = getv("2023", "revenue")
-    report.income_statement.revenue.year_2022 = getv("2022", "revenue")
-
-    report.income_statement.cost_of_goods_sold.year_2024 = getv("2024", "cost_of_goods_sold")
-    report.income_statement.cost_of_goods_sold.year_2023 = getv("2023", "cost_of_goods_sold")
-    report.income_statement.cost_of_goods_sold.year_2022 = getv("2022", "cost_of_goods_sold")
-
-    report.income_statement.gross_profit.year_2024 = getv("2024", "gross_profit")
-    report.income_statement.gross_profit.year_2023 = getv("2023", "gross_profit")
-    report.income_statement.gross_profit.year_2022 = getv("2022", "gross_profit")
-
-    report.income_statement.operating_expense.year_2024 = getv("2024", "operating_expense")
-    report.income_statement.operating_expense.year_2023 = getv("2023", "operating_expense")
-    report.income_statement.operating_expense.year_2022 = getv("2022", "operating_expense")
-
-    report.income_statement.operating_income.year_2024 = getv("2024", "operating_income")
-    report.income_statement.operating_income.year_2023 = getv("2023", "operating_income")
-    report.income_statement.operating_income.year_2022 = getv("2022", "operating_income")
+        # Use FAISS search for income statement
+        income_data = f_s2_1.result()
 
-    report.income_statement.net_profit.year_2024 = getv("2024", "net_profit")
-    report.income_statement.net_profit.year_2023 = getv("2023", "net_profit")
-    report.income_statement.net_profit.year_2022 = getv("2022", "net_profit")
+        income_data = fill_income_data(income_data)
 
-    report.income_statement.income_before_income_taxes.year_2024 = getv("2024", "income_before_taxes")
-    report.income_statement.income_before_income_taxes.year_2023 = getv("2023", "income_before_taxes")
-    report.income_statement.income_before_income_taxes.year_2022 = getv("2022", "income_before_taxes")
+        # Assign to report (no KeyErrors if a year/key is missing)
+        for attr, key in _IS_FIELDS:
+            item = getattr(report.income_statement, attr)
+            for year, year_attr in _YEAR_ATTRS:
+                setattr(item, year_attr, income_data.get(year, {}).get(key, "N/A"))
 
-    report.income_statement.income_tax_expense.year_2024 = getv("2024", "tax_expense")
-    report.income_statement.income_tax_expense.year_2023 = getv("2023", "tax_expense")
-    report.income_statement.income_tax_expense.year_2022 = getv("2022", "tax_expense")
-
-    report.income_statement.interest_expense.year_2024 = getv("2024", "interest_expense")
-    report.income_statement.interest_expense.year_2023 = getv("2023", "interest_expense")
-    report.income_statement.interest_expense.year_2022 = getv("2022", "interest_expense")
-
-    report.income_statement.primary_currency = income_data.get("currency", "N/A")
-    report.income_statement.primary_multiplier = income_data.get("multiplier", "N/A")
+        report.income_statement.primary_currency = income_data.get("currency", "N/A")
+        report.income_statement.primary_multiplier = income_data.get("multiplier", "N/A")
     
-    set_currency_code(report.income_statement.primary_currency)
-    set_multiplier(report.income_statement.primary_multiplier)
+        set_currency_code(report.income_statement.primary_currency)
+        set_multiplier(report.income_statement.primary_multiplier)
+        f_s2_rest = stage_pool.submit(extract_s2_combined, md_file_2024, md_file_2023, model=MODEL_NUMERIC, lang=target_lang,
+                                      top_k_s2_2=20, top_k_s2_3=12, top_k_s2_5=20)
     
-    print("✅ S2.1 Income Statement completed")
-    print(f"   Revenue 2024: {income_data['2024']['revenue']} | 2023: {income_data['2023']['revenue']}")
-    print(f"   Net Profit 2024: {income_data['2024']['net_profit']} | 2023: {income_data['2023']['net_profit']}")
+        logger.info("✅ S2.1 Income Statement completed")
+        logger.info(f"   Revenue 2024: {income_data['2024']['revenue']} | 2023: {income_data['2023']['revenue']}")
+        logger.info(f"   Net Profit 2024: {income_data['2024']['net_profit']} | 2023: {income_data['2023']['net_profit']}")
     
-    print("✅ COMPLETED: S2.1 - Income Statement")
+        logger.info("✅ COMPLETED: S2.1 - Income Statement")
     
-    # checkpoint("Section 2 - Financial Performance (S2.1 Income Statement)")
+        # checkpoint("Section 2 - Financial Performance (S2.1 Income Statement)")
 
-    print("\n" + "="*60)
-    print("PROCESSING: S2.2 - Balance Sheet (with RAG)")
-    print("="*60)
+        logger.info("PROCESSING: S2.2 - Balance Sheet (with RAG)")
     
-    # Use FAISS search for balance sheet
-    balance_data = extract_s2_2(md_file_2024, md_file_2023, top_k=20, model="gpt-4.1-mini")
-    balance_data = fill_missing_balance_sheet_values(balance_data)
+        # S2.2, S2.3 and S2.5 come back together from the fused extraction
+        balance_data, cashflow_data, operating_perf = f_s2_rest.result()
+        balance_data = fill_missing_balance_sheet_values(balance_data)
 
-    # Define all expected balance sheet fields
-    fields = [
-        "total_assets",
-        "current_assets",
-        "non_current_assets",
-        "total_liabilities",
-        "current_liabilities",
-        "non_current_liabilities",
-        "shareholders_equity",
-        "retained_earnings",
-        "cash_and_equivalents",
-        "total_equity_and_liabilities",
-        "inventories",
-        "prepaid_expenses",
-    ]
-    
-    MISSING = {None, "", "N/A", "-", "--"}
-    for field in fields:
-        bs_item = getattr(report.balance_sheet, field, None)
-        if bs_item is not None:
-            for year in ["2024", "2023", "2022"]:
-                value = balance_data.get(year, {}).get(field, "N/A")
-                cur_val = getattr(bs_item, f"year_{year}", None)
-                if (cur_val in MISSING) and (value not in MISSING):
-                    setattr(bs_item, f"year_{year}", value)
-        else:
-            print(f"[WARN] report.balance_sheet missing attribute: {field}")
+        # Only fill years the report doesn't already have a value for
+        year_rows = [(year_attr, balance_data.get(year, {})) for year, year_attr in _YEAR_ATTRS]
+        for field in _BS_FIELDS:
+            bs_item = getattr(report.balance_sheet, field)
+            for year_attr, row in year_rows:
+                value = row.get(field, "N/A")
+                if value not in _MISSING and getattr(bs_item, year_attr) in _MISSING:
+                    setattr(bs_item, year_attr, value)
 
-    report.balance_sheet.primary_currency = balance_data.get("currency", "N/A")
-    report.balance_sheet.primary_multiplier = balance_data.get("multiplier", "N/A")
-    
-    print("✅ COMPLETED: S2.2 - Balance Sheet")
+        report.balance_sheet.primary_currency = balance_data.get("currency", "N/A")
+        report.balance_sheet.primary_multiplier = balance_data.get("multiplier", "N/A")
     
-    print("\n" + "="*60)
-    print("PROCESSING: S2.3 - Cash Flow Statement (with RAG)")
-    print("="*60)
+        logger.info("✅ COMPLETED: S2.2 - Balance Sheet")
     
-    # Use FAISS search for cash flow
-    cashflow_data = extract_s2_3(md_file_2024, md_file_2023, top_k=12, model="gpt-4.1-mini")
+        logger.info("PROCESSING: S2.3 - Cash Flow Statement (with RAG)")
     
-    fields = [
-        ("net_cash_from_operations", "net_cash_from_operations"),
-        ("net_cash_from_investing", "net_cash_from_investing"),
-        ("net_cash_from_financing", "net_cash_from_financing"),
-        ("net_increase_decrease_cash", "net_increase_decrease_in_cash"),
-        ("dividends", "dividends"),
-    ]
-
-    for field_name, key_name in fields:
-        cf_item = getattr(report.cash_flow_statement, field_name, None)
-        if cf_item is None:
-            print(f"[WARN] Missing attribute in cash_flow_statement: {field_name}")
-            continue
-        for year in ["2024", "2023", "2022"]:
-            value = cashflow_data.get(year, {}).get(key_name, "N/A")
-            setattr(cf_item, f"year_{year}", value)
+        year_rows = [(year_attr, cashflow_data.get(year, {})) for year, year_attr in _YEAR_ATTRS]
+        for field_name, key_name in _CF_FIELDS:
+            cf_item = getattr(report.cash_flow_statement, field_name)
+            for year_attr, row in year_rows:
+                setattr(cf_item, year_attr, row.get(key_name, "N/A"))
 
-    report.cash_flow_statement.primary_currency = cashflow_data.get("currency", "N/A")
-    report.cash_flow_statement.primary_multiplier = cashflow_data.get("multiplier", "N/A")
+        report.cash_flow_statement.primary_currency = cashflow_data.get("currency", "N/A")
+        report.cash_flow_statement.primary_multiplier = cashflow_data.get("multiplier", "N/A")
 
-    print("✅ COMPLETED: S2.3 - Cash Flow Statement")
+        logger.info("✅ COMPLETED: S2.3 - Cash Flow Statement")
     
-    print("=" * 60)
-    print("PROCESSING: S2.4 - Key Financial Metrics")
-    print("=" * 60)
+        logger.info("PROCESSING: S2.4 - Key Financial Metrics")
 
-    extract_s2_4(report)
+        extract_s2_4(report)
 
-    # save_partial_report(report, output_path="outputs/s2_partial.md")
-    print("✅ COMPLETED: S2.4 - Key Financial Metrics")
+        # save_partial_report(report, output_path="outputs/s2_partial.md")
+        logger.info("✅ COMPLETED: S2.4 - Key Financial Metrics")
         
-    print("=" * 60)
-    print("PROCESSING: S2.5 - Operating Performance")
-    print("=" * 60)
-
-    operating_perf = extract_s2_5(md_file_2024, md_file_2023, top_k=20, model="gpt-4.1-mini")
-
-    report.operating_performance.revenue_by_product_service.year_2024 = operating_perf["2024"]["revenue_by_product_service"]
-    report.operating_performance.revenue_by_product_service.year_2023 = operating_perf["2023"]["revenue_by_product_service"]
-    report.operating_performance.revenue_by_product_service.year_2022 = operating_perf["2022"]["revenue_by_product_service"]
-    
-    report.operating_performance.revenue_by_geographic_region.year_2024 = operating_perf["2024"]["revenue_by_region"]
-    report.operating_performance.revenue_by_geographic_region.year_2023 = operating_perf["2023"]["revenue_by_region"]
-    report.operating_performance.revenue_by_geographic_region.year_2022 = operating_perf["2022"]["revenue_by_region"]
-    
-    print("✅ COMPLETED: S2.5 - Operating Performance")
+        logger.info("PROCESSING: S2.5 - Operating Performance")
+
+        for attr, key in _OP_FIELDS:
+            item = getattr(report.operating_performance, attr)
+            for year, year_attr in _YEAR_ATTRS:
+                setattr(item, year_attr, operating_perf[year][key])
+    
+        logger.info("✅ COMPLETED: S2.5 - Operating Performance")
+        section2_done.set_result(None)
+    except BaseException as e:
+        # S3.1/S3.2 would otherwise wait forever on figures that never arrive, and
+        # the failed future cancels the S3.3-S6.3 calls still in flight; wait for
+        # the background loop to wind down so none outlive this call
+        section2_done.set_exception(e)
+        if f_analysis is not None:
+            wait_futures([f_analysis])
+        raise
+    finally:
+        # On an early failure, drop the queued Section 1-2 work instead of running it for nothing
+        stage_pool.shutdown(cancel_futures=True)
     
     end_time = time.time()
     total_duration = end_time - start_time
@@ -2008,7 +2616,7 @@ def extract(md_file1: str, md_file2: str, *, currency_code: str = "USD", target_
     minutes = int((total_duration % 3600) // 60)
     seconds = int(total_duration % 60)
     
-    print(f"\n   TOTAL EXECUTION TIME: {hours:02d}:{minutes:02d}:{seconds:02d}")
+    logger.info(f"TOTAL EXECUTION TIME: {hours:02d}:{minutes:02d}:{seconds:02d}")
     
     # =============== TESTER FOR SECTION 3 WITH SYNTHETIC DATA ==========================
     # --- quick helpers for mocks ---
@@ -2116,31 +2724,28 @@ def extract(md_file1: str, md_file2: str, *, currency_code: str = "USD", target_
 # ================== end tester =======================================
     
     
-    print("\n" + "="*60)
-    print("PROCESSING: S3.1 - Profitability Analysis")
-    print("="*60)
+    logger.info("PROCESSING: S3.1 - S6.3 (concurrent)")
+
+    # Started after S1.1 (see above); S3.1 and S3.2 have been running since Section 2 finished
+    analysis = f_analysis.result()
 
     # Extract profitability analysis based on Section 2 data
-    profitability_analysis = extract_s3_1(report, model="gpt-4.1-mini")
+    profitability_analysis = analysis["s3_1"]
 
     # Save to report structure
     report.profitability_analysis.revenue_direct_cost_dynamics = profitability_analysis["revenue_direct_cost_dynamics"]
     report.profitability_analysis.operating_efficiency = profitability_analysis["operating_efficiency"] 
     report.profitability_analysis.external_oneoff_impact = profitability_analysis["external_oneoff_impact"]
     
-    print("✅ COMPLETED: S3.1 - Profitability Analysis")
+    logger.info("✅ COMPLETED: S3.1 - Profitability Analysis")
     #print(f"   Revenue & Direct-Cost Analysis: {len(profitability_analysis['revenue_direct_cost_dynamics'])} chars")
     #print(f"   Operating Efficiency Analysis: {len(profitability_analysis['operating_efficiency'])} chars")
     #print(f"   External & One-Off Impact Analysis: {len(profitability_analysis['external_oneoff_impact'])} chars")
 
     # checkpoint("Section 3.1 - Profitability Analysis")
     
-    print("\n" + "="*60)
-    print("PROCESSING: S3.2 - Financial Performance Summary")
-    print("="*60)
-
     # Extract financial performance summary based on Section 2 data
-    financial_performance_summary = extract_s3_2(report, model="gpt-4.1-mini")
+    financial_performance_summary = analysis["s3_2"]
 
     # Save to report structure
     fps = report.financial_performance_summary
@@ -2155,19 +2760,15 @@ def extract(md_file1: str, md_file2: str, *, currency_code: str = "USD", target_
     fps.future_financial_performance_projection.report_2024 = financial_performance_summary["future_financial_performance_projection_2024"]
     fps.future_financial_performance_projection.report_2023 = financial_performance_summary["future_financial_performance_projection_2023"]
 
-    print("✅ COMPLETED: S3.2 - Financial Performance Summary")
+    logger.info("✅ COMPLETED: S3.2 - Financial Performance Summary")
     # print(f"   Comprehensive Financial Health: 2024: {len(financial_performance_summary['comprehensive_financial_health_2024'])} chars, 2023: {len(financial_performance_summary['comprehensive_financial_health_2023'])} chars")
     # print(f"   Profitability Analysis: 2024: {len(financial_performance_summary['profitability_earnings_quality_2024'])} chars, 2023: {len(financial_performance_summary['profitability_earnings_quality_2023'])} chars")
     # print(f"   Operational Efficiency: 2024: {len(financial_performance_summary['operational_efficiency_2024'])} chars, 2023: {len(financial_performance_summary['operational_efficiency_2023'])} chars")
 
     # checkpoint("Section 3.2 - Financial Performance Summary")
     
-    print("\n" + "="*60)
-    print("PROCESSING: S3.3 - Business Competitiveness")
-    print("="*60)
-
     # Extract business competitiveness using RAG search
-    business_competitiveness = extract_s3_3(md_file_2024, md_file_2023, top_k=15, model="gpt-4.1-mini")
+    business_competitiveness = analysis["s3_3"]
 
     # Save to report structure
     comp = report.business_competitiveness
@@ -2176,7 +2777,7 @@ def extract(md_file1: str, md_file2: str, *, currency_code: str = "USD", target_
     comp.market_position_2024 = business_competitiveness["market_position_2024"]
     comp.market_position_2023 = business_competitiveness["market_position_2023"]
 
-    print("✅ COMPLETED: S3.3 - Business Competitiveness")
+    logger.info("✅ COMPLETED: S3.3 - Business Competitiveness")
     # print(f"   Business Model 2024: {len(business_competitiveness['business_model_2024'])} chars")
     # print(f"   Market Position 2024: {len(business_competitiveness['market_position_2024'])} chars")
     # print(f"   Business Model 2023: {len(business_competitiveness['business_model_2023'])} chars")
@@ -2184,12 +2785,8 @@ def extract(md_file1: str, md_file2: str, *, currency_code: str = "USD", target_
 
     # checkpoint("Section 3.3 - Business Competitiveness")
         
-    print("\n" + "="*60)
-    print("PROCESSING: S4.1 - Risk Factors")
-    print("="*60)
-
     # Extract risk factors using RAG search
-    risk_factors = extract_s4_1(md_file_2024, md_file_2023, top_k=15, model="gpt-4.1-mini")
+    risk_factors = analysis["s4_1"]
     
     rf = report.risk_factors  # You'll need to add this to CompanyReport
     rf.market_risks_2024 = risk_factors["market_risks_2024"]
@@ -2201,7 +2798,7 @@ def extract(md_file1: str, md_file2: str, *, currency_code: str = "USD", target_
     rf.compliance_risks_2024 = risk_factors["compliance_risks_2024"]
     rf.compliance_risks_2023 = risk_factors["compliance_risks_2023"]
 
-    print("✅ COMPLETED: S4.1 - Risk Factors")
+    logger.info("✅ COMPLETED: S4.1 - Risk Factors")
     # print(f"   Market Risks 2024: {len(risk_factors['market_risks_2024'])} chars")
     # print(f"   Operational Risks 2024: {len(risk_factors['operational_risks_2024'])} chars")
     # print(f"   Financial Risks 2024: {len(risk_factors['financial_risks_2024'])} chars")
@@ -2211,29 +2808,21 @@ def extract(md_file1: str, md_file2: str, *, currency_code: str = "USD", target_
     
     # Add this after S4.1 in your main extract function:
 
-    print("\n" + "="*60)
-    print("PROCESSING: S5.1 - Board Composition")
-    print("="*60)
-
     # Extract board composition using RAG search (2024 only)
-    board_composition = extract_s5_1(md_file_2024, top_k=15, model="gpt-4.1-mini")
+    board_composition = analysis["s5_1"]
 
     # Save to report structure (you'll need to add these fields to your CompanyReport dataclass)
     report.board_composition.members = board_composition["board_members"]
 
-    print("✅ COMPLETED: S5.1 - Board Composition")
-    print(f"   Found {len(board_composition['board_members'])} board members/executives")
+    logger.info("✅ COMPLETED: S5.1 - Board Composition")
+    logger.info(f"   Found {len(board_composition['board_members'])} board members/executives")
     # for i, member in enumerate(board_composition['board_members'][:3]):  # Show first 3
     #     print(f"   {i+1}. {member['name']} - {member['position']} - {member['total_income']}")
 
     # checkpoint("Section 5.1 - Board Composition")
             
-    print("\n" + "="*60)
-    print("PROCESSING: S5.2 - Internal Controls")
-    print("="*60)
-
     # Extract internal controls using RAG search
-    internal_controls = extract_s5_2(md_file_2024, md_file_2023, top_k=15, model="gpt-4.1-mini")
+    internal_controls = analysis["s5_2"]
 
     # Save to report structure
     ic = report.internal_controls
@@ -2248,7 +2837,7 @@ def extract(md_file1: str, md_file2: str, *, currency_code: str = "USD", target_
     ic.effectiveness.report_2024 = internal_controls["effectiveness_2024"]
     ic.effectiveness.report_2023 = internal_controls["effectiveness_2023"]
 
-    print("✅ COMPLETED: S5.2 - Internal Controls")
+    logger.info("✅ COMPLETED: S5.2 - Internal Controls")
     # print(f"   Risk Assessment 2024: {len(internal_controls['risk_assessment_procedures_2024'])} chars")
     # print(f"   Control Activities 2024: {len(internal_controls['control_activities_2024'])} chars")
     # print(f"   Monitoring Mechanisms 2024: {len(internal_controls['monitoring_mechanisms_2024'])} chars")
@@ -2256,12 +2845,8 @@ def extract(md_file1: str, md_file2: str, *, currency_code: str = "USD", target_
 
     # checkpoint("Section 5.2 - Internal Controls")
     
-    print("\n" + "="*60)
-    print("PROCESSING: S6.1 - Strategic Direction")
-    print("="*60)
-
     # Extract strategic direction using RAG search
-    strategic_direction = extract_s6_1(md_file_2024, md_file_2023, top_k=15, model="gpt-4.1-mini")
+    strategic_direction = analysis["s6_1"]
 
     # Save to report structure
     sd = report.strategic_direction
@@ -2272,19 +2857,15 @@ def extract(md_file1: str, md_file2: str, *, currency_code: str = "USD", target_
     sd.organisational_restructuring.report_2024 = strategic_direction["organisational_restructuring_2024"]
     sd.organisational_restructuring.report_2023 = strategic_direction["organisational_restructuring_2023"]
 
-    print("✅ COMPLETED: S6.1 - Strategic Direction")
+    logger.info("✅ COMPLETED: S6.1 - Strategic Direction")
     # print(f"   Mergers & Acquisition 2024: {len(strategic_direction['mergers_acquisition_2024'])} chars")
     # print(f"   New Technologies 2024: {len(strategic_direction['new_technologies_2024'])} chars")
     # print(f"   Organisational Restructuring 2024: {len(strategic_direction['organisational_restructuring_2024'])} chars")
 
     # checkpoint("Section 6.1 - Strategic Direction")
 
-    print("\n" + "="*60)
-    print("PROCESSING: S6.2 - Challenges and Uncertainties")
-    print("="*60)
-
     # Extract challenges and uncertainties using RAG search
-    challenges_uncertainties = extract_s6_2(md_file_2024, md_file_2023, top_k=15, model="gpt-4.1-mini")
+    challenges_uncertainties = analysis["s6_2"]
 
     # Save to report structure
     cu = report.challenges_uncertainties
@@ -2293,7 +2874,7 @@ def extract(md_file1: str, md_file2: str, *, currency_code: str = "USD", target_
     cu.competitive_pressures.report_2024 = challenges_uncertainties["competitive_pressures_2024"]
     cu.competitive_pressures.report_2023 = challenges_uncertainties["competitive_pressures_2023"]
 
-    print("✅ COMPLETED: S6.2 - Challenges and Uncertainties")
+    logger.info("✅ COMPLETED: S6.2 - Challenges and Uncertainties")
     # print(f"   Economic Challenges 2024: {len(challenges_uncertainties['economic_challenges_2024'])} chars")
     # print(f"   Competitive Pressures 2024: {len(challenges_uncertainties['competitive_pressures_2024'])} chars")
     # print(f"   Economic Challenges 2023: {len(challenges_uncertainties['economic_challenges_2023'])} chars")
@@ -2301,12 +2882,8 @@ def extract(md_file1: str, md_file2: str, *, currency_code: str = "USD", target_
 
     # checkpoint("Section 6.2 - Challenges and Uncertainties")
 
-    print("\n" + "="*60)
-    print("PROCESSING: S6.3 - Innovation and Development Plans")
-    print("="*60)
-
     # Extract innovation and development plans using RAG search
-    innovation_development = extract_s6_3(md_file_2024, md_file_2023, top_k=15, model="gpt-4.1-mini")
+    innovation_development = analysis["s6_3"]
 
     # Save to report structure
     id = report.innovation_development
@@ -2315,7 +2892,7 @@ def extract(md_file1: str, md_file2: str, *, currency_code: str = "USD", target_
     id.new_product_launches.report_2024 = innovation_development["new_product_launches_2024"]
     id.new_product_launches.report_2023 = innovation_development["new_product_launches_2023"]
 
-    print("✅ COMPLETED: S6.3 - Innovation and Development Plans")
+    logger.info("✅ COMPLETED: S6.3 - Innovation and Development Plans")
     # print(f"   R&D Investments 2024: {len(innovation_development['rd_investments_2024'])} chars")
     # print(f"   New Product Launches 2024: {len(innovation_development['new_product_launches_2024'])} chars")
     # print(f"   R&D Investments 2023: {len(innovation_development['rd_investments_2023'])} chars")
@@ -4,7 +4,6 @@ import os
 import shutil
 import tempfile
 import time
-from openai import OpenAI
 from dotenv import load_dotenv 
 
 from pathlib import Path
@@ -16,7 +15,7 @@ from embeddings import search_sections, build_section_embeddings, append_next_se
 import argparse
 
 load_dotenv(override=True)
-client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+from openai_client import client
 
 from enum import Enum
 
@@ -1230,7 +1229,6 @@ def llm_pick_income_statements_sections(jsonl_path: str, top_k: int = 10, batch_
 
     Returns a list of section_id strings (ranked best->worst).
     """
-    client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
 
     # 1) load sections (title + id only)
     sections: List[Dict] = []
@@ -1747,7 +1745,6 @@ def llm_pick_balance_sheet_sections(
     Use an LLM to choose top-k sections likely to contain Balance Sheet lines.
     Returns section_ids ranked best->worst.
     """
-    client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
 
     # load section titles + ids
     sections: List[Dict[str, str]] = []
@@ -2196,7 +2193,6 @@ def llm_pick_cash_flow_sections(
     Use an LLM to choose top-k sections likely to contain Cash Flow Statement lines.
     Returns section_ids ranked best->worst.
     """
-    client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
 
     # load section titles + ids
     sections: List[Dict[str, str]] = []
@@ -2731,7 +2727,6 @@ def llm_pick_operating_performance_sections(
     - 'Revenue by destination' / 'Geographic split' (UK, US, Europe, Asia Pacific, Rest of the world)
     Returns list of section_id strings ranked best->worst.
     """
-    client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
     sections: List[Dict] = []
     with open(jsonl_path, "r", encoding="utf-8") as f:
         for line in f:
@@ -2833,7 +2828,6 @@ def llm_pick_operating_performance_sections(
     - 'Revenue by destination' / 'Geographic split' (UK, US, Europe, Asia Pacific, Rest of the world)
     Returns list of section_id strings ranked best->worst.
     """
-    client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
     sections: List[Dict] = []
     with open(jsonl_path, "r", encoding="utf-8") as f:
         for line in f:
@@ -3823,7 +3817,6 @@ def llm_pick_risk_sections(jsonl_path: str, top_k: int = 10, batch_size: int = 1
      regulatory/export-control/sanctions, risk management).
     Returns a list of section_id strings (ranked best->worst).
     """
-    client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
 
     # Load minimal section metadata
     sections: List[Dict] = []
@@ -4837,7 +4830,6 @@ def extract_challenges_one(text: str, year: int, model: str = "gpt-4o-mini") ->
 
     prompt = _challenges_prompt_one(year, text)
     try:
-        client = OpenAI()
         resp = client.chat.completions.create(
             model=model,
             messages=[
@@ -4908,7 +4900,6 @@ def llm_pick_econ_sections(jsonl_path: str, top_k: int = 8, batch_size: int = 15
             """.strip()
 
         try:
-            client = OpenAI()
             print("trying to get response openai")
             print(f"length: {len(user_prompt)}")
             resp = client.chat.completions.create(
@@ -4994,7 +4985,6 @@ def llm_pick_comp_sections(jsonl_path: str, top_k: int = 8, batch_size: int = 15
             """.strip()
 
         try:
-            client = OpenAI()
             resp = client.chat.completions.create(
                 model=model,
                 messages=[{"role":"system","content":system_msg},
@@ -5196,7 +5186,6 @@ def llm_pick_rd_sections(jsonl_path: str, top_k: int, batch_size: int = 150, mod
             {json.dumps(compact, ensure_ascii=False)}
         """.strip()
         try:
-            client = OpenAI()
             resp = client.chat.completions.create(
                 model=model,
                 messages=[{"role":"system","content":system_msg},
@@ -5277,7 +5266,6 @@ def llm_pick_launch_sections(jsonl_path: str, top_k, batch_size: int = 150, mode
             {json.dumps(compact, ensure_ascii=False)}
         """.strip()
         try:
-            client = OpenAI()
             resp = client.chat.completions.create(
                 model=model,
                 messages=[{"role":"system","content":system_msg},
@@ -5362,7 +5350,6 @@ def _launch_prompt_one(year: int, text_block: str, co: str, target_lang: Lang =
 
 def extract_rd_one(text: str, year: int, model: str = "gpt-4o-mini", target_lang: Lang = Lang.EN) -> str:
     if not (text or "").strip(): return "N/A"
-    client = OpenAI()
     prompt = _rd_prompt_one(year, text, get_company_name(), target_lang)
     resp = client.chat.completions.create(
         model=model,
@@ -5377,7 +5364,6 @@ def extract_rd_one(text: str, year: int, model: str = "gpt-4o-mini", target_lang
 
 def extract_launch_one(text: str, year: int, model: str = "gpt-4o-mini", target_lang: Lang = Lang.EN) -> str:
     if not (text or "").strip(): return "N/A"
-    client = OpenAI()
     prompt = _launch_prompt_one(year, text, get_company_name(), target_lang)
     resp = client.chat.completions.create(
         model=model,
@@ -0,0 +1,96 @@
+"""
+Content-addressed disk cache for pipeline stages.
+
+Entries live under .cache/<stage>/<key>.json where the key is a sha256 over
+everything that determines the stage's output (file digests, queries, model,
+prompt...), so re-running on unchanged inputs skips the work.
+"""
+
+import functools
+import hashlib
+import inspect
+import json
+import os
+import orjson
+import sys
+import tempfile
+from pathlib import Path
+from typing import Optional, Tuple
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from utils.pdf_hash import file_digest
+
+CACHE_DIR = Path(".cache")
+
+
+def make_key(*parts) -> str:
+    """Stable sha256 key over arbitrary JSON-serialisable parts."""
+    payload = json.dumps(parts, ensure_ascii=False, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def load(stage: str, key: str) -> Optional[dict]:
+    path = CACHE_DIR / stage / f"{key}.json"
+    try:
+        with open(path, "rb") as f:
+            return orjson.loads(f.read())
+    except (FileNotFoundError, orjson.JSONDecodeError):
+        return None
+
+
+def save(stage: str, key: str, value: dict) -> None:
+    out_dir = CACHE_DIR / stage
+    out_dir.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=out_dir, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            # non-str keys are stringified, as json.dump would
+            f.write(orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS))
+        os.replace(tmp, out_dir / f"{key}.json")
+    except Exception:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+
+
+def cached_llm(stage: str, key_args: Tuple[str, ...]):
+    """
+    Decorator caching a dict-returning LLM call under .cache/<stage>/.
+
+    The key covers the named arguments of the call (prompt, model, ...), so any
+    change to the prompt text, its retrieved context or the request settings
+    is a miss. Empty results are not stored, so failed calls are retried on
+    the next run. Works on both plain and async functions.
+    """
+    def decorate(fn):
+        sig = inspect.signature(fn)
+
+        def key_for(args, kwargs) -> str:
+            bound = sig.bind(*args, **kwargs)
+            bound.apply_defaults()
+            return make_key(stage, *(bound.arguments[name] for name in key_args))
+
+        if inspect.iscoroutinefunction(fn):
+            @functools.wraps(fn)
+            async def wrapper(*args, **kwargs):
+                key = key_for(args, kwargs)
+                hit = load(stage, key)
+                if hit is not None:
+                    return hit
+                result = await fn(*args, **kwargs)
+                if result:
+                    save(stage, key, result)
+                return result
+        else:
+            @functools.wraps(fn)
+            def wrapper(*args, **kwargs):
+                key = key_for(args, kwargs)
+                hit = load(stage, key)
+                if hit is not None:
+                    return hit
+                result = fn(*args, **kwargs)
+                if result:
+                    save(stage, key, result)
+                return result
+        return wrapper
+    return decorate
@@ -0,0 +1,26 @@
+import sys
+import queue
+import atexit
+import logging
+import logging.handlers
+
+# Progress messages are handed to a queue and written by a background listener
+# thread, so the pipeline never blocks on console I/O.
+_log_queue = queue.Queue(-1)
+_log_listener = logging.handlers.QueueListener(_log_queue, logging.StreamHandler(sys.stdout))
+_log_listener.start()
+atexit.register(_log_listener.stop)
+# Child loggers inherit this level, so one setLevel here quiets every stage.
+# Plain logging.getLogger("findr.<name>") loggers (e.g. in utils/) propagate here.
+_root = logging.getLogger("findr")
+_root.setLevel(logging.INFO)
+_root.addHandler(logging.handlers.QueueHandler(_log_queue))
+_root.propagate = False
+
+def get_logger(name: str) -> logging.Logger:
+    """Logger whose records go through the shared queue listener."""
+    logger = logging.getLogger(name)
+    if not logger.handlers:
+        logger.addHandler(logging.handlers.QueueHandler(_log_queue))
+        logger.propagate = False
+    return logger
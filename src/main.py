@@ -1,18 +1,102 @@
 import os
 import sys
+import logging
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from mistral_parse import process_pdf
-from dotenv import load_dotenv
-from mistralai import Mistral
-from extraction import extract, Lang
-from report_generator import DDRGenerator
-from embeddings import build_section_embeddings
-from normalize_and_segment import normalize_and_segment_markdown
 
+# The OCR, embedding and LLM stacks are imported where they are first needed
+# so --help and argument errors return without loading them
 sys.path.insert(0, str(Path(__file__).parent.parent))
-from utils.clean_markdown import normalize_file, clean_file
-from utils.check_files import check_existing_files, determine_report_years
+from utils.clean_markdown import normalize_and_clean_file
+from utils.check_files import YearArtifacts, check_existing_files, determine_report_years
+from utils.pdf_hash import write_meta
+from log import get_logger
+
+logger = get_logger("findr.main")
+
+
+def _fresh(out: Path, *sources: Path) -> bool:
+    """True if out exists and is at least as new as every source."""
+    try:
+        mtime = out.stat().st_mtime
+        return all(mtime >= src.stat().st_mtime for src in sources)
+    except FileNotFoundError:
+        return False
+
+
+def prepare_report(year: str, pdf_path: str, files: YearArtifacts, output_dir: Path) -> Path:
+    """
+    Run one annual report through conversion, cleaning, segmentation and
+    embedding, skipping any stage whose output is already up to date.
+    Returns the path of the cleaned markdown file.
+    """
+    # Artifacts are named by the PDF's content hash so renamed copies share them
+    base = files.key
+    md_file = files.md_path
+    jsonl_file = files.jsonl_path
+    write_meta(base, pdf_path, output_dir)
+    if not files.md_exists:
+        from mistral_parse import get_client, process_pdf
+        try:
+            process_pdf(Path(pdf_path), output_dir, get_client(), output_stem=base)
+        except Exception as e:
+            # Nothing downstream can run without the markdown, so fail this year's worker here
+            logger.error(f"❌ Failed to convert {year} PDF to markdown: {e}")
+            raise
+        # Only now does the markdown exist for segmentation and embedding
+        files.md_exists = md_file.is_file()
+        if not files.md_exists:
+            raise FileNotFoundError(f"OCR for {year} report did not produce {md_file}")
+    else:
+        logger.info(f"   ✅ Reusing existing markdown for {year}: {md_file.name}")
+
+    try:
+        normalize_and_clean_file(md_file)
+    except Exception as e:
+        logger.error(f"Failed to normalize and clean {year} markdown: {e}")
+
+    # Create jsonl file
+    try:
+        # Cleaning only rewrites the markdown when it changes, so an older JSONL is stale
+        if not _fresh(jsonl_file, md_file):
+            logger.info(f"   🔹 Segmenting {md_file.name}...")
+            from normalize_and_segment import normalize_and_segment_markdown
+            with open(md_file, "r", encoding="utf-8") as f:
+                sections = normalize_and_segment_markdown(f, base)
+            files.jsonl_exists = True
+            logger.info(f"   ✅ Created {len(sections)} sections for {year} report")
+        else:
+            logger.info(f"   ✅ JSONL already exists for {year} report: {jsonl_file.name}")
+    except Exception as e:
+        logger.error(f"❌ Failed to segment {year} markdown: {e}")
+        logger.error(f"   Continuing anyway - embeddings may be skipped if JSONL is missing")
+
+    # Create embeddings for markdown file
+    try:
+        # build_section_embeddings compares content, model and chunker itself
+        if files.jsonl_exists and files.md_exists:
+            logger.info(f"   🔹 Building embeddings for {year} report...")
+            from embeddings import build_section_embeddings
+            build_section_embeddings(str(jsonl_file), str(md_file))
+        else:
+            missing = [str(p) for p, ok in ((jsonl_file, files.jsonl_exists), (md_file, files.md_exists)) if not ok]
+            logger.warning(f"   ⚠️  Skipping {year} embeddings — missing: {', '.join(missing)}")
+    except Exception as e:
+        logger.error(f"Failed to build {year} embeddings: {e}")
+
+    return md_file
+
+
+def _validate_inputs(*paths) -> None:
+    """Exit with a readable message if any input PDF is missing or unreadable, before the heavy imports."""
+    for p in paths:
+        if not Path(p).is_file():
+            logger.error(f"❌ PDF not found: {p}")
+            sys.exit(1)
+        if not os.access(p, os.R_OK):
+            logger.error(f"❌ PDF unreadable: {p}")
+            sys.exit(1)
 
 
 def main():
@@ -24,8 +108,14 @@ def main():
     arg_parser.add_argument('--pdf_2024', required=True, help='Path to first annual report PDF (preferably 2024 or more recent)')
     arg_parser.add_argument('--pdf_2023', required=True, help='Path to second annual report PDF (preferably 2023 or older)')
     arg_parser.add_argument('--lang', choices=['EN', 'ZH_SIM', 'ZH_TR', 'IN'], required=True, help='Target language for extraction and prompts (default: EN)')
+    arg_parser.add_argument('--workers', type=int, default=2, help='Reports converted, segmented and embedded concurrently (default: 2)')
+    arg_parser.add_argument('--quiet', action='store_true', help='Only log warnings and errors')
     
     args = arg_parser.parse_args()
+    if args.quiet:
+        logging.getLogger("findr").setLevel(logging.WARNING)
+    _validate_inputs(args.pdf_2024, args.pdf_2023)
+    from extraction import extract, Lang
     pdf1 = args.pdf_2024
     pdf2 = args.pdf_2023
     target_lang = Lang[args.lang]
@@ -33,15 +123,15 @@ def main():
     base_2024 = None
     base_2023 = None
 
-    print(f"\n{'='*60}")
-    print(f"FinDDR 2025 Financial Document Deep Research Challenge")
-    print(f"{'='*60}")
-    print(f"Processing annual reports:")
-    print(f"  File 1: {pdf1}")
-    print(f"  File 2: {pdf2}")
-    print(f"  Target language: {target_lang.value}")
+    logger.info(f"\n{'='*60}")
+    logger.info(f"FinDDR 2025 Financial Document Deep Research Challenge")
+    logger.info(f"{'='*60}")
+    logger.info(f"Processing annual reports:")
+    logger.info(f"  File 1: {pdf1}")
+    logger.info(f"  File 2: {pdf2}")
+    logger.info(f"  Target language: {target_lang.value}")
     
-    print(f"{'='*60}\n")
+    logger.info(f"{'='*60}\n")
 
     try:
         pdf_2024, pdf_2023 = determine_report_years(pdf1, pdf2)
@@ -49,137 +139,60 @@ def main():
         base_2024 = Path(pdf_2024).stem
         base_2023 = Path(pdf_2023).stem
         
+        from dotenv import load_dotenv
         load_dotenv(override=True)
-        api_key = os.getenv("MISTRAL_API_KEY")
-        if not api_key:
-            raise RuntimeError("MISTRAL_API_KEY is not set in environment")
-        client = Mistral(api_key=api_key)
         output_dir = Path("data/parsed")
         output_dir.mkdir(parents=True, exist_ok=True)
         
         # Check existing files
         files_2024 = check_existing_files(pdf_2024)
         files_2023 = check_existing_files(pdf_2023)
+        if not (files_2024.md_exists and files_2023.md_exists):
+            # Build the shared OCR client up front so a missing API key fails before any work starts
+            from mistral_parse import get_client
+            get_client()
         
-        print(f"Checking existing files:")
-        print(f"   2024 Report ({Path(pdf_2024).name}):")
-        print(f"     • Markdown: {'✅' if files_2024['markdown'] else '❌'}")
-        print(f"     • JSONL: {'✅' if files_2024['jsonl'] else '❌'}")
-        print(f"     • Embeddings: {'✅' if files_2024['embeddings'] else '❌'}")
-        print(f"   2023 Report ({Path(pdf_2023).name}):")
-        print(f"     • Markdown: {'✅' if files_2023['markdown'] else '❌'}")
-        print(f"     • JSONL: {'✅' if files_2023['jsonl'] else '❌'}")
-        print(f"     • Embeddings: {'✅' if files_2023['embeddings'] else '❌'}")
-        print()
-        
-        # Process both pdfs to markdown and saves to data 
-        print(" Step 1: Converting PDF documents to markdown...")
-        if not files_2024['markdown']:
-            process_pdf(Path(pdf_2024), output_dir, client)
-        else:
-            print(f"   ✅ Reusing existing markdown for 2024: {files_2024['md_path'].name}")
-        if not files_2023['markdown']:
-            process_pdf(Path(pdf_2023), output_dir, client)
-        else:
-            print(f"   ✅ Reusing existing markdown for 2023: {files_2023['md_path'].name}")
-            
-        print(f"\n Step 2: Processing markdown files...")
-        md_file_2024 = files_2024['md_path'] if files_2024['markdown'] else Path("data/parsed") / f"{Path(pdf_2024).stem}.md"
-        md_file_2023 = files_2023['md_path'] if files_2023['markdown'] else Path("data/parsed") / f"{Path(pdf_2023).stem}.md"
-        
-        try: 
-            normalize_file(md_file_2024)
-            normalize_file(md_file_2023)
-            clean_file(md_file_2024)
-            clean_file(md_file_2023)
-            
-        except Exception as e:
-            print(f"Failed to normalize and clean markdown files: {e}")
-        
-        # Create jsonl files 
-        print("\n Step 2a: Segmenting markdown files into structured sections...")
-        try:
-            jsonl_2024 = Path("data/sections_report") / f"{base_2024}.jsonl"
-            jsonl_2023 = Path("data/sections_report") / f"{base_2023}.jsonl"
-            
-            # Segment 2024 markdown to jsonl
-            if not jsonl_2024.exists():
-                print(f"   🔹 Segmenting {md_file_2024.name}...")
-                with open(md_file_2024, "r", encoding="utf-8") as f:
-                    md_content_2024 = f.read()
-                sections_2024 = normalize_and_segment_markdown(md_content_2024, base_2024)
-                print(f"   ✅ Created {len(sections_2024)} sections for 2024 report")
-            else:
-                print(f"   ✅ JSONL already exists for 2024 report: {jsonl_2024.name}")
-            
-            # Segment 2023 markdown to jsonl
-            if not jsonl_2023.exists():
-                print(f"   🔹 Segmenting {md_file_2023.name}...")
-                with open(md_file_2023, "r", encoding="utf-8") as f:
-                    md_content_2023 = f.read()
-                sections_2023 = normalize_and_segment_markdown(md_content_2023, base_2023)
-                print(f"   ✅ Created {len(sections_2023)} sections for 2023 report")
-            else:
-                print(f"   ✅ JSONL already exists for 2023 report: {jsonl_2023.name}")
-                
-        except Exception as e:
-            print(f"❌ Failed to segment markdown files: {e}")
-            print(f"   Continuing anyway - embeddings may be skipped if JSONL is missing")
-        
+        logger.info(f"Checking existing files:")
+        logger.info(f"   2024 Report ({Path(pdf_2024).name}):")
+        logger.info(f"     • Markdown: {'✅' if files_2024.md_exists else '❌'}")
+        logger.info(f"     • JSONL: {'✅' if files_2024.jsonl_exists else '❌'}")
+        logger.info(f"     • Embeddings: {'✅' if files_2024.emb_exists else '❌'}")
+        logger.info(f"   2023 Report ({Path(pdf_2023).name}):")
+        logger.info(f"     • Markdown: {'✅' if files_2023.md_exists else '❌'}")
+        logger.info(f"     • JSONL: {'✅' if files_2023.jsonl_exists else '❌'}")
+        logger.info(f"     • Embeddings: {'✅' if files_2023.emb_exists else '❌'}")
+        logger.info("")
         
-        # create embeddings for markdown files 
-        print("\n Step 2b: Building embeddings for semantic search...")
-        try:
-            
-            jsonl_2024 = Path("data/sections_report") / f"{base_2024}.jsonl"
-            jsonl_2023 = Path("data/sections_report") / f"{base_2023}.jsonl"
-
-            # Build embeddings for 2024 report
-            if jsonl_2024.exists() and md_file_2024.exists():
-                print(f"   🔹 Building embeddings for 2024 report...")
-                build_section_embeddings(str(jsonl_2024), str(md_file_2024))
-            else:
-                missing = []
-                if not jsonl_2024.exists():
-                    missing.append(str(jsonl_2024))
-                if not md_file_2024.exists():
-                    missing.append(str(md_file_2024))
-                print(f"   ⚠️  Skipping 2024 embeddings — missing: {', '.join(missing)}")
-
-            # Build embeddings for 2023 report
-            if jsonl_2023.exists() and md_file_2023.exists():
-                print(f"   🔹 Building embeddings for 2023 report...")
-                build_section_embeddings(str(jsonl_2023), str(md_file_2023))
-            else:
-                missing = []
-                if not jsonl_2023.exists():
-                    missing.append(str(jsonl_2023))
-                if not md_file_2023.exists():
-                    missing.append(str(md_file_2023))
-                print(f"   ⚠️  Skipping 2023 embeddings — missing: {', '.join(missing)}")
-        except Exception as e:
-            print(f"Failed to build embeddings: {e}")
+        # Each report goes PDF -> markdown -> sections -> embeddings on its own;
+        # the chains are mostly network-bound so the two years overlap on threads
+        logger.info(" Steps 1-2: Converting, segmenting and embedding both reports...")
+        with ThreadPoolExecutor(max_workers=max(1, args.workers)) as ex:
+            f_2024 = ex.submit(prepare_report, "2024", pdf_2024, files_2024, output_dir)
+            f_2023 = ex.submit(prepare_report, "2023", pdf_2023, files_2023, output_dir)
+            md_file_2024 = f_2024.result()
+            md_file_2023 = f_2023.result()
 
-        print(f"\n Step 3: Generating comprehensive research report...")
+        logger.info(f"\n Step 3: Generating comprehensive research report...")
         try:
             report = extract(str(md_file_2024), str(md_file_2023), currency_code="USD", target_lang=target_lang)
         except Exception as e:
-            print(f"Failed to extract from reports: {e}")
+            logger.error(f"Failed to extract from reports: {e}")
         
+        from report_generator import DDRGenerator
         company_name = base_2024.split('_')[0] if '_' in base_2024 else base_2024
         generator = DDRGenerator(report, currency_code="USD")
         output_dir = Path("artifacts")
         output_dir.mkdir(parents=True, exist_ok=True)
         output_file = output_dir / f"finfiler_report_{company_name}.md"
         generator.save_report(str(output_file))
-        print(f"✅ Report saved to: {output_file}")   
+        logger.info(f"✅ Report saved to: {output_file}")   
         
     except FileNotFoundError as e:
-        print(f"❌ File Error: {str(e)}")
+        logger.error(f"❌ File Error: {str(e)}")
         sys.exit(1)
     except Exception as e:
-        print(f"❌ Error processing {pdf1} and {pdf2}: {str(e)}")
-        print(f"💡 Hint: Make sure both PDF files exist and are readable")
+        logger.error(f"❌ Error processing {pdf1} and {pdf2}: {str(e)}")
+        logger.error(f"💡 Hint: Make sure both PDF files exist and are readable")
         sys.exit(1)
 
 
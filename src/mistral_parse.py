@@ -1,5 +1,7 @@
 from pathlib import Path
-import json
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
+import orjson
 import re
 from typing import List, Dict
 from mistralai import Mistral, DocumentURLChunk
@@ -7,9 +9,18 @@ from mistralai.models import OCRResponse
 
 from dotenv import load_dotenv
 import os
+from log import get_logger
 
 load_dotenv(override=True)
-client = Mistral(api_key=os.getenv("MISTRAL_API_KEY"))
+logger = get_logger("findr.mistral_parse")
+
+@lru_cache(maxsize=1)
+def get_client() -> Mistral:
+    """Shared Mistral client, built on first use so its HTTP connections are reused across PDFs."""
+    api_key = os.getenv("MISTRAL_API_KEY")
+    if not api_key:
+        raise RuntimeError("MISTRAL_API_KEY is not set in environment")
+    return Mistral(api_key=api_key)
 
 def replace_images_in_markdown(markdown_str: str, images_dict: dict) -> str:
     """Replace image placeholders with base64-encoded image data."""
@@ -27,9 +38,9 @@ def get_combined_markdown(ocr_response: OCRResponse) -> str:
         markdowns.append(replace_images_in_markdown(page.markdown, image_data))
     return "\n\n".join(markdowns)
 
-def process_pdf(pdf_path: Path, output_dir: Path, client: Mistral):
-    """Process one PDF file with Mistral OCR and save Markdown output."""
-    print(f"🔹 Processing: {pdf_path.name}")
+def process_pdf(pdf_path: Path, output_dir: Path, client: Mistral, output_stem: str = None):
+    """Process one PDF file with Mistral OCR and save Markdown output (named after output_stem, default the PDF stem)."""
+    logger.info(f"🔹 Processing: {pdf_path.name}")
 
     uploaded_file = client.files.upload(
         file={"file_name": pdf_path.name, "content": pdf_path.read_bytes()},
@@ -44,16 +55,24 @@ def process_pdf(pdf_path: Path, output_dir: Path, client: Mistral):
     )
 
     md_content = get_combined_markdown(pdf_response)
-    output_file = output_dir / f"{pdf_path.stem}.md"
+    output_file = output_dir / f"{output_stem or pdf_path.stem}.md"
 
-    with open(output_file, "w", encoding="utf-8") as f:
+    # Written beside the target and swapped in, so an interrupted run never leaves
+    # a truncated markdown file for the next run to reuse
+    tmp_file = output_file.with_suffix(output_file.suffix + ".tmp")
+    with open(tmp_file, "w", encoding="utf-8") as f:
         f.write(md_content)
+    os.replace(tmp_file, output_file)
 
-    print(f"✅ Saved Markdown to {output_file}")
+    logger.info(f"✅ Saved Markdown to {output_file}")
 
 
 HEADING_RE = re.compile(r'^(#{1,6})\s+(.*)$', re.M)
 TABLE_BLOCK_RE = re.compile(r'(?:^\|.*\|\s*\n)+^\|(?:\s*:?-+:?\s*\|)+\s*\n(?:^\|.*\|\s*\n)+', re.M)
+# Segmenting only splits on ## headings
+H2_RE = re.compile(r'^##\s+(.+)$')
+SLUG_STRIP_RE = re.compile(r'[^\w\s-]')
+SLUG_SEP_RE = re.compile(r'[\s_-]+')
 
 def split_by_h2(md_text: str) -> List[Dict]:
     sections: List[Dict] = []
@@ -80,8 +99,8 @@ def split_by_h2(md_text: str) -> List[Dict]:
 def slugify(text):
     """Convert text to a URL-friendly slug"""
     # Remove special chars, convert to lowercase, replace spaces with hyphens
-    slug = re.sub(r'[^\w\s-]', '', text.lower())
-    slug = re.sub(r'[\s_-]+', '-', slug)
+    slug = SLUG_STRIP_RE.sub('', text.lower())
+    slug = SLUG_SEP_RE.sub('-', slug)
     return slug.strip('-')
 
 def extract_tables_from_lines(lines, start_idx, end_idx):
@@ -133,14 +152,12 @@ def normalize_and_segment_markdown(markdown_text, doc_filename):
     lines = markdown_text.split('\n')
     sections = []
 
-    # Since all headings are ##, just look for those
-    heading_pattern = r'^##\s+(.+)$'
-
     current_section = None
     section_start_line = 0
 
     for line_idx, line in enumerate(lines):
-        match = re.match(heading_pattern, line.strip())
+        # Since all headings are ##, just look for those
+        match = H2_RE.match(line.strip())
 
         if match:
             # Close previous section if exists
@@ -185,7 +202,7 @@ def normalize_and_segment_markdown(markdown_text, doc_filename):
 
     # Save as JSONL file
     jsonl_file = f"data/sections_report/{doc_filename}.jsonl"
-    with open(jsonl_file, 'w', encoding='utf-8') as f:
+    with open(jsonl_file, 'wb') as f:
         for section in sections:
             # Create record for JSONL
             record = {
@@ -202,7 +219,7 @@ def normalize_and_segment_markdown(markdown_text, doc_filename):
                 'lang': section['lang'],
                 'char_count': len(section['content']) if section['content'] else 0
             }
-            f.write(json.dumps(record, ensure_ascii=False) + '\n')
+            f.write(orjson.dumps(record) + b'\n')
 
     print(f"JSONL saved to: {jsonl_file}")
     return sections
@@ -251,7 +268,7 @@ def process_single_markdown(md_file_path: str, force_reparse: bool = False) -> b
         return False
 
 
-def process_markdown_folder(folder_path: str, force_reparse: bool = False) -> list[str]:
+def process_markdown_folder(folder_path: str, force_reparse: bool = False, workers: int = 2) -> list[str]:
     folder = Path(folder_path)
     if not folder.exists() or not folder.is_dir():
         raise FileNotFoundError(f"Folder not found: {folder}")
@@ -264,11 +281,13 @@ def process_markdown_folder(folder_path: str, force_reparse: bool = False) -> li
     print(f"📁 Found {len(md_files)} markdown files in {folder}")
     processed = []
 
-    for i, md_file in enumerate(md_files, 1):
-        print(f"\n📋 Processing {i}/{len(md_files)}: {md_file.name}")
-        ok = process_single_markdown(str(md_file), force_reparse=force_reparse)
-        if ok:
-            processed.append(str(Path("data/sections_report") / f"{md_file.stem}.jsonl"))
+    # Segmentation is pure-Python CPU work with no shared state, so documents go to separate processes
+    with ProcessPoolExecutor(max_workers=max(1, workers)) as ex:
+        results = ex.map(process_single_markdown, [str(md_file) for md_file in md_files], [force_reparse] * len(md_files))
+        for i, (md_file, ok) in enumerate(zip(md_files, results), 1):
+            print(f"\n📋 Processed {i}/{len(md_files)}: {md_file.name}")
+            if ok:
+                processed.append(str(Path("data/sections_report") / f"{md_file.stem}.jsonl"))
 
     print(f"\n🎉 Completed! Processed {len(processed)}/{len(md_files)} files")
     print(f"� JSONL files saved to: data/sections_report")
@@ -308,6 +327,12 @@ def main():
         action="store_true",
         help="Recursively segment all *_mistral.md files under a folder into JSONL"
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=2,
+        help="Documents processed concurrently when the input is a folder (default: 2)"
+    )
 
     args = parser.parse_args()
 
@@ -316,7 +341,7 @@ def main():
 
     # Segmentation modes
     if args.recursive_jsonl:
-        return process_markdown_folder(str(input_path), force_reparse=args.force)
+        return process_markdown_folder(str(input_path), force_reparse=args.force, workers=args.workers)
 
     if args.only_jsonl:
         if not input_path.exists() or input_path.suffix.lower() != ".md":
@@ -336,17 +361,20 @@ def main():
         if not pdfs:
             print(f"⚠️  No PDFs found in {input_path}")
             return
-        for pdf_path in pdfs:
-            try:
-                process_pdf(pdf_path, outdir, client)
-            except Exception as e:
-                print(f"❌ Error with {pdf_path.name}: {e}")
+        # OCR is network-bound, so the shared client is used from threads
+        with ThreadPoolExecutor(max_workers=max(1, args.workers)) as ex:
+            futures = {pdf_path: ex.submit(process_pdf, pdf_path, outdir, get_client()) for pdf_path in pdfs}
+            for pdf_path, future in futures.items():
+                try:
+                    future.result()
+                except Exception as e:
+                    print(f"❌ Error with {pdf_path.name}: {e}")
     else:
         if input_path.suffix.lower() != ".pdf":
             print(f"❌ File must be a PDF for OCR mode: {input_path}")
             return
         try:
-            process_pdf(input_path, outdir, client)
+            process_pdf(input_path, outdir, get_client())
         except Exception as e:
             print(f"❌ Error processing {input_path.name}: {e}")
 
@@ -1,13 +1,20 @@
+import io
+import os
 import re
-import json
+import orjson
 
 from pathlib import Path
 from typing import List, Dict, Optional, Tuple, Any
-from report_generator import BoardMember, CompanyReport, CoreCompetency, DDRGenerator, FinancialData
-from embeddings import search_sections, build_section_embeddings, append_next_sections
+from log import get_logger
+
+logger = get_logger("findr.segment")
 
 HEADING_RE = re.compile(r'^(#{1,6})\s+(.*)$', re.M)
 TABLE_BLOCK_RE = re.compile(r'(?:^\|.*\|\s*\n)+^\|(?:\s*:?-+:?\s*\|)+\s*\n(?:^\|.*\|\s*\n)+', re.M)
+# Segmenting only splits on ## headings
+H2_RE = re.compile(r'^##\s+(.+)$')
+SLUG_STRIP_RE = re.compile(r'[^\w\s-]')
+SLUG_SEP_RE = re.compile(r'[\s_-]+')
 
 def split_by_h2(md_text: str) -> List[Dict]:
     sections: List[Dict] = []
@@ -34,18 +41,18 @@ def split_by_h2(md_text: str) -> List[Dict]:
 def slugify(text):
     """Convert text to a URL-friendly slug"""
     # Remove special chars, convert to lowercase, replace spaces with hyphens
-    slug = re.sub(r'[^\w\s-]', '', text.lower())
-    slug = re.sub(r'[\s_-]+', '-', slug)
+    slug = SLUG_STRIP_RE.sub('', text.lower())
+    slug = SLUG_SEP_RE.sub('-', slug)
     return slug.strip('-')
 
-def extract_tables_from_lines(lines, start_idx, end_idx):
-    """Extract markdown tables and their line ranges from a section"""
+def extract_tables_from_lines(lines, start_idx, end_idx, offset=0):
+    """Extract markdown tables and their line ranges from a section (line numbers shifted by offset)"""
     tables = []
     in_table = False
     table_start = None
     table_lines = []
 
-    for i, line in enumerate(lines[start_idx:end_idx], start=start_idx):
+    for i, line in enumerate(lines[start_idx:end_idx], start=start_idx + offset):
         line = line.strip()
 
         # Check if line contains table markers
@@ -72,91 +79,103 @@ def extract_tables_from_lines(lines, start_idx, end_idx):
     if in_table and table_lines:
         tables.append({
             'start_line': table_start,
-            'end_line': start_idx + len(lines[start_idx:end_idx]) - 1,
+            'end_line': offset + start_idx + len(lines[start_idx:end_idx]) - 1,
             'content': '\n'.join(table_lines),
             'row_count': len([l for l in table_lines if '|' in l])
         })
 
     return tables
 
-def normalize_and_segment_markdown(markdown_text, doc_filename):
+def _iter_lines(markdown):
+    """Yield lines without their newline, matching str.split('\\n') for both strings and open files"""
+    if isinstance(markdown, str):
+        markdown = io.StringIO(markdown, newline='\n')
+    line = ''
+    for line in markdown:
+        yield line[:-1] if line.endswith('\n') else line
+    if line == '' or line.endswith('\n'):
+        yield ''
+
+def normalize_and_segment_markdown(markdown, doc_filename):
     """
     Normalize & segment markdown into consistent sections
-    Returns sections array and saves JSONL file
+    Accepts the markdown text or an open text file; only the current section is held in memory
+    Returns sections array (without content) and saves JSONL file
     """
-    lines = markdown_text.split('\n')
     sections = []
 
-    # Since all headings are ##, just look for those
-    heading_pattern = r'^##\s+(.+)$'
-
     current_section = None
+    section_lines = []
     section_start_line = 0
+    line_idx = -1
 
-    for line_idx, line in enumerate(lines):
-        match = re.match(heading_pattern, line.strip())
-
-        if match:
-            # Close previous section if exists
-            if current_section is not None:
-                current_section['end_line'] = line_idx - 1
-                current_section['content'] = '\n'.join(lines[section_start_line:line_idx])
-
-                # Extract tables from this section
-                current_section['tables'] = extract_tables_from_lines(
-                    lines, section_start_line, line_idx
-                )
-
-                sections.append(current_section)
-
-            # Start new section
-            title = match.group(1).strip()
-            section_id = slugify(title)
-
-            current_section = {
-                'section_id': section_id,
-                'title': title,
-                'section_number': len(sections) + 1,  
-                'start_line': line_idx + 1,
-                'end_line': None, 
-                'content': None,  
-                'tables': [],
-                'lang': 'EN'  
-            }
-            section_start_line = line_idx
-
-    # Close final section
-    if current_section is not None:
-        current_section['end_line'] = len(lines) - 1
-        current_section['content'] = '\n'.join(lines[section_start_line:])
+    def close_section(end_idx):
+        current_section['end_line'] = end_idx
+        current_section['char_count'] = sum(map(len, section_lines)) + len(section_lines) - 1
+        # Extract tables from this section
         current_section['tables'] = extract_tables_from_lines(
-            lines, section_start_line, len(lines)
+            section_lines, 0, len(section_lines), offset=section_start_line
         )
         sections.append(current_section)
+        f.write(orjson.dumps(_section_record(current_section)) + b'\n')
 
     # Ensure parsed directory exists
     Path("data/sections_report").mkdir(parents=True, exist_ok=True)
 
-    # Save as JSONL file
+    # Save as JSONL file, written section by section and moved into place once complete
     jsonl_file = f"data/sections_report/{doc_filename}.jsonl"
-    with open(jsonl_file, 'w', encoding='utf-8') as f:
-        for section in sections:
-            # Create record for JSONL
-            record = {
-                'section_id': section['section_id'],
-                'title': section['title'],
-                'section_number': section['section_number'],  # section numbering 
-                'lines': [section['start_line'], section['end_line']],
-                'tables': [
-                    {
-                        'lines': [t['start_line'], t['end_line']],
-                        'row_count': t['row_count']
-                    } for t in section['tables']
-                ],
-                'lang': section['lang'],
-                'char_count': len(section['content']) if section['content'] else 0
-            }
-            f.write(json.dumps(record, ensure_ascii=False) + '\n')
-
-    print(f"        JSONL saved to: {jsonl_file}")
-    return sections
\ No newline at end of file
+    tmp_file = f"{jsonl_file}.tmp"
+    with open(tmp_file, 'wb') as f:
+        for line_idx, line in enumerate(_iter_lines(markdown)):
+            # Since all headings are ##, just look for those
+            match = H2_RE.match(line.strip())
+
+            if match:
+                # Close previous section if exists
+                if current_section is not None:
+                    close_section(line_idx - 1)
+
+                # Start new section
+                title = match.group(1).strip()
+                section_id = slugify(title)
+
+                current_section = {
+                    'section_id': section_id,
+                    'title': title,
+                    'section_number': len(sections) + 1,  
+                    'start_line': line_idx + 1,
+                    'end_line': None, 
+                    'char_count': 0,  
+                    'tables': [],
+                    'lang': 'EN'  
+                }
+                section_start_line = line_idx
+                section_lines = []
+
+            if current_section is not None:
+                section_lines.append(line)
+
+        # Close final section
+        if current_section is not None:
+            close_section(line_idx)
+    os.replace(tmp_file, jsonl_file)
+
+    logger.info(f"        JSONL saved to: {jsonl_file}")
+    return sections
+
+def _section_record(section):
+    """Create record for JSONL"""
+    return {
+        'section_id': section['section_id'],
+        'title': section['title'],
+        'section_number': section['section_number'],  # section numbering 
+        'lines': [section['start_line'], section['end_line']],
+        'tables': [
+            {
+                'lines': [t['start_line'], t['end_line']],
+                'row_count': t['row_count']
+            } for t in section['tables']
+        ],
+        'lang': section['lang'],
+        'char_count': section['char_count']
+    }
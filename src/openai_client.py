@@ -0,0 +1,47 @@
+"""
+Process-wide OpenAI clients.
+
+Extraction and embeddings share one sync and one async client, so every call
+reuses the same pooled, kept-alive connections instead of paying a TCP+TLS
+handshake per client. Import `client` / `aclient` from here; don't build new
+OpenAI() instances in the pipeline.
+"""
+
+import atexit
+import os
+
+import httpx
+from dotenv import load_dotenv
+from openai import AsyncOpenAI, OpenAI
+
+from aiohttp_transport import AioHttpTransport
+
+load_dotenv(override=True)
+
+# The sync client speaks HTTP/2, so the per-year thread pools multiplex their
+# requests over one kept-alive connection instead of a handshake per call.
+# SDK retries are off: the pipeline's helpers retry with their own backoff, and
+# the two layers would otherwise multiply.
+client = OpenAI(
+    api_key=os.getenv("OPENAI_API_KEY"),
+    max_retries=0,
+    http_client=httpx.Client(
+        http2=True,
+        timeout=httpx.Timeout(120.0, connect=5.0),
+        limits=httpx.Limits(max_keepalive_connections=64, max_connections=128),
+    ),
+)
+atexit.register(client.close)
+
+# Async traffic goes through aiohttp (see aiohttp_transport); callers running
+# their own event loop should `await transport.aclose()` before it closes
+transport = AioHttpTransport(limit=200, keepalive_timeout=30.0)
+# The httpx client under aclient, for hot paths that post raw requests and skip
+# the SDK's per-chunk response models (see extraction._acall_llm)
+async_http = httpx.AsyncClient(transport=transport, timeout=httpx.Timeout(120.0, connect=5.0))
+aclient = AsyncOpenAI(
+    api_key=os.getenv("OPENAI_API_KEY"),
+    max_retries=0,
+    http_client=async_http,
+    timeout=120.0,
+)
@@ -8,6 +8,7 @@ and future outlook.
 from cProfile import label
 import json
 import os
+import sys
 from textwrap import dedent
 from datetime import datetime
 from typing import Dict, List, Optional, Any
@@ -47,7 +48,12 @@ class MissionVision:
     core_values: str = "N/A"
 
 
-@dataclass
+# FinancialData is instantiated for every statement line and metric; where the
+# interpreter supports it, store its fields in slots instead of a per-instance dict
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_SLOTS)
 class FinancialData:
     """Base class for financial data with multi-year values"""
     year_2024: Any = "N/A"
@@ -1,10 +1,27 @@
 import re
 import json
+import logging
+from dataclasses import dataclass
 from pathlib import Path
+from utils.pdf_hash import pdf_key
 
-def check_existing_files(pdf_path):
-    """Check if markdown and related files already exist for a PDF"""
-    base_name = Path(pdf_path).stem
+# Handled by the "findr" queue handler (src/log.py) when run from main.py
+logger = logging.getLogger("findr.check_files")
+
+@dataclass
+class YearArtifacts:
+    """Where one report's parsed artifacts live and which of them already exist"""
+    key: str
+    md_path: Path
+    jsonl_path: Path
+    emb_path: Path
+    md_exists: bool
+    jsonl_exists: bool
+    emb_exists: bool
+
+def check_existing_files(pdf_path) -> YearArtifacts:
+    """Check if markdown and related files already exist for a PDF, keyed by its content hash"""
+    base_name = pdf_key(pdf_path)
     
     # Check for markdown file
     md_file = Path("data/parsed") / f"{base_name}.md"
@@ -15,28 +32,30 @@ def check_existing_files(pdf_path):
     # Check for embeddings
     embeddings_file = Path("data/embeddings") / f"{base_name}.faiss"
     
-    return {
-        'markdown': md_file.exists(),
-        'jsonl': jsonl_file.exists(),
-        'embeddings': embeddings_file.exists(),
-        'md_path': md_file,
-        'jsonl_path': jsonl_file,
-        'embeddings_path': embeddings_file
-    }
+    return YearArtifacts(
+        key=base_name,
+        md_path=md_file,
+        jsonl_path=jsonl_file,
+        emb_path=embeddings_file,
+        md_exists=md_file.exists(),
+        jsonl_exists=jsonl_file.exists(),
+        emb_exists=embeddings_file.exists(),
+    )
+
+# Year tokens in report filenames, e.g. "nvidia_2024_annual_report"
+_YEAR_RE = re.compile(r'20\d{2}')
+
+def _latest_year(pdf_path):
+    return max((int(m.group()) for m in _YEAR_RE.finditer(Path(pdf_path).stem)), default=None)
 
 def determine_report_years(pdf1_path, pdf2_path):
-    """Determine which PDF is 2023 and which is 2024 based on filename or content"""
-    pdf1_name = Path(pdf1_path).stem.lower()
-    pdf2_name = Path(pdf2_path).stem.lower()
+    """Determine which PDF is the more recent report and which is the prior year based on the years in their filenames"""
+    year1 = _latest_year(pdf1_path)
+    year2 = _latest_year(pdf2_path)
     
-    if "2024" in pdf1_name and "2023" in pdf2_name:
-        return pdf1_path, pdf2_path 
-    elif "2023" in pdf1_name and "2024" in pdf2_name:
-        return pdf2_path, pdf1_path  
-    elif "2024" in pdf1_name:
-        return pdf1_path, pdf2_path 
-    elif "2024" in pdf2_name:
-        return pdf2_path, pdf1_path  
+    if year1 and year2 and year1 != year2:
+        return (pdf1_path, pdf2_path) if year1 > year2 else (pdf2_path, pdf1_path)
     else:
-        print("Make sure 2024 pdf first and 2023 pdf second in arguments.")
-        return pdf1_path, pdf2_path
\ No newline at end of file
+        # Without two distinct years the argument order is the only signal
+        logger.warning("Make sure the newer year's pdf is first and the prior year's pdf second in arguments.")
+        return pdf1_path, pdf2_path
@@ -1,3 +1,4 @@
+import os
 import re
 from pathlib import Path
 from typing import List
@@ -65,10 +66,16 @@ def normalize_headings_to_h2(md_text: str) -> str:
 
     return "".join(normalized)
 
+def write_text_atomic(path: Path, text: str) -> None:
+    # Write beside the target and swap it in, so a killed run never leaves a half-written file
+    tmp = path.with_suffix(path.suffix + '.tmp')
+    tmp.write_text(text, encoding='utf-8')
+    os.replace(tmp, path)
+
 def normalize_file(path: Path) -> None:
     original = path.read_text(encoding="utf-8")
     updated = normalize_headings_to_h2(original)
-    path.write_text(updated, encoding="utf-8")
+    write_text_atomic(path, updated)
 
 def normalize_folder(folder: Path) -> None:
     for md_path in folder.glob("*.md"):
@@ -95,10 +102,15 @@ def clean_file(path: Path) -> None:
     original = path.read_text(encoding='utf-8')
     cleaned = clean_markdown(original)
     if cleaned != original:
-        path.write_text(cleaned, encoding='utf-8')
+        write_text_atomic(path, cleaned)
 
 def clean_folder(folder: Path) -> None:
     for md in folder.glob('*.md'):
         clean_file(md)
 
-
+def normalize_and_clean_file(path: Path) -> None:
+    # Same result as normalize_file then clean_file, with one read and at most one write
+    original = path.read_text(encoding='utf-8')
+    updated = clean_markdown(normalize_headings_to_h2(original))
+    if updated != original:
+        write_text_atomic(path, updated)
@@ -0,0 +1,49 @@
+import os
+import json
+import hashlib
+from pathlib import Path
+
+# path -> (mtime_ns, size, digest), so unchanged files are hashed once per process
+_digests = {}
+
+def file_digest(path: str) -> str:
+    """sha256 of a file's bytes, or "" if the file does not exist."""
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return ""
+    memo = _digests.get(path)
+    if memo is not None and memo[:2] == (st.st_mtime_ns, st.st_size):
+        return memo[2]
+
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            h.update(block)
+    digest = h.hexdigest()
+    _digests[path] = (st.st_mtime_ns, st.st_size, digest)
+    return digest
+
+def pdf_key(pdf_path) -> str:
+    """Content key for a PDF: the first 16 hex chars of its SHA-256 (file_digest, memoised per mtime and size)"""
+    digest = file_digest(str(pdf_path))
+    if not digest:
+        raise FileNotFoundError(pdf_path)
+    return digest[:16]
+
+def write_meta(key: str, pdf_path, parsed_dir: Path = Path("data/parsed")) -> Path:
+    """Record the human-readable name of the PDF behind a content key"""
+    meta_file = parsed_dir / f"{key}.meta.json"
+    meta_file.parent.mkdir(parents=True, exist_ok=True)
+    meta = {"original_stem": Path(pdf_path).stem, "mtime": os.path.getmtime(pdf_path)}
+    meta_file.write_text(json.dumps(meta), encoding="utf-8")
+    return meta_file
+
+def original_stem(md_path) -> str:
+    """Original PDF stem for a parsed markdown file, falling back to its own stem"""
+    md_path = Path(md_path)
+    meta_file = md_path.with_name(f"{md_path.stem}.meta.json")
+    try:
+        return json.loads(meta_file.read_text(encoding="utf-8"))["original_stem"]
+    except (OSError, ValueError, KeyError):
+        return md_path.stem